@@ -9,9 +9,12 @@ from passlib.context import CryptContext
 
 from .config import get_settings
 from .db import get_db
+from . import metrics
 
 logger = logging.getLogger("auth")
 
+AUTH_FAILURES = metrics.Counter("collab_auth_failures_total", "인증 실패 수", ("reason",))
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # auto_error=False: Authorization 헤더 없을 때 403 대신 None 반환 → get_current_user에서 401 처리
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -70,6 +73,7 @@ def get_current_user(
     """JWT 토큰 검증 → 현재 사용자 반환. 모든 보호된 엔드포인트에서 사용."""
     if not credentials:
         print("[AUTH-FAIL] no credentials (Authorization header missing)", flush=True)
+        AUTH_FAILURES.inc(reason="missing_credentials")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증이 필요합니다. 다시 로그인해주세요.",
@@ -84,6 +88,7 @@ def get_current_user(
         username: str = payload["username"]
     except (JWTError, KeyError, ValueError) as e:
         print(f"[AUTH-FAIL] JWT decode error: {e} token={token_preview}", flush=True)
+        AUTH_FAILURES.inc(reason="invalid_token")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증 토큰이 유효하지 않습니다.",
@@ -99,9 +104,36 @@ def get_current_user(
         cursor.close()
     if not db_user or not _db_bool(db_user["is_active"]) or _db_bool(db_user["is_deleted"]):
         print(f"[AUTH-FAIL] DB check failed user_id={user_id} db_user={db_user}", flush=True)
+        AUTH_FAILURES.inc(reason="inactive_user")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="계정이 비활성화되었습니다. 관리자에게 문의하세요.",
             headers={"WWW-Authenticate": "Bearer"},
         )
     return {"id": user_id, "username": username}
+
+
+def token_user_id(token: str) -> Optional[int]:
+    """액세스 토큰의 사용자 ID (서명만 확인, DB 조회 없음 — 미들웨어용)"""
+    try:
+        payload = jwt.decode(token, get_settings().jwt_secret, algorithms=["HS256"])
+        return int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+
+def is_admin_token(token: str) -> bool:
+    """액세스 토큰이 활성 관리자 계정의 것인지 (의존성 주입 밖의 미들웨어용)"""
+    try:
+        payload = jwt.decode(token, get_settings().jwt_secret, algorithms=["HS256"])
+        user_id = int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return False
+    with get_db() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(
+            "SELECT role, is_active, COALESCE(is_deleted, 0) AS is_deleted FROM users WHERE id = %s", (user_id,)
+        )
+        user = cursor.fetchone()
+        cursor.close()
+    return bool(user) and user["role"] == "admin" and _db_bool(user["is_active"]) and not _db_bool(user["is_deleted"])
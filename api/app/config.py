@@ -15,6 +15,22 @@ class Settings:
     db_use_ssl: bool
     jwt_secret: str
     jwt_expire_hours: int
+    metrics_token: str = ""
+    profile_sample_rate: float = 0.0
+    profile_interval_ms: float = 5.0
+    profile_buffer_size: int = 50
+    slow_query_ms: int = 200
+    slow_query_explain: bool = True
+    schema_check: str = "verify"
+    db_replica_hosts: tuple = ()
+    db_replica_max_lag_seconds: float = 5.0
+    db_replica_check_seconds: float = 10.0
+    db_read_your_writes_seconds: float = 10.0
+    notification_read_retention_days: int = 30
+    notification_retention_days: int = 180
+    notification_archive_retention_days: int = 730
+    retention_batch_size: int = 1000
+    progress_coalesce_ms: int = 1000
 
 
 def get_settings() -> Settings:
@@ -27,4 +43,27 @@ def get_settings() -> Settings:
         db_use_ssl=os.getenv("COLLAB_TODO_DB_USE_SSL", "false").lower() == "true",
         jwt_secret=os.environ["COLLAB_TODO_JWT_SECRET"],
         jwt_expire_hours=int(os.getenv("COLLAB_TODO_JWT_EXPIRE_HOURS", "720")),
+        # /metrics 스크레이프 토큰 (설정 시 Authorization: Bearer <토큰> 필요)
+        metrics_token=os.getenv("COLLAB_TODO_METRICS_TOKEN", ""),
+        # 요청 샘플링 프로파일러 (관리자 X-Profile 헤더 외에 이 비율로 무작위 선택)
+        profile_sample_rate=float(os.getenv("COLLAB_TODO_PROFILE_SAMPLE_RATE", "0")),
+        profile_interval_ms=float(os.getenv("COLLAB_TODO_PROFILE_INTERVAL_MS", "5")),
+        profile_buffer_size=int(os.getenv("COLLAB_TODO_PROFILE_BUFFER_SIZE", "50")),
+        # 느린 쿼리 로그 임계값(ms, 0이면 끔) / 쿼리 모양별 EXPLAIN 자동 수집
+        slow_query_ms=int(os.getenv("COLLAB_TODO_SLOW_QUERY_MS", "200")),
+        slow_query_explain=os.getenv("COLLAB_TODO_SLOW_QUERY_EXPLAIN", "true").lower() == "true",
+        # 부팅 시 필수 테이블 확인 (verify | skip) — 테이블은 migrations/*.sql 로 생성
+        schema_check=os.getenv("COLLAB_TODO_SCHEMA_CHECK", "verify"),
+        # 읽기 복제본 (쉼표 구분 host 또는 host:port, 계정·DB 이름은 primary와 같음). 비우면 모두 primary
+        db_replica_hosts=tuple(h.strip() for h in os.getenv("COLLAB_TODO_DB_REPLICA_HOSTS", "").split(",") if h.strip()),
+        db_replica_max_lag_seconds=float(os.getenv("COLLAB_TODO_DB_REPLICA_MAX_LAG_SECONDS", "5")),
+        db_replica_check_seconds=float(os.getenv("COLLAB_TODO_DB_REPLICA_CHECK_SECONDS", "10")),
+        db_read_your_writes_seconds=float(os.getenv("COLLAB_TODO_DB_READ_YOUR_WRITES_SECONDS", "10")),
+        # 알림 보존 정책 (python -m app.retention, 일수 0이면 그 단계를 건너뜀)
+        notification_read_retention_days=int(os.getenv("COLLAB_TODO_NOTIFICATION_READ_RETENTION_DAYS", "30")),
+        notification_retention_days=int(os.getenv("COLLAB_TODO_NOTIFICATION_RETENTION_DAYS", "180")),
+        notification_archive_retention_days=int(os.getenv("COLLAB_TODO_NOTIFICATION_ARCHIVE_RETENTION_DAYS", "730")),
+        retention_batch_size=int(os.getenv("COLLAB_TODO_RETENTION_BATCH_SIZE", "1000")),
+        # 진행률만 바꾸는 PATCH를 업무별 마지막 값으로 모았다가 이 주기(ms)로 한 번에 기록 (0이면 요청마다)
+        progress_coalesce_ms=int(os.getenv("COLLAB_TODO_PROGRESS_COALESCE_MS", "1000")),
     )
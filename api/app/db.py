@@ -1,24 +1,156 @@
+import time
 from contextlib import contextmanager
+from typing import Optional
 import mysql.connector
 from .config import get_settings
+from . import metrics, profiling, replicas, slow_queries
 
+DB_CONNECT_SECONDS = metrics.Histogram(
+    "collab_db_connect_duration_seconds", "MySQL 연결 수립 시간", buckets=metrics.QUERY_BUCKETS)
+DB_CONNECTIONS_OPEN = metrics.Gauge("collab_db_connections_open", "현재 열려 있는 MySQL 연결 수")
+DB_TRANSACTIONS = metrics.Counter("collab_db_transactions_total", "get_db() 트랜잭션 수", ("result",))
 
-@contextmanager
-def get_db():
+
+def _record(operation, params, seconds: float, many: bool = False) -> None:
+    statement = operation if isinstance(operation, str) else ""
+    metrics.record_query(seconds)
+    profiling.record_query(statement, seconds)
+    slow_queries.record(statement, params, seconds, many)
+
+
+class _InstrumentedCursor:
+    """execute/executemany 실행 시간을 metrics / profiling / slow_queries 로 전달하는 커서 래퍼"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            _record(operation, params, time.perf_counter() - start)
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            _record(operation, None, time.perf_counter() - start, many=True)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _InstrumentedConnection:
+    def __init__(self, conn, replica: bool = False):
+        self._conn = conn
+        self.replica = replica  # 읽기 복제본 연결이면 True (데이터가 staleness_bound 만큼 늦을 수 있음)
+
+    def cursor(self, *args, **kwargs):
+        return _InstrumentedCursor(self._conn.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def _connect(host: str, port: int, **kwargs):
     s = get_settings()
+    start = time.perf_counter()
     conn = mysql.connector.connect(
-        host=s.db_host,
-        port=s.db_port,
+        host=host,
+        port=port,
         user=s.db_user,
         password=s.db_password,
         database=s.db_name,
         autocommit=False,
+        **kwargs,
     )
+    DB_CONNECT_SECONDS.observe(time.perf_counter() - start)
+    return conn
+
+
+@contextmanager
+def get_db():
+    s = get_settings()
+    conn = _connect(s.db_host, s.db_port)
+    yield from _transaction(conn)
+
+
+def _transaction(conn, replica: bool = False):
+    DB_CONNECTIONS_OPEN.inc()
     try:
-        yield conn
+        yield _InstrumentedConnection(conn, replica)
         conn.commit()
+        DB_TRANSACTIONS.inc(result="commit")
     except Exception:
         conn.rollback()
+        DB_TRANSACTIONS.inc(result="rollback")
         raise
     finally:
         conn.close()
+        DB_CONNECTIONS_OPEN.dec()
+
+
+@contextmanager
+def get_read_db(user_id: Optional[int] = None):
+    """조회 전용 연결 — 쓸 수 있는 읽기 복제본이 있으면 복제본, 아니면 primary (get_db와 같은 사용법)"""
+    target = read_router.choose(user_id)
+    conn = None
+    if target is not None:
+        try:
+            # 복제본이 죽었으면 빨리 primary로 넘어가도록 연결 제한 시간을 짧게
+            conn = _connect(*target, connection_timeout=2)
+        except mysql.connector.Error as e:
+            read_router.mark_down(target, e)
+    replica = conn is not None
+    if conn is None:
+        s = get_settings()
+        conn = _connect(s.db_host, s.db_port)
+    yield from _transaction(conn, replica)
+
+
+def _replica_lag(target) -> Optional[float]:
+    """복제 지연(초). 복제가 멈췄으면 None, 복제 설정이 없는 서버면 0"""
+    conn = _connect(*target, connection_timeout=2)
+    try:
+        cursor = conn.cursor(dictionary=True)
+        for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):  # MySQL 8.0.22+ / 이전·MariaDB
+            try:
+                cursor.execute(statement)
+            except mysql.connector.Error:
+                continue
+            row = cursor.fetchone()
+            cursor.fetchall()
+            if row is None:
+                return 0.0
+            lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+            return None if lag is None else float(lag)
+        raise RuntimeError("복제 상태를 조회할 수 없습니다 (REPLICATION CLIENT 권한 확인)")
+    finally:
+        conn.close()
+
+
+def _explain(statement: str, params) -> list:
+    """느린 쿼리 실행 계획 (slow_queries가 별도 스레드·별도 연결에서 호출)"""
+    with get_db() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("EXPLAIN " + statement, params)
+        rows = cursor.fetchall()
+        cursor.close()
+    return rows
+
+
+_settings = get_settings()
+read_router = replicas.ReplicaRouter(
+    [(host, (host.partition(":")[0], int(host.partition(":")[2] or _settings.db_port)))
+     for host in _settings.db_replica_hosts],
+    _replica_lag,
+    max_lag=_settings.db_replica_max_lag_seconds,
+    check_interval=_settings.db_replica_check_seconds,
+    read_your_writes=_settings.db_read_your_writes_seconds,
+)
+slow_queries.configure(_settings.slow_query_ms, _explain if _settings.slow_query_explain else None)
@@ -1,15 +1,35 @@
 import os
+import secrets
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from .routers import auth, sync, tasks, users, notifications, categories, attachments, bug_reports
+from .routers import auth, sync, tasks, users, notifications, categories, attachments, bug_reports, diagnostics
+from . import metrics, profiling, progress, replicas, response_cache, schema_check
+from .auth import is_admin_token, token_user_id
+from .db import read_router
+from .responses import FastJSONResponse
+from .compression import CompressionMiddleware, compression_stats
+from .config import get_settings
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 필수 테이블을 한 번에 확인하고 없으면 즉시 실패 (테이블 생성은 migrations/*.sql)
+    if get_settings().schema_check != "skip":
+        schema_check.verify()
+    yield
+    progress.buffer.close()  # 모아 둔 진행률 기록
+
 
 app = FastAPI(
     title="Collab Todo API",
     description="collab-todo-desktop 백엔드 REST API",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -17,13 +37,16 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[replicas.RYW_HEADER],  # 자기 쓰기 읽기 표시를 클라이언트가 되돌려 보내도록
 )
 
 
 class NoCacheMiddleware(BaseHTTPMiddleware):
-    """API 응답 캐시 방지"""
+    """API 응답 캐시 방지 (ETag 재검증을 지원하는 참조 데이터 목록은 제외)"""
     async def dispatch(self, request: Request, call_next):
         response = await call_next(request)
+        if request.url.path in response_cache.REVALIDATE_PATHS and "etag" in response.headers:
+            return response
         if request.url.path.startswith("/api/"):
             response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
             response.headers["Pragma"] = "no-cache"
@@ -32,6 +55,45 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(NoCacheMiddleware)
 
+# 응답 압축 (첨부 파일·업데이트 파일은 제외). CORS·캐시 방지보다 바깥이고, 아래에서 추가하는
+# 프로파일링·쓰기 추적·지표 미들웨어가 다시 이것을 감싼다 (지표는 압축 포함 측정)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COLLAB_TODO_COMPRESSION_MIN_SIZE", "1024")),
+    exclude_paths=("/api/attachments", "/updates"),
+)
+
+# 요청 샘플링 프로파일러 (관리자 X-Profile 헤더 또는 COLLAB_TODO_PROFILE_SAMPLE_RATE)
+_settings = get_settings()
+app.add_middleware(
+    profiling.ProfilingMiddleware,
+    sample_rate=_settings.profile_sample_rate,
+    interval=_settings.profile_interval_ms / 1000,
+    buffer_size=_settings.profile_buffer_size,
+    authorize=is_admin_token,
+)
+
+# 읽기 복제본을 쓸 때 쓰기 요청이 성공한 사용자는 잠시 primary에서 조회 (read-your-writes)
+if read_router.enabled:
+    app.add_middleware(replicas.WriteTrackingMiddleware, router=read_router, identify=token_user_id)
+
+# 요청 지연·SQL 집계 (압축까지 포함해 측정하도록 가장 바깥에 둔다)
+app.add_middleware(metrics.MetricsMiddleware)
+
+
+def _response_bytes() -> dict:
+    values = {}
+    for s in compression_stats():
+        values[(s["method"], s["route"], "raw")] = s["bytes_in"]
+        values[(s["method"], s["route"], "sent")] = s["bytes_out"]
+    return values
+
+
+metrics.Counter(
+    "collab_http_response_bytes_total", "응답 본문 바이트 (raw: 압축 전, sent: 전송)",
+    ("method", "route", "stage"), collect=_response_bytes,
+)
+
 app.include_router(auth.router)
 app.include_router(sync.router)
 app.include_router(tasks.router)
@@ -40,6 +102,7 @@ app.include_router(notifications.router)
 app.include_router(categories.router)
 app.include_router(attachments.router)
 app.include_router(bug_reports.router)
+app.include_router(diagnostics.router)
 
 # 앱 자동 업데이트 파일 서빙 (/updates/latest.yml, /updates/*.exe)
 UPDATES_DIR = "/app/updates"
@@ -50,3 +113,12 @@ app.mount("/updates", StaticFiles(directory=UPDATES_DIR), name="updates")
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+    """Prometheus 스크레이프용 (nginx는 /api/ 만 프록시하므로 내부망에서만 접근)"""
+    token = get_settings().metrics_token
+    if token and not secrets.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+        return JSONResponse(status_code=401, content={"detail": "인증이 필요합니다."})
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
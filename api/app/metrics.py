@@ -0,0 +1,444 @@
+"""Prometheus 텍스트 형식 메트릭 (외부 의존성 없음)
+
+Counter / Gauge / Histogram 을 프로세스 메모리에 누적하고 render()로 노출 형식 문자열을 만든다.
+- MetricsMiddleware: 경로별 지연 시간 히스토그램, 처리 중 요청 수, 요청당 SQL 건수·시간
+- record_query(): DB 계층(SQLAlchemy 이벤트 / 커서 래퍼)이 쿼리마다 호출
+- collect= 콜백: 커넥션 풀 상태, 프로세스 상주 메모리(RSS)처럼 조회 시점에 읽는 값
+경로 라벨은 실제 URL이 아닌 라우트 템플릿(/api/tasks/{task_id})을 사용해 라벨 수를 제한한다.
+멀티 프로세스: COLLAB_TODO_METRICS_DIR(run_server.py·api Dockerfile이 설정)가 있으면 워커마다
+EXPORT_INTERVAL초마다 자기 값을 그 디렉터리에 쓰고, 어느 워커가 /metrics를 받든 전체 워커를 합쳐
+노출한다 — 카운터·히스토그램은 합산(종료한 워커 몫 포함, 재시작으로 줄지 않음), 게이지는 pid 라벨로
+살아 있는 워커별. 노출 값은 다른 워커 기준 최대 EXPORT_INTERVAL초 늦다.
+"""
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (종료한 워커 파일을 합치지 않고 그대로 둔다)
+    fcntl = None
+
+logger = logging.getLogger("metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_registry: list = []
+_lock = threading.Lock()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        collect: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._collect = collect
+        self._values: dict = {}
+        with _lock:
+            _registry.append(self)
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def snapshot(self) -> dict:
+        """라벨 값 튜플 → 값 (collect 콜백이면 지금 읽은 값)"""
+        if self._collect is not None:
+            try:
+                return {tuple(str(v) for v in key): value for key, value in self._collect().items()}
+            except Exception:
+                return {}
+        with _lock:
+            return dict(self._values)
+
+    def _samples(self, items: dict, labelnames: Tuple[str, ...]):
+        for key, value in items.items():
+            yield "", zip(labelnames, key), value
+
+    def render(self, items: Optional[dict] = None, labelnames: Optional[Tuple[str, ...]] = None) -> str:
+        """items·labelnames를 주면 그 값(여러 워커를 합친 값)으로, 없으면 이 프로세스 값으로"""
+        items = self.snapshot() if items is None else items
+        labelnames = self.labelnames if labelnames is None else labelnames
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, pairs, value in self._samples(items, labelnames):
+            lines.append(f"{self.name}{suffix}{_format_labels(list(pairs))} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        with _lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with _lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def snapshot(self) -> dict:
+        with _lock:
+            return {key: (list(s[0]), s[1], s[2]) for key, s in self._values.items()}
+
+    def _samples(self, items: dict, labelnames: Tuple[str, ...]):
+        for key, (counts, total, count) in items.items():
+            pairs = list(zip(labelnames, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                yield "_bucket", pairs + [("le", _format_value(bound))], cumulative
+            yield "_bucket", pairs + [("le", "+Inf")], count
+            yield "_sum", pairs, total
+            yield "_count", pairs, count
+
+
+def render() -> str:
+    """등록된 모든 메트릭을 Prometheus 노출 형식으로 (공유 디렉터리가 있으면 전체 워커 합산)"""
+    with _lock:
+        metrics = list(_registry)
+    if _shared is not None:
+        return _shared.render(metrics)
+    return "\n".join(m.render() for m in metrics) + "\n"
+
+
+# ── 워커 간 공유 (멀티 프로세스) ──────────────────────────────
+
+SHARED_DIR_ENV = "COLLAB_TODO_METRICS_DIR"
+EXPORT_INTERVAL = 1.0
+
+
+def _shared_labelnames(metric: _Metric) -> Tuple[str, ...]:
+    """합친 노출의 라벨 — 게이지는 워커끼리 더하면 의미가 없으므로 pid로 구분"""
+    if metric.kind == "gauge" and "pid" not in metric.labelnames:
+        return metric.labelnames + ("pid",)
+    return metric.labelnames
+
+
+def _snapshot_all() -> dict:
+    """이 프로세스의 전체 값 — {이름: {"kind", "samples": [[라벨 값 목록, 값], ...]}}"""
+    with _lock:
+        metrics = list(_registry)
+    return {
+        m.name: {"kind": m.kind, "samples": [[list(key), value] for key, value in m.snapshot().items()]}
+        for m in metrics
+    }
+
+
+def _merge(totals: dict, data: dict, pid: Optional[int] = None) -> None:
+    """워커 하나(또는 종료한 워커 합계)의 값을 totals({이름: {"kind", "items"}})에 더한다.
+    카운터·히스토그램은 합산, 게이지는 살아 있는 워커(pid)만 pid 라벨을 붙여 따로 둔다."""
+    for name, metric in data.items():
+        kind = metric["kind"]
+        if kind == "gauge" and pid is None:
+            continue
+        items = totals.setdefault(name, {"kind": kind, "items": {}})["items"]
+        for key, value in metric["samples"]:
+            key = tuple(key)
+            if kind == "gauge":
+                items[(key, str(pid))] = value
+            elif kind == "histogram":
+                old = items.get(key)
+                items[key] = value if old is None else (
+                    [a + b for a, b in zip(old[0], value[0])], old[1] + value[1], old[2] + value[2])
+            else:
+                items[key] = items.get(key, 0.0) + value
+
+
+def _gauge_items(metric: _Metric, items: dict) -> dict:
+    # 이미 pid 라벨이 있는 게이지(RSS)는 그대로, 나머지는 pid를 덧붙인다
+    if "pid" in metric.labelnames:
+        return {key: value for (key, _), value in items.items()}
+    return {key + (pid,): value for (key, pid), value in items.items()}
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # 권한 없음 = 살아 있는 다른 사용자의 프로세스
+    return True
+
+
+def _read(path: str) -> Optional[dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path: str, data: dict) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+class _FileLock:
+    """같은 서버의 워커끼리 fcntl.flock (fcntl이 없으면 잠그지 않음)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._fd is not None:
+            os.close(self._fd)  # 닫으면 flock도 풀린다
+            self._fd = None
+
+
+class _SharedStore:
+    """워커마다 worker-<pid>.json에 자기 값을 쓰고, 노출할 때 모든 파일을 합친다.
+    종료한 워커의 카운터·히스토그램은 dead.json에 합치고 파일을 지운다 (잠금 아래에서)."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.pid = os.getpid()
+        self.path = os.path.join(directory, f"worker-{self.pid}.json")
+        self.dead_path = os.path.join(directory, "dead.json")
+        os.makedirs(directory, exist_ok=True)
+        with self._locked():
+            # 같은 pid를 쓰던 종료한 워커의 파일이 남아 있으면 덮어쓰기 전에 합쳐 둔다
+            old = _read(self.path)
+            if old is not None:
+                self._retire(old, self.path)
+        threading.Thread(target=self._run, name="metrics-export", daemon=True).start()
+        atexit.register(self.export)
+
+    def _locked(self) -> _FileLock:
+        return _FileLock(os.path.join(self.directory, ".lock"))
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(EXPORT_INTERVAL)
+            try:
+                self.export()
+            except Exception:
+                logger.exception("메트릭 공유 파일 쓰기 실패: %s", self.path)
+
+    def export(self) -> None:
+        _write(self.path, _snapshot_all())
+
+    def _retire(self, data: dict, path: str) -> None:
+        """종료한 워커의 카운터·히스토그램을 dead.json에 합친다 (잠금을 쥔 채 호출)"""
+        if fcntl is None:
+            return  # 잠글 수 없으면 두 워커가 같은 파일을 두 번 합칠 수 있으므로 그대로 둔다
+        totals: dict = {}
+        _merge(totals, _read(self.dead_path) or {})
+        _merge(totals, data)
+        _write(self.dead_path, {
+            name: {"kind": t["kind"], "samples": [[list(key), value] for key, value in t["items"].items()]}
+            for name, t in totals.items()
+        })
+        os.remove(path)
+
+    def render(self, metrics: list) -> str:
+        totals: dict = {}
+        with self._locked():
+            _merge(totals, _snapshot_all(), self.pid)
+            _merge(totals, _read(self.dead_path) or {})
+            for name in os.listdir(self.directory):
+                if not (name.startswith("worker-") and name.endswith(".json")):
+                    continue
+                pid = int(name[len("worker-"):-len(".json")])
+                path = os.path.join(self.directory, name)
+                data = None if pid == self.pid else _read(path)
+                if data is None:
+                    continue
+                if _alive(pid):
+                    _merge(totals, data, pid)
+                else:
+                    _merge(totals, data)
+                    self._retire(data, path)
+        parts = []
+        for m in metrics:
+            items = totals.get(m.name, {}).get("items", {})
+            if m.kind == "gauge":
+                items = _gauge_items(m, items)
+            parts.append(m.render(items, _shared_labelnames(m)))
+        return "\n".join(parts) + "\n"
+
+
+_shared: Optional[_SharedStore] = None
+
+
+# ── 요청 단위 집계 ────────────────────────────────────────────
+
+class RequestStats:
+    """요청 하나 동안 실행된 SQL 건수·시간 (contextvar로 DB 계층과 공유)"""
+    __slots__ = ("queries", "query_seconds", "scope")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.scope = scope
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("collab_request_stats", default=None)
+
+
+def current_request() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def current_route() -> str:
+    """현재 요청의 'METHOD 라우트 템플릿' (요청 밖이면 (background))"""
+    stats = _current.get()
+    if stats is None or stats.scope is None:
+        return "(background)"
+    route = getattr(stats.scope.get("route"), "path", None) or stats.scope["path"]
+    return f"{stats.scope['method']} {route}"
+
+
+HTTP_REQUESTS = Counter(
+    "collab_http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status"))
+HTTP_LATENCY = Histogram(
+    "collab_http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge(
+    "collab_http_requests_in_flight", "현재 처리 중인 HTTP 요청 수")
+REQUEST_QUERIES = Histogram(
+    "collab_http_request_db_queries", "요청당 실행한 SQL 건수", ("method", "route"), buckets=COUNT_BUCKETS)
+REQUEST_QUERY_SECONDS = Histogram(
+    "collab_http_request_db_seconds", "요청당 SQL 실행 시간 합계", ("method", "route"))
+DB_QUERIES = Counter(
+    "collab_db_queries_total", "실행한 SQL 문 수")
+DB_QUERY_SECONDS = Histogram(
+    "collab_db_query_duration_seconds", "SQL 문 1건 실행 시간", buckets=QUERY_BUCKETS)
+
+
+def rss_bytes() -> int:
+    """현재 프로세스의 상주 메모리(RSS) 바이트 — /proc 이 없는 환경이면 0"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+# 워커별 메모리 — pid 라벨로 구분해 워커 수를 늘릴 여유를 판단한다
+PROCESS_RSS = Gauge(
+    "collab_process_resident_memory_bytes", "프로세스 상주 메모리(RSS)", ("pid",),
+    collect=lambda: {(str(os.getpid()),): rss_bytes()},
+)
+
+
+def record_query(seconds: float) -> None:
+    DB_QUERIES.inc()
+    DB_QUERY_SECONDS.observe(seconds)
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += seconds
+
+
+class MetricsMiddleware:
+    def __init__(self, app, exclude_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_FLIGHT.dec()
+            _current.reset(token)
+            method = scope["method"]
+            route = getattr(scope.get("route"), "path", None) or "(unmatched)"
+            HTTP_REQUESTS.inc(method=method, route=route, status=status[0])
+            HTTP_LATENCY.observe(elapsed, method=method, route=route)
+            REQUEST_QUERIES.observe(stats.queries, method=method, route=route)
+            REQUEST_QUERY_SECONDS.observe(stats.query_seconds, method=method, route=route)
+
+
+if os.environ.get(SHARED_DIR_ENV):
+    _shared = _SharedStore(os.environ[SHARED_DIR_ENV])
@@ -0,0 +1,274 @@
+"""요청 단위 샘플링 프로파일러 (선택한 요청만, 운영에서 사용 가능)
+
+- 관리자가 X-Profile: 1 헤더를 보내거나 PROFILE_SAMPLE_RATE 확률로 뽑힌 요청만 프로파일한다.
+  그 외 요청의 비용은 contextvar 조회 한 번뿐이다.
+- 프로파일 중에는 별도 스레드가 interval마다 sys._current_frames()로 요청을 처리하는 스레드의
+  호출 스택을 채집한다. 대상은 이벤트 루프 스레드(대기 중인 샘플 제외)와, 이 요청의 SQL을
+  실행한 스레드(동기 엔드포인트가 도는 스레드풀 워커)다. 루프 스레드는 동시 요청과 공유하므로
+  그 샘플은 근사치다.
+- DB 계층이 record_query()로 넘긴 SQL을 모양(normalize)별 건수·시간으로 함께 기록한다.
+- 최근 N개를 링 버퍼에 보관하고 관리자 API가 요약과 collapsed stack
+  (flamegraph.pl / speedscope 입력 형식)으로 제공한다.
+"""
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from .sql_shape import normalize
+
+PROFILE_HEADER = "x-profile"
+MAX_SAMPLES = 20000  # 요청 하나당 상한 (5ms 간격이면 100초)
+
+_ids = itertools.count(1)
+_profiles: deque = deque(maxlen=50)
+_profiles_lock = threading.Lock()
+_current: ContextVar[Optional["Profile"]] = ContextVar("collab_profile", default=None)
+# 스레드 ident → 그 스레드에서 마지막으로 SQL을 실행한 프로파일 대상 요청
+_thread_owner: dict = {}
+
+_IDLE_FILES = ("selectors.py", "base_events.py", "runners.py")
+_WAIT_FILES = ("threading.py", "queue.py")
+_SITE_MARKERS = ("site-packages" + os.sep, "dist-packages" + os.sep)
+_labels: dict = {}
+
+
+def _frame_label(code) -> str:
+    label = _labels.get(code)
+    if label is None:
+        path = code.co_filename
+        for marker in _SITE_MARKERS:
+            if marker in path:
+                path = path.split(marker, 1)[1]
+                break
+        else:
+            path = os.path.basename(path)
+        label = _labels[code] = f"{code.co_name} ({path}:{code.co_firstlineno})"
+    return label
+
+
+def _worker_idle(frame) -> bool:
+    """스레드풀 워커가 다음 작업을 기다리는 중인지 (anyio 워커 루프의 queue.get 대기)"""
+    while frame is not None and os.path.basename(frame.f_code.co_filename) in _WAIT_FILES:
+        frame = frame.f_back
+    return frame is not None and frame.f_code.co_name == "run" and "anyio" in frame.f_code.co_filename
+
+
+def _stack(frame) -> tuple:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+class Profile:
+    def __init__(self, method: str, path: str, reason: str, loop_thread: int):
+        self.id = next(_ids)
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.reason = reason
+        self.started_at = datetime.now()
+        self.duration = 0.0
+        self.loop_thread = loop_thread
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self.queries: dict = {}  # 모양 → [건수, 합계 초, 최대 초]
+        self._lock = threading.Lock()
+
+    def add_query(self, statement: str, seconds: float) -> None:
+        _thread_owner[threading.get_ident()] = self
+        shape = normalize(statement)
+        with self._lock:
+            self.query_count += 1
+            self.query_seconds += seconds
+            stat = self.queries.get(shape)
+            if stat is None:
+                stat = self.queries[shape] = [0, 0.0, 0.0]
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+
+    def sample(self, own_ident: int) -> None:
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            if ident == self.loop_thread:
+                if os.path.basename(frame.f_code.co_filename) in _IDLE_FILES:
+                    continue  # 루프가 이벤트를 기다리는 중
+                root = "event-loop"
+            elif _thread_owner.get(ident) is self:
+                if _worker_idle(frame):
+                    continue
+                root = "worker"
+            else:
+                continue
+            stack = _stack(frame)
+            with self._lock:
+                self.stacks[(root,) + stack] += 1
+        self.samples += 1
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "route": self.route or self.path,
+            "path": self.path,
+            "status": self.status,
+            "reason": self.reason,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_ms": round(self.duration * 1000, 2),
+            "samples": self.samples,
+            "sql_queries": self.query_count,
+            "sql_ms": round(self.query_seconds * 1000, 2),
+        }
+
+    def detail(self, top: int = 30) -> dict:
+        with self._lock:
+            stacks = self.stacks.most_common(top)
+            queries = sorted(self.queries.items(), key=lambda kv: kv[1][1], reverse=True)[:top]
+            leaves = Counter()
+            for stack, n in self.stacks.items():
+                leaves[stack[-1]] += n
+        total = sum(n for _, n in stacks) or 1
+        return {
+            **self.summary(),
+            "top_functions": [{"frame": frame, "samples": n} for frame, n in leaves.most_common(top)],
+            "top_stacks": [
+                {"stack": list(stack), "samples": n, "ratio": round(n / total, 3)} for stack, n in stacks
+            ],
+            "sql": [
+                {"shape": shape, "count": c, "total_ms": round(s * 1000, 2), "max_ms": round(m * 1000, 2)}
+                for shape, (c, s, m) in queries
+            ],
+        }
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope 가 읽는 'a;b;c 개수' 형식"""
+        with self._lock:
+            items = list(self.stacks.items())
+        return "".join(f"{';'.join(stack)} {n}\n" for stack, n in items)
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, profile: Profile, interval: float):
+        super().__init__(name=f"profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        own = threading.get_ident()
+        while not self.stopped.wait(self.interval) and self.profile.samples < MAX_SAMPLES:
+            self.profile.sample(own)
+
+
+def record_query(statement: str, seconds: float) -> None:
+    """DB 계층에서 쿼리마다 호출 — 프로파일 중인 요청일 때만 기록"""
+    profile = _current.get()
+    if profile is not None:
+        profile.add_query(statement, seconds)
+    elif _thread_owner:
+        _thread_owner.pop(threading.get_ident(), None)
+
+
+def profiles() -> list:
+    """보관 중인 프로파일 요약 (최신 순)"""
+    with _profiles_lock:
+        return [p.summary() for p in reversed(_profiles)]
+
+
+def get_profile(profile_id: int) -> Optional[Profile]:
+    with _profiles_lock:
+        return next((p for p in _profiles if p.id == profile_id), None)
+
+
+def clear() -> None:
+    with _profiles_lock:
+        _profiles.clear()
+
+
+def _bearer_token(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token if scheme.lower() == "bearer" else ""
+    return ""
+
+
+class ProfilingMiddleware:
+    def __init__(
+        self,
+        app,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        buffer_size: int = 50,
+        authorize: Optional[Callable[[str], bool]] = None,
+    ):
+        global _profiles
+        self.app = app
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.authorize = authorize
+        with _profiles_lock:
+            _profiles = deque(_profiles, maxlen=buffer_size)
+
+    async def _reason(self, scope) -> Optional[str]:
+        requested = any(name == PROFILE_HEADER.encode() and value not in (b"", b"0")
+                        for name, value in scope.get("headers", ()))
+        if requested and self.authorize is not None:
+            token = _bearer_token(scope)
+            if token and await run_in_threadpool(self.authorize, token):
+                return "header"
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sampled"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        reason = await self._reason(scope)
+        if reason is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(scope["method"], scope["path"], reason, threading.get_ident())
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                if reason == "header":
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-profile-id", str(profile.id).encode())]
+            await send(message)
+
+        sampler = _Sampler(profile, self.interval)
+        token = _current.set(profile)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stopped.set()
+            profile.duration = time.perf_counter() - start
+            _current.reset(token)
+            profile.route = getattr(scope.get("route"), "path", None)
+            for ident, owner in list(_thread_owner.items()):
+                if owner is profile:
+                    _thread_owner.pop(ident, None)
+            with _profiles_lock:
+                _profiles.append(profile)
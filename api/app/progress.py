@@ -0,0 +1,40 @@
+"""진행률만 바꾸는 PATCH의 쓰기 합치기 (api 서버)
+
+진행률 슬라이더는 움직일 때마다 PATCH를 보내 쓰기 요청 대부분을 차지한다. 진행률만 바꾸는
+요청은 업무별 마지막 값을 COLLAB_TODO_PROGRESS_COALESCE_MS 동안 모았다가 UPDATE 한 번(CASE)으로
+기록한다. tasks.updated_at은 그때 갱신되므로 증분 동기화(/api/sync)는 기록 후 변경을 받는다.
+목록·상세·동기화 응답은 overlay()로 기록 전 값을 바로 보여 준다 (같은 워커 기준).
+버퍼는 워커마다 있으므로 값마다 요청 시각을 같이 들고, tasks.progress_at(지금 값을 정한 요청의
+시각)보다 나중 요청일 때만 기록한다 — 다른 워커가 먼저 기록한 더 새 값이나 진행률을 함께 바꾼
+직접 수정을 늦게 기록되는 옛 값이 덮어쓰지 않는다 (migrations/0004_tasks_progress_at.sql).
+COLLAB_TODO_PROGRESS_COALESCE_MS=0이면 끄고 요청마다 바로 기록한다.
+"""
+from .config import get_settings
+from .db import get_db
+from .write_buffer import WriteBuffer
+
+
+def _flush(items: dict) -> None:
+    """items: 업무 ID → (진행률, (마지막으로 바꾼 사용자 ID, 그 요청 시각))"""
+    task_ids = list(items)
+    cases = " ".join(["WHEN %s THEN %s"] * len(task_ids))
+    progress_params = [v for task_id in task_ids for v in (task_id, items[task_id][0])]
+    requested_params = [v for task_id in task_ids for v in (task_id, items[task_id][1][1])]
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # WHERE는 SET보다 먼저 평가되므로 기존 progress_at과 비교한다
+        cursor.execute(
+            f"UPDATE tasks SET progress = CASE id {cases} END, progress_at = CASE id {cases} END "
+            f"WHERE id IN ({', '.join(['%s'] * len(task_ids))}) "
+            f"AND (progress_at IS NULL OR progress_at < CASE id {cases} END)",
+            progress_params + requested_params + task_ids + requested_params,
+        )
+        cursor.close()
+
+
+buffer = WriteBuffer("task_progress", get_settings().progress_coalesce_ms / 1000, _flush)
+
+
+def overlay(task_id: int, progress):
+    """기록 전 진행률이 있으면 그 값 (조회 응답용)"""
+    return buffer.get(task_id, progress)
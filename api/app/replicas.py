@@ -0,0 +1,250 @@
+"""읽기 복제본(read replica) 라우팅
+
+COLLAB_TODO_DB_REPLICA_HOSTS를 설정하면 조회 전용 핸들러(동기화·업무 목록·대시보드·알림·내보내기)의
+연결을 복제본으로 보내 primary는 쓰기와 쓰기 직후 조회만 처리한다. 설정하지 않으면 항상 primary.
+- 지연 허용치: check_interval마다 복제 지연을 확인하고 max_lag를 넘거나 복제가 멈춘 복제본은 뺀다.
+  따라서 복제본에서 읽은 데이터는 최대 max_lag + check_interval 초 늦을 수 있다 (staleness_bound).
+- 자기 쓰기 읽기(read-your-writes): 쓰기 요청이 성공한 사용자는 read_your_writes초 동안
+  primary에서 읽는다. 워커 메모리의 표시만으로는 다른 워커로 간 조회를 알 수 없으므로
+  쓰기 응답에 만료 시각(epoch)을 쿠키(collab_rw_until)와 헤더(X-Read-Your-Writes-Until)로
+  내려 주고, 클라이언트가 되돌려 보낸 값이 아직 유효하면 어느 워커든 그 요청을 primary로 읽는다.
+- 장애: 연결·지연 확인에 실패한 복제본은 다음 확인 때까지 빼고, 남은 복제본이 없으면 primary.
+대상(target)은 엔진이든 (host, port)든 상관없고 지연 확인 방법은 probe로 받는다.
+"""
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Iterable, Optional
+
+from . import metrics
+
+logger = logging.getLogger("replicas")
+
+READ_ROUTING = metrics.Counter(
+    "collab_db_read_routing_total", "조회 연결 라우팅 결과", ("target", "reason"))
+
+_routers: list = []
+
+RYW_COOKIE = "collab_rw_until"
+RYW_HEADER = "X-Read-Your-Writes-Until"
+
+# 현재 요청이 클라이언트가 되돌려 보낸 쓰기 표시를 갖고 있는지 (WriteTrackingMiddleware가 설정)
+_client_wrote: ContextVar[bool] = ContextVar("replicas_client_wrote", default=False)
+
+
+def _replica_states() -> dict:
+    return {(r.name,): r.lag if r.healthy and r.lag is not None else -1
+            for router in _routers for r in router.replicas}
+
+
+metrics.Gauge(
+    "collab_db_replica_lag_seconds", "마지막으로 확인한 복제 지연 (제외된 복제본은 -1)", ("replica",),
+    collect=_replica_states,
+)
+
+
+class Replica:
+    __slots__ = ("name", "target", "healthy", "lag", "checked_at", "error", "_checking")
+
+    def __init__(self, name: str, target):
+        self.name = name
+        self.target = target
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.checked_at = float("-inf")
+        self.error = ""
+        self._checking = threading.Lock()
+
+    def status(self) -> dict:
+        return {"replica": self.name, "healthy": self.healthy, "lag_seconds": self.lag, "error": self.error}
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        replicas: Iterable[tuple],
+        probe: Callable[[object], Optional[float]],
+        max_lag: float = 5.0,
+        check_interval: float = 10.0,
+        read_your_writes: float = 10.0,
+    ):
+        self.replicas = [Replica(name, target) for name, target in replicas]
+        self.probe = probe
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.read_your_writes = read_your_writes
+        self._writes: dict = {}  # user_id → 이 시각(monotonic)까지 primary에서 읽기
+        self._writes_lock = threading.Lock()
+        self._next = itertools.count()
+        _routers.append(self)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def staleness_bound(self) -> float:
+        """복제본 조회 결과가 primary보다 늦을 수 있는 최대 시간(초)"""
+        return self.max_lag + self.check_interval
+
+    # ── 자기 쓰기 읽기 ─────────────────────────────────────
+
+    def mark_write(self, user_id) -> None:
+        if user_id is None or not self.enabled:
+            return
+        now = time.monotonic()
+        with self._writes_lock:
+            self._writes[user_id] = now + self.read_your_writes
+            if len(self._writes) > 10000:
+                self._writes = {k: v for k, v in self._writes.items() if v > now}
+
+    def recently_wrote(self, user_id) -> bool:
+        deadline = self._writes.get(user_id)
+        return deadline is not None and deadline > time.monotonic()
+
+    # ── 복제본 상태 ──────────────────────────────────────────
+
+    def _check(self, replica: Replica) -> None:
+        """확인 주기가 지났으면 지연을 다시 잰다 (한 번에 한 스레드만, 나머지는 직전 상태 사용)"""
+        if time.monotonic() - replica.checked_at < self.check_interval:
+            return
+        if not replica._checking.acquire(blocking=False):
+            return
+        try:
+            try:
+                lag = self.probe(replica.target)
+            except Exception as e:
+                self._set(replica, False, None, str(e)[:200])
+                return
+            if lag is None:
+                self._set(replica, False, None, "복제가 멈춤 (Seconds_Behind_Source = NULL)")
+            elif lag > self.max_lag:
+                self._set(replica, False, lag, f"지연 {lag:.1f}초 > 허용치 {self.max_lag:.1f}초")
+            else:
+                self._set(replica, True, lag, "")
+        finally:
+            replica.checked_at = time.monotonic()
+            replica._checking.release()
+
+    @staticmethod
+    def _set(replica: Replica, healthy: bool, lag: Optional[float], error: str) -> None:
+        if healthy != replica.healthy or (error and error != replica.error):
+            if healthy:
+                logger.info("복제본 %s 사용 (지연 %.1f초)", replica.name, lag)
+            else:
+                logger.warning("복제본 %s 제외: %s", replica.name, error)
+        replica.healthy = healthy
+        replica.lag = lag
+        replica.error = error
+
+    def mark_down(self, target, error) -> None:
+        """연결 실패 — 다음 확인 주기까지 제외"""
+        for replica in self.replicas:
+            if replica.target is target:
+                self._set(replica, False, None, f"연결 실패: {str(error)[:200]}")
+                replica.checked_at = time.monotonic()
+                READ_ROUTING.inc(target="primary", reason="replica_down")
+
+    def status(self) -> list:
+        return [r.status() for r in self.replicas]
+
+    # ── 선택 ─────────────────────────────────────────────────
+
+    def choose(self, user_id=None):
+        """조회에 쓸 복제본 대상 (primary를 써야 하면 None)"""
+        if not self.replicas:
+            return None
+        if _client_wrote.get() or self.recently_wrote(user_id):
+            READ_ROUTING.inc(target="primary", reason="recent_write")
+            return None
+        for replica in self.replicas:
+            self._check(replica)
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            READ_ROUTING.inc(target="primary", reason="no_replica")
+            return None
+        READ_ROUTING.inc(target="replica", reason="read_only")
+        return healthy[next(self._next) % len(healthy)].target
+
+
+class WriteTrackingMiddleware:
+    """쓰기 요청(GET/HEAD/OPTIONS 외)이 성공하면 그 사용자를 일정 시간 primary로 읽게 표시
+
+    워커 메모리에 표시하는 것과 함께 응답에 만료 시각을 실어 보내고, 조회 요청에 그 값이
+    돌아오면 요청 단위로 primary를 쓰게 한다 (워커가 여럿이어도 같은 클라이언트면 보장).
+    """
+
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, app, router: ReplicaRouter, identify: Callable[[str], Optional[int]]):
+        self.app = app
+        self.router = router
+        self.identify = identify
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] in self.SAFE_METHODS:
+            if not self._client_marked(scope):
+                await self.app(scope, receive, send)
+                return
+            marked = _client_wrote.set(True)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _client_wrote.reset(marked)
+            return
+
+        async def send_wrapper(message):
+            # 응답을 보내기 전에 표시해야 클라이언트의 바로 다음 조회가 primary로 간다
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                token = _bearer_token(scope)
+                if token:
+                    self.router.mark_write(self.identify(token))
+                until = int(time.time() + self.router.read_your_writes) + 1
+                max_age = int(self.router.read_your_writes) + 1
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (RYW_HEADER.lower().encode("latin-1"), str(until).encode("latin-1")),
+                    (b"set-cookie", (f"{RYW_COOKIE}={until}; Max-Age={max_age}; Path=/; "
+                                     "HttpOnly; SameSite=Lax").encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+    def _client_marked(self, scope) -> bool:
+        """되돌아온 만료 시각이 아직 지나지 않았는지 (허용 시간보다 먼 값은 무시)"""
+        until = _client_deadline(scope)
+        now = time.time()
+        return until is not None and now < until <= now + self.router.read_your_writes + 1
+
+
+def _client_deadline(scope) -> Optional[float]:
+    """X-Read-Your-Writes-Until 헤더나 collab_rw_until 쿠키의 만료 시각"""
+    header = RYW_HEADER.lower().encode("latin-1")
+    value = None
+    for name, raw in scope.get("headers", ()):
+        if name == header:
+            value = raw.decode("latin-1")
+            break
+        if name == b"cookie" and value is None:
+            for part in raw.decode("latin-1").split(";"):
+                key, _, v = part.strip().partition("=")
+                if key == RYW_COOKIE:
+                    value = v
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _bearer_token(scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            return token if scheme.lower() == "bearer" else ""
+    return ""
@@ -0,0 +1,116 @@
+"""참조 데이터 응답 캐시 — 데이터 버전별로 한 번만 직렬화하고 ETag/304로 재검증
+
+카테고리·부서·사용자 목록은 거의 바뀌지 않지만 화면마다 호출된다. 응답 본문을
+(네임스페이스 버전 조합) 단위로 미리 직렬화해 두고, 본문 해시를 강한 ETag로 내려준다.
+해당 테이블을 변경하는 엔드포인트는 커밋 후 bump()로 버전을 올린다.
+워커가 여럿이면 다른 워커의 변경도 알아야 하므로 bump()는 cache_versions 행도 올리고,
+각 워커는 VERSION_CHECK_SECONDS마다 그 테이블을 읽어 버전을 맞춘다.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .db import get_db
+
+logger = logging.getLogger("response_cache")
+
+# 다른 경로(직접 SQL, 다른 프로세스)로 바뀐 데이터도 이 시간 안에는 반영되도록 하는 상한
+MAX_AGE_SECONDS = 300
+# 다른 워커가 커밋한 변경을 확인하는 주기 (이 시간 안에 반영)
+VERSION_CHECK_SECONDS = 1.0
+
+# NoCacheMiddleware가 no-store 대신 재검증(no-cache)을 허용하는 경로
+REVALIDATE_PATHS = {
+    "/api/categories/",
+    "/api/users/",
+    "/api/users/departments/list",
+}
+
+_versions: Dict[str, int] = {}
+_entries: Dict[str, Tuple[tuple, float, bytes, str]] = {}  # key → (버전, 생성 시각, 본문, ETag)
+_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def bump(conn, *namespaces: str) -> None:
+    """데이터 변경 커밋 직후 호출 — 이 워커의 버전을 올리고 cache_versions에 기록해 다른 워커에 알린다"""
+    with _lock:
+        for ns in namespaces:
+            _versions[ns] = _versions.get(ns, 0) + 1
+    try:
+        cursor = conn.cursor()
+        for ns in sorted(namespaces):  # 잠금 순서 고정
+            cursor.execute(
+                "INSERT INTO cache_versions (namespace, version) VALUES (%s, 1) "
+                "ON DUPLICATE KEY UPDATE version = version + 1",
+                (ns,),
+            )
+        conn.commit()
+        cursor.close()
+    except Exception as e:
+        logger.warning("응답 캐시 버전 기록 실패 (다른 워커는 최대 %d초 늦게 반영): %s", MAX_AGE_SECONDS, e)
+
+
+def _refresh() -> None:
+    """cache_versions를 읽어 다른 워커의 변경을 반영 (VERSION_CHECK_SECONDS에 한 번)"""
+    global _checked_at
+    now = time.monotonic()
+    with _lock:
+        if now - _checked_at < VERSION_CHECK_SECONDS:
+            return
+        _checked_at = now
+    try:
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT namespace, version FROM cache_versions")
+            rows = cursor.fetchall()
+            cursor.close()
+    except Exception as e:
+        logger.warning("응답 캐시 버전 조회 실패 (이 워커의 변경만 반영): %s", e)
+        return
+    with _lock:
+        for namespace, version in rows:
+            # 조회 직후 이 워커가 올린 값을 되돌리지 않도록 큰 값을 유지
+            _versions[namespace] = max(_versions.get(namespace, 0), version)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def cached_json(
+    request: Request,
+    key: str,
+    namespaces: Tuple[str, ...],
+    build: Callable[[], object],
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """key에 대한 미리 직렬화된 JSON 응답. 버전이 바뀌었거나 만료됐을 때만 build() 호출."""
+    _refresh()
+    with _lock:
+        version = tuple(_versions.get(ns, 0) for ns in namespaces)
+        entry = _entries.get(key)
+    now = time.monotonic()
+    if entry is None or entry[0] != version or now - entry[1] > MAX_AGE_SECONDS:
+        body = json.dumps(
+            jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = (version, now, body, etag)
+        with _lock:
+            _entries[key] = entry
+
+    _, _, body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,183 @@
+"""알림 보존 정책 (api 서버) — 오래된 알림을 보관 테이블로 옮기고 보관 기간이 지나면 삭제
+
+api 서버에는 스케줄러가 없으므로 cron으로 실행한다:
+  cd api && python -m app.retention            # 실행하고 결과를 JSON으로 출력
+  cd api && python -m app.retention --dry-run  # 처리될 행 수만 출력
+기준일이 지난 행을 ID 순으로 batch_size건씩 notifications_archive로 복사·삭제하고 배치마다
+커밋한다 (배치 하나 동안만 잠금, 배치 사이 잠시 대기). 기준 일수는 COLLAB_TODO_NOTIFICATION_*
+환경변수이고, 같은 DB에 system_settings 테이블이 있으면 그 값(backend와 같은 키)이 우선한다.
+notifications_archive가 없으면 (migrations/0002 미적용) 아무것도 하지 않는다.
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+
+from .config import get_settings
+from .db import get_db
+from . import metrics, schema_check
+
+logger = logging.getLogger("retention")
+
+POLICY_KEYS = (
+    "notification_read_retention_days",
+    "notification_retention_days",
+    "notification_archive_retention_days",
+    "retention_batch_size",
+)
+BATCH_PAUSE = 0.05  # 배치 사이 대기(초)
+MAX_BATCHES = 10000
+
+RETENTION_ROWS = metrics.Counter(
+    "collab_retention_rows_total", "보존 정책으로 처리한 행 수", ("table", "action"))
+
+_COLUMNS = "id, recipient_id, task_id, notification_type, message, is_read, created_at"
+
+
+def load_policy() -> dict:
+    s = get_settings()
+    policy = {key: getattr(s, key) for key in POLICY_KEYS}
+    if schema_check.has_table("system_settings"):
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT `key`, value FROM system_settings WHERE `key` IN ({', '.join(['%s'] * len(POLICY_KEYS))})",
+                POLICY_KEYS,
+            )
+            for key, value in cursor.fetchall():
+                try:
+                    policy[key] = int(value)
+                except (TypeError, ValueError):
+                    logger.warning("system_settings.%s 값이 정수가 아님 (%r) — %s 사용", key, value, policy[key])
+            cursor.close()
+    policy = {key: max(value, 0) for key, value in policy.items()}
+    policy["retention_batch_size"] = policy["retention_batch_size"] or 1000
+    return policy
+
+
+def _archive_filter(policy: dict, now: datetime):
+    """(WHERE 절, 파라미터) — 보관할 조건이 없으면 (None, ())"""
+    conditions, params = [], []
+    if policy["notification_read_retention_days"]:
+        conditions.append("(is_read = 1 AND created_at < %s)")
+        params.append(now - timedelta(days=policy["notification_read_retention_days"]))
+    if policy["notification_retention_days"]:
+        conditions.append("created_at < %s")
+        params.append(now - timedelta(days=policy["notification_retention_days"]))
+    if not conditions:
+        return None, ()
+    return " OR ".join(conditions), tuple(params)
+
+
+def _batches(select_ids: str, params: tuple, apply, batch_size: int, pause: float) -> int:
+    """ID를 batch_size건씩 골라 apply(cursor, ids)를 배치마다 별도 트랜잭션으로 실행"""
+    done = 0
+    for _ in range(MAX_BATCHES):
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"{select_ids} ORDER BY id LIMIT %s", params + (batch_size,))
+            ids = [row[0] for row in cursor.fetchall()]
+            if ids:
+                apply(cursor, ids)
+            cursor.close()
+        done += len(ids)
+        if len(ids) < batch_size:
+            break
+        time.sleep(pause)
+    return done
+
+
+def _placeholders(ids) -> str:
+    return ", ".join(["%s"] * len(ids))
+
+
+def archive_notifications(policy: dict, now: datetime, pause: float = BATCH_PAUSE) -> int:
+    where, params = _archive_filter(policy, now)
+    if where is None:
+        return 0
+
+    def move(cursor, ids):
+        cursor.execute(
+            f"INSERT INTO notifications_archive ({_COLUMNS}) "
+            f"SELECT {_COLUMNS} FROM notifications WHERE id IN ({_placeholders(ids)})",
+            ids,
+        )
+        cursor.execute(f"DELETE FROM notifications WHERE id IN ({_placeholders(ids)})", ids)
+        RETENTION_ROWS.inc(len(ids), table="notifications", action="archived")
+
+    return _batches(f"SELECT id FROM notifications WHERE {where}", params, move,
+                    policy["retention_batch_size"], pause)
+
+
+def purge_archive(policy: dict, now: datetime, pause: float = BATCH_PAUSE) -> int:
+    days = policy["notification_archive_retention_days"]
+    if not days:
+        return 0
+
+    def purge(cursor, ids):
+        cursor.execute(f"DELETE FROM notifications_archive WHERE id IN ({_placeholders(ids)})", ids)
+        RETENTION_ROWS.inc(len(ids), table="notifications_archive", action="purged")
+
+    return _batches("SELECT id FROM notifications_archive WHERE created_at < %s", (now - timedelta(days=days),),
+                    purge, policy["retention_batch_size"], pause)
+
+
+def pending_counts(policy: dict, now: datetime) -> dict:
+    where, params = _archive_filter(policy, now)
+    days = policy["notification_archive_retention_days"]
+    with get_db() as conn:
+        cursor = conn.cursor()
+        counts = {}
+        for name, statement, args in (
+            ("notifications", "SELECT COUNT(*) FROM notifications", ()),
+            ("archive", "SELECT COUNT(*) FROM notifications_archive", ()),
+            ("to_archive", f"SELECT COUNT(*) FROM notifications WHERE {where}" if where else None, params),
+            ("to_purge", "SELECT COUNT(*) FROM notifications_archive WHERE created_at < %s" if days else None,
+             (now - timedelta(days=days),)),
+        ):
+            if statement is None:
+                counts[name] = 0
+                continue
+            cursor.execute(statement, args)
+            counts[name] = cursor.fetchone()[0]
+        cursor.close()
+    return counts
+
+
+def run(dry_run: bool = False, pause: float = BATCH_PAUSE) -> dict:
+    schema_check.verify()
+    if not schema_check.has_table("notifications_archive"):
+        return {"skipped": "notifications_archive 테이블이 없습니다. api/migrations/0002_notifications_archive.sql 을 적용하세요."}
+    started = time.perf_counter()
+    now = datetime.now()
+    policy = load_policy()
+    if dry_run:
+        return {"policy": policy, "rows": pending_counts(policy, now)}
+    archived = archive_notifications(policy, now, pause)
+    purged = purge_archive(policy, now, pause)
+    report = {
+        "finished_at": datetime.now().isoformat(timespec="seconds"),
+        "seconds": round(time.perf_counter() - started, 2),
+        "archived": archived,
+        "purged": purged,
+        "reclaimed": archived + purged,
+        "policy": policy,
+    }
+    logger.info("알림 보존 작업: 보관 %d건, 삭제 %d건 (%.1f초)", archived, purged, report["seconds"])
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="알림 보존 정책 실행 (cron용)")
+    parser.add_argument("--dry-run", action="store_true", help="처리될 행 수만 출력")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    report = run(dry_run=args.dry_run)
+    print(json.dumps(report, ensure_ascii=False, default=str))
+    return 1 if "skipped" in report else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 
 from ..auth import authenticate_user, create_access_token, hash_password, get_current_user, verify_password
 from ..db import get_db
+from .. import response_cache
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -98,6 +99,7 @@ def register(body: RegisterRequest):
             (username, body.name, body.email, password_hash, body.department_name),
         )
         conn.commit()
+        response_cache.bump(conn, "users")
         user_id = cursor.lastrowid
         cursor.close()
 
@@ -1,20 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from ..auth import get_current_user
 from ..db import get_db
+from .. import response_cache
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
 @router.get("/")
-def list_categories(current_user: dict = Depends(get_current_user)):
-    with get_db() as conn:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT id, name FROM categories ORDER BY name")
-        rows = cursor.fetchall()
-        cursor.close()
-    return rows
+def list_categories(request: Request, current_user: dict = Depends(get_current_user)):
+    def build():
+        with get_db() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SELECT id, name FROM categories ORDER BY name")
+            rows = cursor.fetchall()
+            cursor.close()
+        return rows
+    return response_cache.cached_json(request, "categories", ("categories",), build)
 
 
 @router.post("/", status_code=201)
@@ -26,6 +29,7 @@ def create_category(body: dict, current_user: dict = Depends(get_current_user)):
         cursor = conn.cursor(dictionary=True)
         cursor.execute("INSERT IGNORE INTO categories (name) VALUES (%s)", (name,))
         conn.commit()
+        response_cache.bump(conn, "categories")
         cursor.execute("SELECT id, name FROM categories WHERE name=%s", (name,))
         row = cursor.fetchone()
         cursor.close()
@@ -38,4 +42,5 @@ def delete_category(category_id: int, current_user: dict = Depends(get_current_u
         cursor = conn.cursor()
         cursor.execute("DELETE FROM categories WHERE id=%s", (category_id,))
         conn.commit()
+        response_cache.bump(conn, "categories")
         cursor.close()
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from ..auth import get_current_user
+from .. import profiling, slow_queries
+from .users import _require_admin
+
+router = APIRouter(prefix="/api/diagnostics", tags=["diagnostics"])
+
+
+def _admin(current_user: dict = Depends(get_current_user)) -> dict:
+    _require_admin(current_user)
+    return current_user
+
+
+def _find_profile(profile_id: int):
+    profile = profiling.get_profile(profile_id)
+    if not profile:
+        raise HTTPException(404, detail="프로파일을 찾을 수 없습니다. (다른 워커에서 기록되었거나 버퍼에서 밀려남)")
+    return profile
+
+
+# 최근 프로파일된 요청 목록 (이 워커 프로세스의 링 버퍼, 최신 순)
+@router.get("/profiles")
+def list_profiles(_: dict = Depends(_admin)):
+    return profiling.profiles()
+
+
+# 프로파일 상세: 샘플이 많은 함수·스택, SQL 모양별 건수·시간
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: int, top: int = Query(30, ge=1, le=500), _: dict = Depends(_admin)):
+    return _find_profile(profile_id).detail(top)
+
+
+# flamegraph.pl / speedscope 입력용 collapsed stack
+@router.get("/profiles/{profile_id}/collapsed", response_class=PlainTextResponse)
+def get_profile_collapsed(profile_id: int, _: dict = Depends(_admin)):
+    return PlainTextResponse(_find_profile(profile_id).collapsed())
+
+
+@router.delete("/profiles")
+def clear_profiles(_: dict = Depends(_admin)):
+    profiling.clear()
+    return {"ok": True}
+
+
+# 임계값을 넘은 최근 쿼리와 쿼리 모양별 집계·EXPLAIN 결과 (이 워커 프로세스 기준)
+@router.get("/slow-queries")
+def get_slow_queries(limit: int = Query(100, ge=1, le=500), _: dict = Depends(_admin)):
+    return slow_queries.snapshot(limit)
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries(_: dict = Depends(_admin)):
+    slow_queries.clear()
+    return {"ok": True}
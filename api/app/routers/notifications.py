@@ -3,7 +3,8 @@ from pydantic import BaseModel
 from typing import Optional
 
 from ..auth import get_current_user
-from ..db import get_db
+from ..db import get_db, get_read_db
+from ..responses import FastJSONResponse
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
@@ -11,7 +12,7 @@ router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 @router.get("/unread-count")
 def unread_count(current_user: dict = Depends(get_current_user)):
     uid = current_user["id"]
-    with get_db() as conn:
+    with get_read_db(current_user["id"]) as conn:
         cursor = conn.cursor(dictionary=True)
         cursor.execute("SELECT COUNT(*) AS cnt FROM notifications WHERE recipient_id=%s AND is_read=0", (uid,))
         count = cursor.fetchone()["cnt"]
@@ -27,7 +28,7 @@ def list_notifications(
 ):
     uid = current_user["id"]
     offset = (page - 1) * page_size
-    with get_db() as conn:
+    with get_read_db(current_user["id"]) as conn:
         cursor = conn.cursor(dictionary=True)
         cursor.execute("SELECT COUNT(*) AS cnt FROM notifications WHERE recipient_id=%s", (uid,))
         total = cursor.fetchone()["cnt"]
@@ -40,7 +41,7 @@ def list_notifications(
         """, (uid, page_size, offset))
         items = cursor.fetchall()
         cursor.close()
-    return {
+    return FastJSONResponse({
         "items": [
             {
                 "id": r["id"],
@@ -48,14 +49,14 @@ def list_notifications(
                 "notification_type": r["notification_type"],
                 "message": r["message"],
                 "is_read": bool(r["is_read"]),
-                "created_at": r["created_at"].isoformat(),
+                "created_at": r["created_at"],
             }
             for r in items
         ],
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
+    })
 
 
 @router.post("/{notification_id}/read")
@@ -1,13 +1,25 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ..auth import get_current_user
-from ..db import get_db
+from ..db import get_read_db, read_router
+from ..responses import FastJSONResponse
+from .. import progress
 
 router = APIRouter(prefix="/api", tags=["sync"])
 
+# fields= 로 선택 가능한 Task 컬럼 (TaskOut 필드와 동일, 이 목록만 SELECT에 쓰인다)
+SYNC_TASK_FIELDS = (
+    "id", "title", "description", "author_id", "current_assignee_id",
+    "status", "priority", "progress", "due_date", "created_at", "updated_at",
+)
+# 위젯·트레이 동기화용 — description(TEXT) 제외
+SYNC_FIELD_PRESETS = {
+    "summary": ("id", "title", "status", "priority", "progress", "due_date", "current_assignee_id", "updated_at"),
+}
+
 
 # ── 응답 스키마 ──────────────────────────────────────────────
 
@@ -40,11 +52,68 @@ class SyncResponse(BaseModel):
     notifications: List[NotificationOut]
 
 
+def _as_datetime(value):
+    # TaskOut.due_date(datetime)와 같은 형식 유지: DATE 값은 자정 datetime으로
+    if value is not None and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    """fields= 파라미터 해석. 생략하거나 "full"이면 전체 컬럼."""
+    if not fields or fields.strip() == "full":
+        return list(SYNC_TASK_FIELDS)
+    names = []
+    for f in (f.strip() for f in fields.split(",")):
+        if not f:
+            continue
+        if f in SYNC_FIELD_PRESETS:
+            names.extend(SYNC_FIELD_PRESETS[f])
+        elif f in SYNC_TASK_FIELDS:
+            names.append(f)
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 필드입니다: {f}")
+    return list(dict.fromkeys(["id"] + names))
+
+
+def _task_out(t: dict, fields: Optional[List[str]] = None) -> dict:
+    if fields is not None:
+        out = {f: _as_datetime(t[f]) if f == "due_date" else t[f] for f in fields}
+        if "progress" in out:
+            out["progress"] = progress.overlay(t["id"], out["progress"])
+        return out
+    return {
+        "id": t["id"],
+        "title": t["title"],
+        "description": t["description"],
+        "author_id": t["author_id"],
+        "current_assignee_id": t["current_assignee_id"],
+        "status": t["status"],
+        "priority": t["priority"],
+        "progress": progress.overlay(t["id"], t["progress"]),
+        "due_date": _as_datetime(t["due_date"]),
+        "created_at": t["created_at"],
+        "updated_at": t["updated_at"],
+    }
+
+
+def _notification_out(n: dict) -> dict:
+    return {
+        "id": n["id"],
+        "task_id": n["task_id"],
+        "notification_type": n["notification_type"],
+        "message": n["message"],
+        "is_read": bool(n["is_read"]),
+        "created_at": n["created_at"],
+    }
+
+
 # ── 엔드포인트 ───────────────────────────────────────────────
 
 @router.get("/sync", response_model=SyncResponse)
 def sync(
     last_synced_at: Optional[datetime] = Query(None),
+    fields: Optional[str] = Query(None, description="쉼표 구분 Task 컬럼 또는 프리셋(summary). 생략 시 전체"),
     current_user: dict = Depends(get_current_user),
 ):
     """
@@ -52,21 +121,26 @@ def sync(
     last_synced_at 이 있으면 그 이후 변경분만 반환 (증분 동기화).
     """
     user_id = current_user["id"]
+    task_fields = _parse_fields(fields)
+    full = len(task_fields) == len(SYNC_TASK_FIELDS)
+    task_columns = ", ".join(task_fields)
 
-    with get_db() as conn:
+    with get_read_db(user_id) as conn:
         cursor = conn.cursor(dictionary=True)
 
         # 서버 시간
         cursor.execute("SELECT UTC_TIMESTAMP() AS t")
         server_time: datetime = cursor.fetchone()["t"]
+        if conn.replica:
+            # 복제본은 primary보다 늦을 수 있으므로 다음 증분 동기화 기준을 그만큼 앞당긴다
+            # (겹치는 구간은 다시 내려받을 뿐 놓치지는 않는다)
+            server_time -= timedelta(seconds=read_router.staleness_bound())
 
         # Task 조회 (증분 동기화 지원)
         if last_synced_at:
             cursor.execute(
-                """
-                SELECT id, title, description, author_id,
-                       current_assignee_id, status, priority, progress,
-                       due_date, created_at, updated_at
+                f"""
+                SELECT {task_columns}
                   FROM tasks
                  WHERE current_assignee_id = %s
                    AND status <> 'approved'
@@ -82,10 +156,8 @@ def sync(
             )
         else:
             cursor.execute(
-                """
-                SELECT id, title, description, author_id,
-                       current_assignee_id, status, priority, progress,
-                       due_date, created_at, updated_at
+                f"""
+                SELECT {task_columns}
                   FROM tasks
                  WHERE current_assignee_id = %s
                    AND status <> 'approved'
@@ -113,8 +185,9 @@ def sync(
         notifications = cursor.fetchall()
         cursor.close()
 
-    return SyncResponse(
-        server_time=server_time.replace(tzinfo=timezone.utc),
-        tasks=[TaskOut(**t) for t in tasks],
-        notifications=[NotificationOut(**n) for n in notifications],
-    )
+    # Pydantic 모델을 행마다 만들지 않고 dict를 바로 직렬화 (형식은 SyncResponse와 동일)
+    return FastJSONResponse({
+        "server_time": server_time.replace(tzinfo=None).isoformat() + "Z",
+        "tasks": [_task_out(t, None if full else task_fields) for t in tasks],
+        "notifications": [_notification_out(n) for n in notifications],
+    })
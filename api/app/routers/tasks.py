@@ -1,9 +1,13 @@
+import time
+from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ..auth import get_current_user
-from ..db import get_db
+from ..db import get_db, get_read_db
+from ..responses import FastJSONResponse
+from .. import progress, schema_check
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
@@ -11,6 +15,42 @@ VALID_STATUSES = {"pending", "in_progress", "review", "approved", "rejected"}
 VALID_PRIORITIES = {"low", "normal", "high", "urgent"}
 VALID_SORT_FIELDS = {"created_at", "updated_at", "due_date", "title", "priority", "status"}
 
+# 목록 fields= 항목별로 필요한 SELECT 식 (빈 튜플은 DB 컬럼이 없는 고정값 항목)
+_FAVORITE_SQL = "EXISTS(SELECT 1 FROM task_favorites tf WHERE tf.task_id=t.id AND tf.user_id=%s) AS is_favorite"
+TASK_FIELD_SQL = {
+    "id": ("t.id",),
+    "title": ("t.title",),
+    "description": ("t.description",),
+    "content": ("t.description",),
+    "status": ("t.status",),
+    "priority": ("t.priority",),
+    "progress": ("t.progress",),
+    "due_date": ("t.due_date",),
+    "created_at": ("t.created_at",),
+    "updated_at": ("t.updated_at",),
+    "is_favorite": (_FAVORITE_SQL,),
+    "attachment_count": ("(SELECT COUNT(*) FROM task_attachments ta WHERE ta.task_id=t.id) AS attachment_count",),
+    "assigner": ("t.author_id", "a.display_name AS assigner_name"),
+    "assignee": ("t.current_assignee_id", "b.display_name AS assignee_name"),
+    "author_id": ("t.author_id",),
+    "current_assignee_id": ("t.current_assignee_id",),
+    "subtask_count": (),
+    "subtasks_done": (),
+    "tags": (),
+    "attachments": (),
+    "subtasks": (),
+    "estimated_hours": (),
+    "category": (),
+}
+# 대시보드 목록 기본 프리셋 — description(TEXT)은 읽지 않음
+TASK_FIELD_PRESETS = {
+    "summary": (
+        "id", "title", "status", "priority", "progress", "due_date",
+        "assigner", "assignee", "category", "tags", "is_favorite",
+        "attachment_count", "subtask_count", "subtasks_done",
+    ),
+}
+
 
 # ── 공통 헬퍼 ────────────────────────────────────────────────
 
@@ -32,17 +72,19 @@ def _get_task_row(cursor, task_id: int, user_id: int):
 
 
 def _format_task(row: dict) -> dict:
+    # 목록 fields= 요청은 고른 컬럼만 SELECT 하므로 id 외에는 없을 수 있다
     return {
         "id": row["id"],
-        "title": row["title"],
+        "title": row.get("title"),
         "description": row.get("description"),
         "content": row.get("description"),  # frontend alias
-        "status": row["status"],
+        "status": row.get("status"),
         "priority": row.get("priority", "normal"),
-        "progress": row.get("progress", 0),
+        "progress": progress.overlay(row["id"], row.get("progress", 0)),
         "due_date": row["due_date"].strftime("%Y-%m-%d") if row.get("due_date") else None,
-        "created_at": row["created_at"].isoformat() if row.get("created_at") else None,
-        "updated_at": row["updated_at"].isoformat() if row.get("updated_at") else None,
+        # datetime은 응답 클래스가 ISO 형식으로 직렬화
+        "created_at": row.get("created_at"),
+        "updated_at": row.get("updated_at"),
         "is_favorite": bool(row.get("is_favorite", 0)),
         "attachment_count": row.get("attachment_count", 0),
         "subtask_count": 0,
@@ -59,6 +101,35 @@ def _format_task(row: dict) -> dict:
     }
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields= 파라미터 해석. 생략하거나 "full"이면 None(전체 항목)."""
+    if not fields or fields.strip() == "full":
+        return None
+    names = []
+    for f in (f.strip() for f in fields.split(",")):
+        if not f:
+            continue
+        if f in TASK_FIELD_PRESETS:
+            names.extend(TASK_FIELD_PRESETS[f])
+        elif f in TASK_FIELD_SQL:
+            names.append(f)
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 필드입니다: {f}")
+    return list(dict.fromkeys(["id"] + names))
+
+
+def _select_for_fields(fields: Optional[List[str]]):
+    """(SELECT 식, JOIN 절, 즐겨찾기 uid 파라미터 필요 여부). fields가 None이면 전체 항목"""
+    names = fields if fields is not None else list(TASK_FIELD_SQL)
+    exprs = list(dict.fromkeys(e for f in names for e in TASK_FIELD_SQL[f]))
+    joins = []
+    if "a.display_name AS assigner_name" in exprs:
+        joins.append("LEFT JOIN users a ON a.id = t.author_id")
+    if "b.display_name AS assignee_name" in exprs:
+        joins.append("LEFT JOIN users b ON b.id = t.current_assignee_id")
+    return ", ".join(exprs), " ".join(joins), _FAVORITE_SQL in exprs
+
+
 # ── 요청 스키마 ────────────────────────────────────────────────
 
 class TaskCreate(BaseModel):
@@ -104,7 +175,7 @@ class ReassignRequest(BaseModel):
 @router.get("/dashboard")
 def get_dashboard(current_user: dict = Depends(get_current_user)):
     uid = current_user["id"]
-    with get_db() as conn:
+    with get_read_db(current_user["id"]) as conn:
         cursor = conn.cursor(dictionary=True)
         cursor.execute("""
             SELECT COUNT(*) AS total,
@@ -152,15 +223,17 @@ def list_tasks(
     sort_by: str = Query("created_at"),
     sort_dir: str = Query("desc"),
     favorites_only: bool = Query(False),
+    fields: Optional[str] = Query(None, description="쉼표 구분 항목 또는 프리셋(summary). 생략 시 전체"),
     current_user: dict = Depends(get_current_user),
 ):
     uid = current_user["id"]
+    selected_fields = _parse_fields(fields)
     if sort_by not in VALID_SORT_FIELDS:
         sort_by = "created_at"
     if sort_dir not in ("asc", "desc"):
         sort_dir = "desc"
 
-    with get_db() as conn:
+    with get_read_db(current_user["id"]) as conn:
         cursor = conn.cursor(dictionary=True)
         where = []
         params = []
@@ -192,30 +265,28 @@ def list_tasks(
         total = cursor.fetchone()["cnt"]
 
         offset = (page - 1) * page_size
+        select_sql, join_sql, needs_uid = _select_for_fields(selected_fields)
         cursor.execute(f"""
-            SELECT t.id, t.title, t.description, t.status, t.priority, t.progress,
-                   t.due_date, t.created_at, t.updated_at,
-                   t.author_id, t.current_assignee_id,
-                   a.display_name AS assigner_name,
-                   b.display_name AS assignee_name,
-                   (SELECT COUNT(*) FROM task_attachments ta WHERE ta.task_id=t.id) AS attachment_count,
-                   EXISTS(SELECT 1 FROM task_favorites tf WHERE tf.task_id=t.id AND tf.user_id=%s) AS is_favorite
+            SELECT {select_sql}
               FROM tasks t
-              LEFT JOIN users a ON a.id = t.author_id
-              LEFT JOIN users b ON b.id = t.current_assignee_id
+              {join_sql}
             {where_sql}
              ORDER BY t.{sort_by} {sort_dir}
              LIMIT %s OFFSET %s
-        """, [uid] + params + [page_size, offset])
+        """, ([uid] if needs_uid else []) + params + [page_size, offset])
         rows = cursor.fetchall()
         cursor.close()
 
-    return {
-        "items": [_format_task(r) for r in rows],
+    if selected_fields is None:
+        items = [_format_task(r) for r in rows]
+    else:
+        items = [{f: task[f] for f in selected_fields} for task in map(_format_task, rows)]
+    return FastJSONResponse({
+        "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
-    }
+    })
 
 
 @router.post("/", status_code=201)
@@ -260,7 +331,7 @@ def export_tasks(
 ):
     from fastapi.responses import Response
     uid = current_user["id"]
-    with get_db() as conn:
+    with get_read_db(current_user["id"]) as conn:
         cursor = conn.cursor(dictionary=True)
         where = []
         params = []
@@ -394,6 +465,21 @@ def patch_task(task_id: int, body: TaskPatch, current_user: dict = Depends(get_c
     if not updates:
         raise HTTPException(400, detail="변경할 내용이 없습니다.")
     uid = current_user["id"]
+    if "progress" in updates:
+        if len(updates) == 1 and progress.buffer.enabled:
+            # 슬라이더 드래그: 업무별 마지막 값만 모았다가 한 번에 기록 (app/progress.py)
+            with get_read_db(uid) as conn:
+                cursor = conn.cursor(dictionary=True)
+                row = _get_task_row(cursor, task_id, uid)
+                cursor.close()
+            if not row:
+                raise HTTPException(404, detail="업무를 찾을 수 없습니다.")
+            progress.buffer.put(task_id, updates["progress"], (uid, time.time()))
+            return _format_task(row)
+        # 이 요청이 직접 쓰므로 대기 중인 값이 나중에 덮어쓰지 않게 버린다 (쓰기 전에 호출).
+        # 다른 워커에 대기 중인 값은 progress_at보다 이른 요청이면 기록되지 않는다.
+        progress.buffer.discard(task_id)
+        updates["progress_at"] = time.time()
     with get_db() as conn:
         cursor = conn.cursor(dictionary=True)
         set_sql = ", ".join(f"{k}=%s" for k in updates)
@@ -466,65 +552,151 @@ def toggle_favorite(task_id: int, current_user: dict = Depends(get_current_user)
     return {"is_favorite": is_favorite}
 
 
+_HISTORY_ACTION_MAP = {
+    "status_change": "status_changed",
+    "status_changed": "status_changed",
+    "reassigned": "reassigned",
+    "created": "created",
+    "updated": "updated",
+}
+
+# task_history 테이블은 구버전 DB에 없을 수 있음 → 프로세스당 한 번만 확인
+_history_table_exists = None
+
+
+def _has_history_table(cursor) -> bool:
+    global _history_table_exists
+    if _history_table_exists is None:
+        _history_table_exists = schema_check.has_table("task_history")
+    if _history_table_exists is None:
+        cursor.execute("""
+            SELECT COUNT(*) AS cnt FROM information_schema.tables
+             WHERE table_schema = DATABASE() AND table_name = 'task_history'
+        """)
+        _history_table_exists = cursor.fetchone()["cnt"] > 0
+    return _history_table_exists
+
+
+def _keyset_condition(src: str, cursor_key: Optional[tuple]) -> tuple:
+    """분기(src 고정)별 keyset 조건. 정렬 키 (created_at, src, id) 내림차순 기준."""
+    if not cursor_key:
+        return "", []
+    created, cursor_src, row_id = cursor_key
+    if src < cursor_src:
+        return " AND created_at <= %s", [created]
+    if src > cursor_src:
+        return " AND created_at < %s", [created]
+    return " AND (created_at < %s OR (created_at = %s AND id < %s))", [created, created, row_id]
+
+
+def _activity_rows(cursor, task_id: int, limit: Optional[int] = None, cursor_key: Optional[tuple] = None) -> list:
+    """댓글(task_comments)과 이력(task_history)을 SQL에서 UNION ALL로 병합해 최신순으로 조회.
+
+    정렬 키는 (created_at, src, id) — src는 'c'(댓글)/'h'(이력).
+    keyset 조건과 LIMIT을 각 분기에 밀어 넣어 (task_id, created_at) 범위만 읽는다.
+    """
+    branch_limit = f" ORDER BY created_at DESC, id DESC LIMIT {int(limit)}" if limit else ""
+    params: list = []
+
+    cond, cond_params = _keyset_condition("c", cursor_key)
+    union_sql = f"""
+        SELECT * FROM (
+            SELECT 'c' AS src, id, author_id AS actor_id, 'comment' AS action_type,
+                   content AS note, NULL AS old_status, NULL AS new_status, created_at
+              FROM task_comments
+             WHERE task_id = %s{cond}{branch_limit}
+        ) c
+    """
+    params += [task_id] + cond_params
+    if _has_history_table(cursor):
+        cond, cond_params = _keyset_condition("h", cursor_key)
+        union_sql += f"""
+        UNION ALL
+        SELECT * FROM (
+            SELECT 'h' AS src, id, actor_id, action_type,
+                   note, old_status, new_status, created_at
+              FROM task_history
+             WHERE task_id = %s{cond}{branch_limit}
+        ) h
+        """
+        params += [task_id] + cond_params
+
+    sql = f"""
+        SELECT feed.src, feed.id, feed.action_type, feed.note, feed.old_status, feed.new_status,
+               feed.created_at, u.id AS actor_id, u.display_name AS actor_name
+          FROM ({union_sql}) feed
+          JOIN users u ON u.id = feed.actor_id
+         ORDER BY feed.created_at DESC, feed.src DESC, feed.id DESC
+    """
+    if limit:
+        sql += " LIMIT %s"
+        params.append(int(limit))
+    cursor.execute(sql, params)
+    return cursor.fetchall()
+
+
+def _format_activity(r: dict) -> dict:
+    is_comment = r["src"] == "c"
+    return {
+        "id": r["id"] if is_comment else f"h_{r['id']}",
+        "action": "comment" if is_comment else _HISTORY_ACTION_MAP.get(r["action_type"], r["action_type"]),
+        "comment": r.get("note"),
+        "created_at": r["created_at"].isoformat() if r.get("created_at") else None,
+        "user": {"id": r["actor_id"], "name": r["actor_name"]},
+        "old_value": r.get("old_status"),
+        "new_value": r.get("new_status"),
+    }
+
+
+def _encode_cursor(r: dict) -> str:
+    return f"{r['created_at'].strftime('%Y-%m-%dT%H:%M:%S.%f')}|{r['src']}|{r['id']}"
+
+
+def _decode_cursor(value: str) -> tuple:
+    try:
+        created, src, row_id = value.split("|")
+        if src not in ("c", "h"):
+            raise ValueError(src)
+        return datetime.strptime(created, "%Y-%m-%dT%H:%M:%S.%f"), src, int(row_id)
+    except ValueError:
+        raise HTTPException(400, detail="유효하지 않은 cursor입니다.")
+
+
 @router.get("/{task_id}/logs")
-def get_logs(task_id: int, current_user: dict = Depends(get_current_user)):
+def get_logs(
+    task_id: int,
+    latest: Optional[int] = Query(None, ge=1, le=500),
+    current_user: dict = Depends(get_current_user),
+):
+    """업무 댓글 + 이력 (시간순). latest=N이면 최신 N건만 반환 (상세 화면용)."""
     with get_db() as conn:
         cursor = conn.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT c.id, c.content, c.created_at,
-                   u.display_name AS author_name, u.id AS author_id
-              FROM task_comments c
-              JOIN users u ON u.id = c.author_id
-             WHERE c.task_id = %s
-             ORDER BY c.created_at ASC
-        """, (task_id,))
-        comments = cursor.fetchall()
-
-        history_rows = []
-        try:
-            cursor.execute("""
-                SELECT h.id, h.action_type, h.old_status, h.new_status, h.note, h.created_at,
-                       u.id AS actor_id, u.display_name AS actor_name
-                  FROM task_history h
-                  JOIN users u ON u.id = h.actor_id
-                 WHERE h.task_id = %s
-                 ORDER BY h.created_at ASC
-            """, (task_id,))
-            history_rows = cursor.fetchall()
-        except Exception:
-            pass
+        rows = _activity_rows(cursor, task_id, limit=latest)
         cursor.close()
+    rows.reverse()
+    return [_format_activity(r) for r in rows]
 
-    result = []
-    for r in comments:
-        result.append({
-            "id": r["id"],
-            "action": "comment",
-            "comment": r["content"],
-            "created_at": r["created_at"].isoformat() if r.get("created_at") else None,
-            "user": {"id": r["author_id"], "name": r["author_name"]},
-            "old_value": None,
-            "new_value": None,
-        })
-    for h in history_rows:
-        action_map = {
-            "status_change": "status_changed",
-            "status_changed": "status_changed",
-            "reassigned": "reassigned",
-            "created": "created",
-            "updated": "updated",
-        }
-        result.append({
-            "id": f"h_{h['id']}",
-            "action": action_map.get(h["action_type"], h["action_type"]),
-            "comment": h.get("note"),
-            "created_at": h["created_at"].isoformat() if h.get("created_at") else None,
-            "user": {"id": h["actor_id"], "name": h["actor_name"]},
-            "old_value": h.get("old_status"),
-            "new_value": h.get("new_status"),
-        })
-    result.sort(key=lambda x: x["created_at"] or "")
-    return result
+
+@router.get("/{task_id}/activity")
+def get_activity(
+    task_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    current_user: dict = Depends(get_current_user),
+):
+    """댓글 + 이력 통합 피드 (최신순, keyset pagination). 다음 페이지는 next_cursor로 조회."""
+    cursor_key = _decode_cursor(cursor) if cursor else None
+    with get_db() as conn:
+        cur = conn.cursor(dictionary=True)
+        rows = _activity_rows(cur, task_id, limit=limit + 1, cursor_key=cursor_key)
+        cur.close()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": [_format_activity(r) for r in rows],
+        "has_more": has_more,
+        "next_cursor": _encode_cursor(rows[-1]) if has_more and rows else None,
+    }
 
 
 @router.post("/{task_id}/comment")
@@ -1,9 +1,11 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from ..auth import get_current_user, hash_password, _db_bool
 from ..db import get_db
+from .. import response_cache
+from ..compression import compression_stats
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
@@ -59,24 +61,30 @@ class AdminUpdateUser(BaseModel):
 # ── 사용자 목록 ────────────────────────────────────────────────
 
 @router.get("/")
-def list_users(current_user: dict = Depends(get_current_user)):
-    with get_db() as conn:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT id, username, display_name, email, role, department FROM users WHERE is_active=1 AND COALESCE(is_deleted, 0)=0 ORDER BY display_name")
-        users = cursor.fetchall()
-        cursor.close()
-    return [{"id": u["id"], "username": u["username"], "name": u["display_name"],
-             "email": u["email"], "role": u["role"], "department": u["department"] or ""} for u in users]
+def list_users(request: Request, current_user: dict = Depends(get_current_user)):
+    def build():
+        with get_db() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SELECT id, username, display_name, email, role, department FROM users WHERE is_active=1 AND COALESCE(is_deleted, 0)=0 ORDER BY display_name")
+            users = cursor.fetchall()
+            cursor.close()
+        return [{"id": u["id"], "username": u["username"], "name": u["display_name"],
+                 "email": u["email"], "role": u["role"], "department": u["department"] or ""} for u in users]
+    return response_cache.cached_json(request, "users", ("users",), build)
 
 
 @router.get("/departments/list")
-def list_departments():
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM departments ORDER BY name")
-        rows = cursor.fetchall()
-        cursor.close()
-    return [r[0] for r in rows]
+def list_departments(request: Request):
+    def build():
+        with get_db() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM departments ORDER BY name")
+            rows = cursor.fetchall()
+            cursor.close()
+        return [r[0] for r in rows]
+    return response_cache.cached_json(
+        request, "departments", ("departments",), build, cache_control="public, no-cache"
+    )
 
 
 # ── 내 정보 ────────────────────────────────────────────────────
@@ -109,6 +117,7 @@ def update_me(body: ProfileUpdate, current_user: dict = Depends(get_current_user
         set_sql = ", ".join(f"{k}=%s" for k in updates)
         cursor.execute(f"UPDATE users SET {set_sql} WHERE id=%s", list(updates.values()) + [uid])
         conn.commit()
+        response_cache.bump(conn, "users")
         cursor.execute("SELECT id, display_name, email, role, department FROM users WHERE id=%s", (uid,))
         user = cursor.fetchone()
         cursor.close()
@@ -263,6 +272,7 @@ def admin_create_user(body: AdminCreateUser, current_user: dict = Depends(get_cu
              hash_password(body.password), body.department_name, role)
         )
         conn.commit()
+        response_cache.bump(conn, "users")
         user_id = cursor.lastrowid
         cursor.close()
     return {"ok": True, "id": user_id}
@@ -285,6 +295,7 @@ def admin_update_user(user_id: int, body: AdminUpdateUser, current_user: dict =
         set_sql = ", ".join(f"{k}=%s" for k in updates)
         cursor.execute(f"UPDATE users SET {set_sql} WHERE id=%s", list(updates.values()) + [user_id])
         conn.commit()
+        response_cache.bump(conn, "users")
         cursor.close()
     return {"ok": True}
 
@@ -323,6 +334,7 @@ def admin_delete_user(user_id: int, current_user: dict = Depends(get_current_use
             (user_id,)
         )
         conn.commit()
+        response_cache.bump(conn, "users")
         cursor.close()
     return {"ok": True}
 
@@ -374,6 +386,13 @@ def admin_stats(current_user: dict = Depends(get_current_user)):
     }
 
 
+# 응답 압축 통계 (관리자용)
+@router.get("/admin/compression-stats")
+def admin_compression_stats(current_user: dict = Depends(get_current_user)):
+    _require_admin(current_user)
+    return compression_stats()
+
+
 # 부서 목록 (관리자용)
 @router.get("/admin/departments")
 def admin_list_departments(current_user: dict = Depends(get_current_user)):
@@ -401,6 +420,7 @@ def admin_add_department(body: dict, current_user: dict = Depends(get_current_us
         cursor = conn.cursor()
         cursor.execute("INSERT IGNORE INTO departments (name) VALUES (%s)", (name,))
         conn.commit()
+        response_cache.bump(conn, "departments")
         cursor.close()
     return {"ok": True}
 
@@ -423,6 +443,7 @@ def admin_update_department(dept_id: int, body: dict, current_user: dict = Depen
         cursor.execute("UPDATE departments SET name=%s WHERE id=%s", (name, dept_id))
         cursor.execute("UPDATE users SET department=%s WHERE department=%s", (name, old_name))
         conn.commit()
+        response_cache.bump(conn, "departments", "users")
         cursor.close()
     return {"ok": True}
 
@@ -435,6 +456,7 @@ def admin_delete_department(dept_id: int, current_user: dict = Depends(get_curre
         cursor = conn.cursor()
         cursor.execute("DELETE FROM departments WHERE id=%s", (dept_id,))
         conn.commit()
+        response_cache.bump(conn, "departments")
         cursor.close()
     return {"ok": True}
 
@@ -0,0 +1,57 @@
+"""부팅 시 DB 스키마 확인 (api 서버)
+
+information_schema에서 테이블 목록(과 나중 마이그레이션이 추가한 컬럼)을 한 번씩 조회해
+필수 테이블·컬럼이 없으면 바로 실패한다.
+테이블 생성·변경은 요청 처리 중이 아니라 migrations/*.sql 로만 한다.
+선택 테이블(task_history)의 존재 여부도 이 조회 결과로 알려 준다.
+COLLAB_TODO_SCHEMA_CHECK=skip 이면 건너뛴다.
+"""
+from typing import Optional
+
+from .db import get_db
+
+REQUIRED_TABLES = frozenset({
+    "users", "departments", "tasks", "categories", "notifications", "notification_preferences",
+    "filter_presets", "task_attachments", "task_comments", "task_favorites", "bug_reports",
+    "cache_versions",
+})
+
+# 기존 테이블에 마이그레이션으로 추가한 컬럼 (테이블, 컬럼)
+REQUIRED_COLUMNS = frozenset({
+    ("tasks", "progress_at"),
+})
+
+_tables: Optional[frozenset] = None
+
+
+def verify() -> frozenset:
+    global _tables
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = DATABASE()")
+        tables = frozenset(row[0] for row in cursor.fetchall())
+        missing = sorted(REQUIRED_TABLES - tables)
+        if missing:
+            cursor.close()
+            raise RuntimeError(
+                f"DB에 필요한 테이블이 없습니다: {', '.join(missing)}. api/migrations/ 의 SQL을 적용하세요."
+            )
+        cursor.execute(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            f"WHERE table_schema = DATABASE() AND table_name IN ({', '.join(['%s'] * len(REQUIRED_COLUMNS))})",
+            sorted({table for table, _ in REQUIRED_COLUMNS}),
+        )
+        columns = frozenset((row[0], row[1]) for row in cursor.fetchall())
+        cursor.close()
+    missing = sorted(f"{table}.{column}" for table, column in REQUIRED_COLUMNS - columns)
+    if missing:
+        raise RuntimeError(
+            f"DB에 필요한 컬럼이 없습니다: {', '.join(missing)}. api/migrations/ 의 SQL을 적용하세요."
+        )
+    _tables = tables
+    return tables
+
+
+def has_table(name: str) -> Optional[bool]:
+    """부팅 시 확인한 테이블 존재 여부 (확인 전이면 None)"""
+    return None if _tables is None else name in _tables
@@ -0,0 +1,132 @@
+"""느린 쿼리 로그 + 쿼리 모양별 EXPLAIN 자동 수집
+
+DB 계층(SQLAlchemy 이벤트 / 커서 래퍼)이 쿼리마다 record()를 호출한다.
+- 임계값(SLOW_QUERY_MS) 이상이면 모양(normalize), 바인드 파라미터의 타입·길이(값은 남기지 않음),
+  실행 시간, 호출한 경로를 로그와 최근 목록에 남긴다.
+- 처음 보는 모양이면 EXPLAIN을 한 번만 별도 스레드·별도 연결에서 실행해 보관한다
+  (요청 지연과 무관하게. EXPLAIN은 문장을 실행하지 않지만 SELECT/UPDATE/DELETE만 대상).
+- 관리자 API가 snapshot()으로 최근 느린 쿼리와 모양별 집계·실행 계획을 조회한다.
+"""
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from . import metrics
+from .sql_shape import normalize
+
+logger = logging.getLogger("slow_query")
+
+MAX_SHAPES = 500
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+SLOW_QUERIES = metrics.Counter("collab_db_slow_queries_total", "임계값을 넘은 SQL 문 수")
+
+_threshold = 0.2
+_explain: Optional[Callable[[str, Any], list]] = None
+_recent: deque = deque(maxlen=200)
+_shapes: dict = {}
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure(
+    threshold_ms: float,
+    explain: Optional[Callable[[str, Any], list]] = None,
+    buffer_size: int = 200,
+) -> None:
+    """임계값(0 이하면 끔)과 EXPLAIN 실행 함수 설정 — DB 모듈이 import 시 호출"""
+    global _threshold, _explain, _recent
+    _threshold = threshold_ms / 1000
+    _explain = explain
+    with _lock:
+        _recent = deque(_recent, maxlen=buffer_size)
+
+
+def _value_shape(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, (str, bytes, list, tuple, set)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def param_shape(parameters):
+    """바인드 파라미터를 값 없이 타입·길이만으로 표현"""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {k: _value_shape(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(v) for v in parameters]
+    return _value_shape(parameters)
+
+
+def _run_explain(shape: str, statement: str, parameters) -> None:
+    try:
+        plan = _explain(statement, parameters)
+    except Exception as e:
+        plan = {"error": str(e)[:500]}
+    with _lock:
+        if shape in _shapes:
+            _shapes[shape]["explain"] = plan
+            _shapes[shape]["explained_at"] = datetime.now().isoformat(timespec="seconds")
+
+
+def record(statement: str, parameters, seconds: float, executemany: bool = False) -> None:
+    """쿼리 1건 실행 후 호출 — 임계값 미만이면 바로 반환"""
+    if _threshold <= 0 or seconds < _threshold:
+        return
+    global _executor
+    shape = normalize(statement)
+    route = metrics.current_route()
+    params = "executemany" if executemany else param_shape(parameters)
+    ms = round(seconds * 1000, 2)
+    SLOW_QUERIES.inc()
+    logger.warning("느린 쿼리 %.1fms [%s] %s params=%s", ms, route, shape[:500], params)
+
+    explain_now = False
+    with _lock:
+        _recent.append({
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "ms": ms, "route": route, "shape": shape, "params": params,
+        })
+        stat = _shapes.get(shape)
+        if stat is None and len(_shapes) < MAX_SHAPES:
+            stat = _shapes[shape] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "routes": {}, "explain": None}
+            explain_now = (
+                _explain is not None and not executemany
+                and shape.lstrip("( ").upper().startswith(_EXPLAINABLE)
+            )
+            if explain_now:
+                stat["explain"] = "pending"
+                if _executor is None:
+                    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        if stat is not None:
+            stat["count"] += 1
+            stat["total_ms"] += ms
+            stat["max_ms"] = max(stat["max_ms"], ms)
+            stat["routes"][route] = stat["routes"].get(route, 0) + 1
+            stat["last_params"] = params
+    if explain_now:
+        _executor.submit(_run_explain, shape, statement, parameters)
+
+
+def snapshot(limit: int = 100) -> dict:
+    with _lock:
+        recent = list(_recent)[-limit:][::-1]
+        shapes = sorted(
+            ({"shape": shape, **stat, "routes": dict(stat["routes"]), "total_ms": round(stat["total_ms"], 2)}
+             for shape, stat in _shapes.items()),
+            key=lambda s: s["total_ms"], reverse=True,
+        )[:limit]
+    return {"threshold_ms": round(_threshold * 1000, 2), "recent": recent, "shapes": shapes}
+
+
+def clear() -> None:
+    with _lock:
+        _recent.clear()
+        _shapes.clear()
+
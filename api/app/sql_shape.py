@@ -0,0 +1,22 @@
+"""SQL 문을 값과 무관한 "모양"으로 정규화 (프로파일러·느린 쿼리 로그의 집계 키)
+
+리터럴·바인드 파라미터·IN 목록을 ?로 치환하므로 값만 바꿔 반복한 쿼리는 같은 모양이 된다.
+backend/app/utils/query_budget.normalize 와 같은 규칙.
+"""
+import re
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(statement: str) -> str:
+    shape = _STRING.sub("?", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _SPACE.sub(" ", shape).strip()
+    shape = _IN_LIST.sub("(?)", shape)
+    return _VALUES_ROWS.sub(r"\1", shape)
@@ -0,0 +1,126 @@
+"""짧은 시간 동안의 쓰기를 키별 최신 값 하나로 합쳐 한꺼번에 기록하는 버퍼
+
+진행률 슬라이더처럼 같은 행에 값만 바꾸는 요청이 연달아 오면, 요청마다 UPDATE하지 않고
+키(업무 ID)별 마지막 값만 들고 있다가 처음 들어온 지 window초가 지나면 flush(items)로 한 번에 쓴다.
+- 조회는 get()으로 기록 전 값을 덮어써 바로 보여 준다 (기록 중인 값도 포함).
+- 같은 키를 직접 쓰는 요청은 discard()로 대기 값을 버려 나중에 덮어쓰지 않게 한다.
+- 기록에 실패하면 그 사이 새 값이 오지 않은 항목만 다시 넣어 다음 주기에 재시도한다.
+- 버퍼는 프로세스 메모리에 있으므로 다른 워커의 조회는 최대 window초 늦은 값을 본다.
+  종료 시 close()로 남은 값을 모두 기록한다.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from . import metrics
+
+logger = logging.getLogger("write_buffer")
+
+WRITE_BUFFER_EVENTS = metrics.Counter(
+    "collab_write_buffer_total", "쓰기 합치기 버퍼 이벤트 (buffered: 받은 요청, flushed: 기록한 키)",
+    ("buffer", "event"))
+
+_buffers: list = []
+
+metrics.Gauge(
+    "collab_write_buffer_pending", "기록을 기다리는 키 수", ("buffer",),
+    collect=lambda: {(b.name,): len(b._pending) for b in _buffers},
+)
+
+# key → (값, 부가 정보, 처음 들어온 monotonic 시각)
+_Entry = Tuple[object, object, float]
+
+
+class WriteBuffer:
+    def __init__(self, name: str, window: float, flush: Callable[[Dict[Hashable, tuple]], None],
+                 max_pending: int = 10000):
+        self.name = name
+        self.window = window
+        self.flush = flush
+        self.max_pending = max_pending
+        self._pending: Dict[Hashable, _Entry] = {}
+        self._flushing: Dict[Hashable, _Entry] = {}
+        self._dropped: set = set()  # 기록 중에 discard된 키 (실패해도 다시 넣지 않음)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        _buffers.append(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and not self._closed
+
+    def put(self, key, value, meta=None) -> None:
+        """최신 값으로 덮어쓴다 (처음 들어온 시각은 유지 — 계속 바뀌어도 window초 안에 기록)"""
+        with self._lock:
+            entry = self._pending.get(key)
+            self._pending[key] = (value, meta, entry[2] if entry else time.monotonic())
+            full = len(self._pending) >= self.max_pending
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"write-buffer-{self.name}", daemon=True)
+                self._thread.start()
+        WRITE_BUFFER_EVENTS.inc(buffer=self.name, event="buffered")
+        if full:
+            self._wake.set()
+
+    def get(self, key, default=None):
+        """기록 전(또는 기록 중) 값이 있으면 그 값, 없으면 default"""
+        entry = self._pending.get(key) or self._flushing.get(key)
+        return entry[0] if entry else default
+
+    def discard(self, key) -> None:
+        """대기 값을 버린다 — 기록 중이면 끝날 때까지 기다려 호출 측의 직접 쓰기가 나중이 되게 한다
+        (호출 측은 그 행을 쓰기 전에 호출할 것. 행 잠금을 쥔 채 기다리면 기록 스레드와 교착)"""
+        with self._lock:
+            self._pending.pop(key, None)
+            flushing = key in self._flushing
+            if flushing:
+                self._dropped.add(key)
+        if flushing:
+            with self._flush_lock:
+                pass
+
+    def flush_due(self, force: bool = False) -> int:
+        """window가 지난(force면 전부) 항목을 기록. 기록한 키 수 반환."""
+        with self._flush_lock:
+            now = time.monotonic()
+            with self._lock:
+                due = {k: e for k, e in self._pending.items() if force or now - e[2] >= self.window}
+                for key in due:
+                    del self._pending[key]
+                self._flushing = due
+                self._dropped = set()
+            if not due:
+                return 0
+            try:
+                self.flush({key: (value, meta) for key, (value, meta, _) in due.items()})
+            except Exception:
+                logger.exception("쓰기 버퍼 %s 기록 실패 (%d건) — 다음 주기에 재시도", self.name, len(due))
+                WRITE_BUFFER_EVENTS.inc(len(due), buffer=self.name, event="failed")
+                with self._lock:
+                    for key, entry in due.items():
+                        if key not in self._dropped:
+                            self._pending.setdefault(key, entry)
+                return 0
+            finally:
+                self._flushing = {}
+            WRITE_BUFFER_EVENTS.inc(len(due), buffer=self.name, event="flushed")
+            return len(due)
+
+    def _run(self) -> None:
+        interval = max(self.window / 4, 0.05)
+        while not self._closed:
+            self._wake.wait(interval)
+            force = self._wake.is_set()
+            self._wake.clear()
+            if self._pending:
+                self.flush_due(force=force)
+
+    def close(self) -> None:
+        """남은 값을 모두 기록하고 이후 put은 받지 않는다 (호출 측은 enabled를 확인)"""
+        self._closed = True
+        self._wake.set()
+        self.flush_due(force=True)
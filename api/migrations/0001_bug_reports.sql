@@ -0,0 +1,18 @@
+-- ============================================================
+-- api 서버: 오류 제보 테이블
+-- 적용: mysql -u <user> -p <db> < api/migrations/0001_bug_reports.sql
+-- (이전에는 첫 제보 때 서버가 CREATE TABLE IF NOT EXISTS로 만들었음 — 이미 있으면 그대로 둔다)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS bug_reports (
+    id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+    reporter_id BIGINT UNSIGNED NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    description TEXT NOT NULL,
+    page VARCHAR(100),
+    steps TEXT,
+    severity ENUM('low','normal','high','critical') DEFAULT 'normal',
+    status ENUM('open','in_review','resolved','closed') DEFAULT 'open',
+    admin_note TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
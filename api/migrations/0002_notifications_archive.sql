@@ -0,0 +1,20 @@
+-- ============================================================
+-- api 서버: 알림 보존 정책 — 보관 테이블과 조회·보존용 인덱스
+-- 적용: mysql -u <user> -p <db> < api/migrations/0002_notifications_archive.sql
+-- (CREATE INDEX는 이미 있으면 오류가 나므로 한 번만 적용한다)
+-- 보관·삭제는 `python -m app.retention` 을 cron으로 매일 실행 (docs/db_management.md 참고)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id BIGINT UNSIGNED NOT NULL PRIMARY KEY,
+    recipient_id BIGINT UNSIGNED NOT NULL,
+    task_id BIGINT UNSIGNED,
+    notification_type VARCHAR(50) NOT NULL,
+    message TEXT NOT NULL,
+    is_read TINYINT(1) NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_notifications_archive_recipient_created (recipient_id, created_at)
+) ROW_FORMAT=COMPRESSED;
+
+CREATE INDEX ix_notifications_recipient_read_created ON notifications (recipient_id, is_read, created_at);
+CREATE INDEX ix_notifications_created_at ON notifications (created_at);
@@ -0,0 +1,11 @@
+-- ============================================================
+-- api 서버: 참조 데이터 응답 캐시 버전 — 워커 간 캐시 무효화 공유
+-- 적용: mysql -u <user> -p <db> < api/migrations/0003_cache_versions.sql
+-- 카테고리·부서·사용자를 바꾼 워커가 버전을 올리면 다른 워커가 1초 안에 읽어 캐시를 다시 만든다
+-- ============================================================
+CREATE TABLE IF NOT EXISTS cache_versions (
+    namespace VARCHAR(50) NOT NULL PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT IGNORE INTO cache_versions (namespace, version) VALUES ('categories', 0), ('departments', 0), ('users', 0);
@@ -0,0 +1,7 @@
+-- ============================================================
+-- api 서버: 진행률을 정한 요청 시각 — 워커 간 진행률 쓰기 합치기 순서
+-- 적용: mysql -u <user> -p <db> < api/migrations/0004_tasks_progress_at.sql
+-- (ADD COLUMN은 이미 있으면 오류가 나므로 한 번만 적용한다)
+-- 워커마다 모아 둔 진행률은 이 값보다 나중 요청일 때만 기록되어 더 새 값을 덮어쓰지 않는다
+-- ============================================================
+ALTER TABLE tasks ADD COLUMN progress_at DOUBLE NULL;
@@ -282,6 +282,14 @@ if login_token and uid4:
         s, d = req("GET", "/api/tasks/?section=assigned_by_me&page=1&page_size=20", token=login_token)
         check("내가 요청한 업무 목록 조회", s == 200)
 
+        # fields= 로 일부 항목만 조회 (title·status 없이도 동작해야 함)
+        for fields in ("progress", "due_date,assignee", "summary", "is_favorite,attachment_count,tags"):
+            s, d = req("GET", f"/api/tasks/?section=assigned_by_me&fields={fields}", token=login_token)
+            items = d.get("items") or [{}]
+            expected = {"id"} | set(fields.split(",")) if fields != "summary" else None
+            check(f"업무 목록 fields={fields}", s == 200 and (expected is None or set(items[0]) == expected),
+                  f"status={s}, d={d}")
+
         # 담당자 입장에서 조회
         s, d = req("GET", "/api/tasks/?section=assigned_to_me&page=1&page_size=20", token=tok4)
         check("담당자가 받은 업무 목록 조회", s == 200)
@@ -15,6 +15,8 @@ from app.database import Base
 # 모든 모델이 Base.metadata에 등록되도록 임포트
 import app.models.user  # noqa: F401
 import app.models.task  # noqa: F401
+import app.models.job  # noqa: F401
+import app.models.rate_limit  # noqa: F401
 
 # Alembic Config object
 config = context.config
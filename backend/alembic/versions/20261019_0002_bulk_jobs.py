@@ -0,0 +1,44 @@
+"""관리자 일괄 작업 진행 상황 테이블: bulk_jobs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bulk_jobs",
+        sa.Column("id",           sa.Integer(),    nullable=False),
+        sa.Column("job_type",     sa.String(50),   nullable=False),
+        sa.Column("created_by",   sa.Integer(),    nullable=False),
+        sa.Column("params",       sa.Text(),       nullable=False),
+        sa.Column("status",       sa.String(20),   nullable=False, server_default="pending"),
+        sa.Column("total",        sa.Integer(),    server_default="0"),
+        sa.Column("processed",    sa.Integer(),    server_default="0"),
+        sa.Column("last_task_id", sa.Integer(),    server_default="0"),
+        sa.Column("error",        sa.Text()),
+        sa.Column("created_at",   sa.DateTime(),   server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("updated_at",   sa.DateTime(),   server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")),
+        sa.Column("finished_at",  sa.DateTime()),
+        sa.PrimaryKeyConstraint("id"),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+    )
+    op.create_index("ix_bulk_jobs_job_type", "bulk_jobs", ["job_type"])
+    op.create_index("ix_bulk_jobs_status",   "bulk_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bulk_jobs_status",   table_name="bulk_jobs")
+    op.drop_index("ix_bulk_jobs_job_type", table_name="bulk_jobs")
+    op.drop_table("bulk_jobs")
@@ -0,0 +1,37 @@
+"""일별 업무 통계 롤업 테이블: task_stats_daily
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_STATUS = sa.Enum("pending", "in_progress", "review", "approved", "rejected", name="statusenum")
+_PRIORITY = sa.Enum("urgent", "high", "normal", "low", name="priorityenum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_stats_daily",
+        sa.Column("stat_date",     sa.Date(),    nullable=False),
+        sa.Column("department_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("status",        _STATUS,      nullable=False),
+        sa.Column("priority",      _PRIORITY,    nullable=False),
+        sa.Column("task_count",    sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("overdue_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("refreshed_at",  sa.DateTime(), server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")),
+        sa.PrimaryKeyConstraint("stat_date", "department_id", "status", "priority"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_stats_daily")
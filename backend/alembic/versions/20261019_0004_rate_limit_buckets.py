@@ -0,0 +1,32 @@
+"""요청 제한 토큰 버킷 테이블: rate_limit_buckets
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("bucket_key", sa.String(191),           nullable=False),
+        sa.Column("tokens",     sa.Float(precision=53),   nullable=False),
+        sa.Column("updated_at", sa.Float(precision=53),   nullable=False),
+        sa.PrimaryKeyConstraint("bucket_key"),
+    )
+    op.create_index("ix_rate_limit_buckets_updated_at", "rate_limit_buckets", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_buckets_updated_at", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
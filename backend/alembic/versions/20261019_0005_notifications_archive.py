@@ -0,0 +1,59 @@
+"""알림 보존 정책: notifications_archive 테이블, 알림 조회·보존 인덱스
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SETTINGS = [
+    ("notification_read_retention_days", "30", "읽은 알림을 보관 테이블로 옮기기까지의 일수"),
+    ("notification_retention_days", "180", "읽지 않은 알림도 보관 테이블로 옮기기까지의 일수"),
+    ("notification_archive_retention_days", "730", "보관 테이블의 알림을 삭제하기까지의 일수 (0이면 삭제 안 함)"),
+    ("retention_batch_size", "1000", "보존 작업의 배치당 행 수 (잠금 시간 제한)"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notifications_archive",
+        sa.Column("id",          sa.Integer(),    nullable=False, autoincrement=False),
+        sa.Column("user_id",     sa.Integer(),    nullable=False),
+        sa.Column("task_id",     sa.Integer(),    nullable=True),
+        sa.Column("type",        sa.String(50),   nullable=False),
+        sa.Column("message",     sa.Text(),       nullable=False),
+        sa.Column("is_read",     sa.Boolean(),    nullable=False, server_default=sa.false()),
+        sa.Column("created_at",  sa.DateTime(),   nullable=True),
+        sa.Column("archived_at", sa.DateTime(),   server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+        mysql_row_format="COMPRESSED",
+    )
+    op.create_index("ix_notifications_archive_user_created", "notifications_archive", ["user_id", "created_at"])
+    op.create_index("ix_notifications_user_read_created", "notifications", ["user_id", "is_read", "created_at"])
+    op.create_index("ix_notifications_created_at", "notifications", ["created_at"])
+
+    settings = sa.table("system_settings", sa.column("key"), sa.column("value"), sa.column("description"))
+    conn = op.get_bind()
+    existing = {row[0] for row in conn.execute(sa.select(settings.c.key))}
+    op.bulk_insert(settings, [
+        {"key": key, "value": value, "description": description}
+        for key, value, description in _SETTINGS if key not in existing
+    ])
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DELETE FROM system_settings WHERE `key` IN :keys").bindparams(
+        sa.bindparam("keys", [key for key, _, _ in _SETTINGS], expanding=True)))
+    op.drop_index("ix_notifications_created_at", table_name="notifications")
+    op.drop_index("ix_notifications_user_read_created", table_name="notifications")
+    op.drop_index("ix_notifications_archive_user_created", table_name="notifications_archive")
+    op.drop_table("notifications_archive")
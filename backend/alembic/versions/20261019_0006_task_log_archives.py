@@ -0,0 +1,46 @@
+"""업무 이력 콜드 스토리지: task_log_archives 테이블
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SETTINGS = [
+    ("task_log_archive_months", "12", "승인 후 이 개월 수가 지난 업무의 이력을 월별 압축 파일로 옮김 (0이면 안 함)"),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_log_archives",
+        sa.Column("task_id",     sa.Integer(),   nullable=False),
+        sa.Column("month",       sa.String(7),   nullable=False),
+        sa.Column("log_count",   sa.Integer(),   nullable=False, server_default="0"),
+        sa.Column("archived_at", sa.DateTime(),  server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("task_id", "month"),
+    )
+
+    settings = sa.table("system_settings", sa.column("key"), sa.column("value"), sa.column("description"))
+    conn = op.get_bind()
+    existing = {row[0] for row in conn.execute(sa.select(settings.c.key))}
+    op.bulk_insert(settings, [
+        {"key": key, "value": value, "description": description}
+        for key, value, description in _SETTINGS if key not in existing
+    ])
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DELETE FROM system_settings WHERE `key` IN :keys").bindparams(
+        sa.bindparam("keys", [key for key, _, _ in _SETTINGS], expanding=True)))
+    op.drop_table("task_log_archives")
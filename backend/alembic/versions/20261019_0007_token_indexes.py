@@ -0,0 +1,34 @@
+"""토큰 테이블: 유효 토큰 조회·만료 토큰 정리 인덱스
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = [
+    ("ix_refresh_tokens_user_revoked_created", "refresh_tokens", ["user_id", "revoked", "created_at"]),
+    ("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"]),
+    ("ix_email_verification_tokens_user_used", "email_verification_tokens", ["user_id", "used"]),
+    ("ix_email_verification_tokens_expires_at", "email_verification_tokens", ["expires_at"]),
+    ("ix_password_reset_tokens_user_used", "password_reset_tokens", ["user_id", "used"]),
+    ("ix_password_reset_tokens_expires_at", "password_reset_tokens", ["expires_at"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,30 @@
+"""응답 캐시 버전 테이블: cache_versions
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    table = op.create_table(
+        "cache_versions",
+        sa.Column("namespace", sa.String(50), nullable=False),
+        sa.Column("version",   sa.BigInteger, nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("namespace"),
+    )
+    op.bulk_insert(table, [{"namespace": ns, "version": 0} for ns in ("categories", "departments", "users")])
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
@@ -0,0 +1,25 @@
+"""tasks.progress_at: 진행률을 정한 요청의 시각 (워커 간 쓰기 합치기 순서)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 00:00:00
+
+NULL 허용 컬럼을 끝에 추가하므로 MySQL 8에서는 테이블 재작성 없이(INSTANT) 적용된다.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("progress_at", sa.Float(precision=53), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "progress_at")
@@ -11,6 +11,12 @@ class Settings(BaseSettings):
     db_user: str = "root"
     db_password: str = ""
     db_name: str = "collab_todo"
+    # 읽기 복제본 (JSON 목록, 예: ["replica1", "replica2:3307"]). 계정·DB 이름은 primary와 같다
+    # 비우면 모든 조회가 primary. 지연 확인에 REPLICATION CLIENT 권한이 필요하다
+    db_replica_hosts: List[str] = []
+    db_replica_max_lag_seconds: float = 5.0  # 이보다 늦은 복제본은 조회에서 제외
+    db_replica_check_seconds: float = 10.0  # 복제 지연 확인 주기
+    db_read_your_writes_seconds: float = 10.0  # 쓰기 요청 후 이 시간 동안 그 사용자는 primary에서 조회
 
     # JWT
     secret_key: str = ""  # 반드시 .env에서 설정 필요
@@ -29,12 +35,58 @@ class Settings(BaseSettings):
 
     # File storage
     file_storage_path: str = "./uploads"
+    # 승인 후 오래된 업무 이력을 옮겨 두는 월별 압축 파일 위치 (services/task_logs.py)
+    task_log_archive_path: str = "./archive/task_logs"
+    # 같은 사용자의 연속 "updated" 이력을 이 시간(초) 안이면 한 행으로 합침 (0이면 끔)
+    task_log_coalesce_seconds: int = 300
+    # 진행률만 바꾸는 PATCH를 업무별 마지막 값으로 모았다가 이 주기(ms)로 한 번에 기록 (0이면 요청마다 기록)
+    progress_coalesce_ms: int = 1000
 
     # Server
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     app_base_url: str = "http://localhost:5173"  # 인증 메일 링크용 (배포 시 실제 주소로 변경)
 
+    # 응답 압축 (이 크기 미만 응답은 압축하지 않음, bytes)
+    compression_min_size: int = 1024
+
+    # /metrics 스크레이프 토큰 (설정 시 Authorization: Bearer <토큰> 필요, 비우면 인증 없음)
+    metrics_token: str = ""
+
+    # 요청당 SQL 예산·N+1 검사 (off | warn | enforce). 테스트·개발 환경에서만 켤 것
+    query_budget_mode: str = "off"
+    query_budget_repeat_threshold: int = 5
+
+    # 요청 샘플링 프로파일러: 관리자는 X-Profile: 1 헤더로 언제든 요청, 그 외는 이 비율(0~1)로 무작위 선택
+    profile_sample_rate: float = 0.0
+    profile_interval_ms: float = 5.0
+    profile_buffer_size: int = 50
+
+    # 느린 쿼리 로그 임계값(ms, 0이면 끔) / 처음 보는 쿼리 모양의 EXPLAIN 자동 수집
+    slow_query_ms: int = 200
+    slow_query_explain: bool = True
+
+    # 부팅 시 스키마 처리: verify(alembic 리비전 확인, 기본) | create_all(개발용) | skip
+    schema_boot_mode: str = "verify"
+
+    # 요청 제한 (토큰 버킷). 기본 database는 워커 간 공유, memory는 단일 프로세스 전용
+    rate_limit_enabled: bool = True
+    rate_limit_storage: str = "database"  # database | redis | memory
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
+    rate_limit_default: str = "200/minute"
+    rate_limit_expensive: str = "30/minute"  # 내보내기·가져오기·검색·일괄 변경·로그인
+    # 이 주소에서 온 요청만 X-Forwarded-For를 신뢰 (nginx가 같은 서버에 있으면 기본값 그대로)
+    rate_limit_trusted_proxies: List[str] = ["127.0.0.1", "::1"]
+
+    # 멀티 프로세스 실행 (run_server.py). 0이면 CPU 수만큼 워커
+    web_concurrency: int = 0
+    worker_max_requests: int = 0  # 워커당 이 건수(+무작위 jitter)를 처리하면 교체, 0이면 끔
+    worker_max_requests_jitter: int = 200
+    worker_graceful_timeout: int = 30
+    # 예약 작업을 한 프로세스만 실행하기 위한 잠금 (file | database | none)
+    scheduler_lock: str = "file"
+    scheduler_lock_path: str = ""  # 비우면 임시 디렉터리의 collab_todo_scheduler.lock
+
     @field_validator("secret_key")
     @classmethod
     def secret_key_must_be_set(cls, v: str) -> str:
@@ -49,6 +101,17 @@ class Settings(BaseSettings):
             f"@{self.db_host}:{self.db_port}/{self.db_name}?charset=utf8mb4"
         )
 
+    @property
+    def replica_urls(self) -> List[str]:
+        urls = []
+        for entry in self.db_replica_hosts:
+            host, _, port = entry.partition(":")
+            urls.append(
+                f"mysql+pymysql://{self.db_user}:{self.db_password}"
+                f"@{host}:{port or self.db_port}/{self.db_name}?charset=utf8mb4"
+            )
+        return urls
+
     class Config:
         env_file = ".env"
 
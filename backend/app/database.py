@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
+import time
+from contextlib import contextmanager
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
+from app.utils import metrics, profiling, replicas, slow_queries
 
 settings = get_settings()
 
@@ -11,6 +16,86 @@ engine = create_engine(
     pool_recycle=3600,
 )
 
+# 읽기 복제본 — 연결이 안 되면 빨리 primary로 넘어가도록 연결 제한 시간을 짧게
+replica_engines = [
+    create_engine(url, pool_pre_ping=True, pool_recycle=3600, connect_args={"connect_timeout": 2})
+    for url in settings.replica_urls
+]
+
+
+def instrument_engine(target) -> None:
+    """쿼리마다 실행 시간을 metrics / profiling / slow_queries 로 전달"""
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        metrics.record_query(elapsed)
+        profiling.record_query(statement, elapsed)
+        slow_queries.record(statement, parameters, elapsed, executemany)
+
+    @event.listens_for(target, "handle_error")
+    def _error(exception_context):
+        starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+        if starts:
+            elapsed = time.perf_counter() - starts.pop()
+            metrics.record_query(elapsed)
+            profiling.record_query(exception_context.statement or "", elapsed)
+
+
+def _pool_status() -> dict:
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):  # StaticPool 등 상태를 제공하지 않는 풀
+        return {}
+    return {
+        ("checked_out",): pool.checkedout(),
+        ("checked_in",): pool.checkedin(),
+        ("overflow",): max(pool.overflow(), 0),
+    }
+
+
+def _explain(statement: str, parameters) -> list:
+    """느린 쿼리 실행 계획 (slow_queries가 별도 스레드에서 호출)"""
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(prefix + statement, parameters or ())
+        return [dict(row._mapping) for row in result]
+
+
+def _replica_lag(target) -> Optional[float]:
+    """복제 지연(초). 복제가 멈췄으면 None, 복제 설정이 없는 서버면 0"""
+    if target.dialect.name != "mysql":
+        return 0.0
+    with target.connect() as conn:
+        for statement in ("SHOW REPLICA STATUS", "SHOW SLAVE STATUS"):  # MySQL 8.0.22+ / 이전·MariaDB
+            try:
+                row = conn.exec_driver_sql(statement).mappings().first()
+            except DBAPIError:
+                continue
+            if row is None:
+                return 0.0
+            lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+            return None if lag is None else float(lag)
+    raise RuntimeError("복제 상태를 조회할 수 없습니다 (REPLICATION CLIENT 권한 확인)")
+
+
+instrument_engine(engine)
+for _replica in replica_engines:
+    instrument_engine(_replica)
+read_router = replicas.ReplicaRouter(
+    [(str(e.url.host) + ":" + str(e.url.port), e) for e in replica_engines],
+    _replica_lag,
+    max_lag=settings.db_replica_max_lag_seconds,
+    check_interval=settings.db_replica_check_seconds,
+    read_your_writes=settings.db_read_your_writes_seconds,
+)
+slow_queries.configure(settings.slow_query_ms, _explain if settings.slow_query_explain else None)
+metrics.Gauge("collab_db_pool_connections", "DB 커넥션 풀 상태별 커넥션 수", ("state",), collect=_pool_status)
+metrics.Gauge("collab_db_pool_size", "DB 커넥션 풀 크기",
+              collect=lambda: {(): engine.pool.size()} if hasattr(engine.pool, "size") else {})
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -21,3 +106,22 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def read_session(user_id=None):
+    """조회 전용 세션 — 쓸 수 있는 복제본이 있으면 복제본, 아니면 primary"""
+    target = read_router.choose(user_id)
+    conn = None
+    if target is not None:
+        try:
+            conn = target.connect()
+        except DBAPIError as e:
+            read_router.mark_down(target, e)
+    db = SessionLocal(bind=conn) if conn is not None else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        if conn is not None:
+            conn.close()
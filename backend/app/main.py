@@ -1,41 +1,59 @@
+import secrets
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from app.database import engine, Base
-from app.models import user, task  # noqa: F401 - 테이블 등록용
+from app.database import engine, replica_engines, read_router, Base
+from app.models import user, task, job, rate_limit  # noqa: F401 - 테이블 등록용
 from app.routers import auth, users, tasks, attachments, notifications, categories, admin
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.leader import SchedulerElection, make_lock
+from app.services import progress
 from app.config import get_settings
+from app.utils.responses import FastJSONResponse
+from app.utils.compression import CompressionMiddleware, compression_stats
+from app.utils import metrics, query_budget, profiling, replicas, schema_version
+from app.utils.auth import is_admin_token, token_user_id
+from app.utils.rate_limit import RateLimiter, RateLimitMiddleware
+from app.utils.workers import RecycleMiddleware, is_supervised
 
 _settings = get_settings()
 
-# Rate limiter 설정
-limiter = Limiter(key_func=get_remote_address, default_limits=["200/minute"])
+# Rate limiter 설정 (사용자 ID 또는 실제 클라이언트 IP별 토큰 버킷, 비싼 경로는 별도 예산)
+limiter = RateLimiter.from_settings(_settings)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    start_scheduler()
+    # 테이블 생성·변경은 마이그레이션으로만 — 부팅 때는 리비전만 한 번 확인하고 다르면 즉시 실패
+    if _settings.schema_boot_mode == "create_all":
+        Base.metadata.create_all(bind=engine)
+    elif _settings.schema_boot_mode == "verify":
+        schema_version.verify(engine)
+    elif _settings.schema_boot_mode != "skip":
+        raise ValueError(f"SCHEMA_BOOT_MODE는 {', '.join(schema_version.BOOT_MODES)} 중 하나여야 합니다.")
+    # 워커가 여럿이어도 예약 작업은 잠금을 얻은 프로세스 하나만 실행
+    election = SchedulerElection(
+        make_lock(_settings.scheduler_lock, _settings.database_url, _settings.scheduler_lock_path),
+        on_elected=start_scheduler,
+        on_resign=stop_scheduler,
+    )
+    election.start()
     yield
-    stop_scheduler()
+    await election.stop()
+    progress.buffer.close()  # 모아 둔 진행률 기록
 
 
 app = FastAPI(
     title="CollabTodo API",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # Rate limiting 미들웨어
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.add_middleware(SlowAPIMiddleware)
+app.add_middleware(RateLimitMiddleware, limiter=limiter)
 
 # CORS
 app.add_middleware(
@@ -44,6 +62,63 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[replicas.RYW_HEADER],  # 자기 쓰기 읽기 표시를 클라이언트가 되돌려 보내도록
+)
+
+# 응답 압축 (첨부 파일 다운로드는 제외). CORS·속도 제한보다 바깥이고, 아래에서 추가하는
+# SQL 예산·프로파일링·쓰기 추적·워커 교체·지표 미들웨어가 다시 이것을 감싼다 (지표는 압축 포함 측정)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=_settings.compression_min_size,
+    exclude_paths=("/api/attachments",),
+)
+
+# 요청당 SQL 예산·N+1 검사 (QUERY_BUDGET_MODE가 off가 아닐 때만)
+if _settings.query_budget_mode != "off":
+    for _engine in [engine, *replica_engines]:
+        query_budget.install(_engine)
+    app.add_middleware(
+        query_budget.QueryBudgetMiddleware,
+        mode=_settings.query_budget_mode,
+        repeat_threshold=_settings.query_budget_repeat_threshold,
+    )
+
+# 요청 샘플링 프로파일러 (관리자 X-Profile 헤더 또는 PROFILE_SAMPLE_RATE)
+app.add_middleware(
+    profiling.ProfilingMiddleware,
+    sample_rate=_settings.profile_sample_rate,
+    interval=_settings.profile_interval_ms / 1000,
+    buffer_size=_settings.profile_buffer_size,
+    authorize=is_admin_token,
+)
+
+# 읽기 복제본을 쓸 때 쓰기 요청이 성공한 사용자는 잠시 primary에서 조회 (read-your-writes)
+if read_router.enabled:
+    app.add_middleware(replicas.WriteTrackingMiddleware, router=read_router, identify=token_user_id)
+
+# 워커 자동 교체 (run_server.py로 워커 2개 이상일 때만 — 수퍼바이저가 새 워커를 띄운다)
+if _settings.worker_max_requests > 0 and is_supervised():
+    app.add_middleware(
+        RecycleMiddleware,
+        max_requests=_settings.worker_max_requests,
+        jitter=_settings.worker_max_requests_jitter,
+    )
+
+# 요청 지연·SQL 집계 (압축까지 포함해 측정하도록 가장 바깥에 둔다)
+app.add_middleware(metrics.MetricsMiddleware)
+
+
+def _response_bytes() -> dict:
+    values = {}
+    for s in compression_stats():
+        values[(s["method"], s["route"], "raw")] = s["bytes_in"]
+        values[(s["method"], s["route"], "sent")] = s["bytes_out"]
+    return values
+
+
+metrics.Counter(
+    "collab_http_response_bytes_total", "응답 본문 바이트 (raw: 압축 전, sent: 전송)",
+    ("method", "route", "stage"), collect=_response_bytes,
 )
 
 # 전역 에러 핸들러 - 500 에러 표준화
@@ -72,6 +147,15 @@ def health():
     return {"status": "ok", "version": "2.0.0"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+    """Prometheus 스크레이프용 (nginx는 /api/ 만 프록시하므로 내부망에서만 접근)"""
+    token = _settings.metrics_token
+    if token and not secrets.compare_digest(request.headers.get("authorization", ""), f"Bearer {token}"):
+        return JSONResponse(status_code=401, content={"detail": "인증이 필요합니다."})
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/health/db")
 def health_db():
     """DB 연결 상태 및 테이블 존재 확인 (모니터링용)"""
@@ -1,2 +1,3 @@
 from app.models.user import User, Department, EmailVerificationToken, PasswordResetToken
 from app.models.task import Task, Attachment, TaskLog, Notification, Category, Tag
+from app.models.job import BulkJob
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, BigInteger
+from app.database import Base
+
+
+class CacheVersion(Base):
+    """참조 데이터 응답 캐시 버전 (워커 간 공유 — app/services/response_cache.py)"""
+    __tablename__ = "cache_versions"
+
+    namespace = Column(String(50), primary_key=True)  # categories | departments | users
+    version = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class BulkJob(Base):
+    """관리자 일괄 작업 — 청크 단위 진행 상황 기록 (서버 재시작 후 이어서 실행 가능)"""
+    __tablename__ = "bulk_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False, index=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    params = Column(Text, nullable=False)  # JSON
+    status = Column(String(20), nullable=False, default="pending", index=True)  # pending/running/done/failed
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    last_task_id = Column(Integer, default=0)  # 재개 시 이 ID 이후부터 처리
+    error = Column(Text)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime)
+
+    creator = relationship("User")
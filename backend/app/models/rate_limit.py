@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Float
+from app.database import Base
+
+
+class RateLimitBucket(Base):
+    """요청 제한 토큰 버킷 (RATE_LIMIT_STORAGE=database 일 때 워커 간 공유 저장소)"""
+    __tablename__ = "rate_limit_buckets"
+
+    bucket_key = Column(String(191), primary_key=True)  # "<규칙>:<user:ID | ip:주소>"
+    tokens = Column(Float(precision=53), nullable=False)
+    updated_at = Column(Float(precision=53), nullable=False, index=True)  # epoch 초 (오래된 버킷 정리용)
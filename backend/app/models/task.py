@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime,
-    Date, ForeignKey, Enum, DECIMAL, BigInteger, Table, Index
+    Date, ForeignKey, Enum, DECIMAL, BigInteger, Float, Table, Index
 )
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql import func
@@ -69,6 +69,7 @@ class Task(Base):
     is_subtask = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, server_default=func.now(), index=True)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    progress_at = Column(Float(precision=53))  # 진행률을 정한 요청 시각 (epoch, 워커 간 합치기 순서)
 
     assigner = relationship("User", foreign_keys=[assigner_id], back_populates="created_tasks")
     assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_tasks")
@@ -121,6 +122,16 @@ class TaskLog(Base):
     mentions = relationship("Mention", back_populates="log", cascade="all, delete-orphan")
 
 
+class TaskLogArchive(Base):
+    """콜드 스토리지로 옮긴 업무 이력의 위치 — 업무별·월 파일별 한 행 (services/task_logs.py)"""
+    __tablename__ = "task_log_archives"
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(String(7), primary_key=True)  # YYYY-MM → <TASK_LOG_ARCHIVE_PATH>/YYYY-MM.jsonl.gz
+    log_count = Column(Integer, nullable=False, default=0)
+    archived_at = Column(DateTime, server_default=func.now())
+
+
 class Mention(Base):
     """댓글 내 @멘션 — 특정 사용자에게 알림 발송"""
     __tablename__ = "mentions"
@@ -136,6 +147,11 @@ class Mention(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # 알림 목록·미읽음 수 (user_id, is_read) + 최신순 정렬, 보존 정책의 오래된 행 탐색
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+        Index("ix_notifications_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -147,3 +163,34 @@ class Notification(Base):
 
     user = relationship("User", back_populates="notifications")
     task = relationship("Task", back_populates="notifications")
+
+
+class NotificationArchive(Base):
+    """보존 기간이 지난 알림 — 외래 키 없이 인덱스 하나, 압축 행 형식으로 보관 (services/retention.py)"""
+    __tablename__ = "notifications_archive"
+    __table_args__ = (
+        Index("ix_notifications_archive_user_created", "user_id", "created_at"),
+        {"mysql_row_format": "COMPRESSED"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # 원래 알림 ID
+    user_id = Column(Integer, nullable=False)
+    task_id = Column(Integer)
+    type = Column(String(50), nullable=False)
+    message = Column(Text, nullable=False)
+    is_read = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, server_default=func.now())
+
+
+class TaskStatsDaily(Base):
+    """일별 업무 통계 롤업 — 스케줄러가 당일 행만 갱신, 지난 날짜는 추세 조회용으로 보존"""
+    __tablename__ = "task_stats_daily"
+
+    stat_date = Column(Date, primary_key=True)
+    department_id = Column(Integer, primary_key=True, default=0)  # 0: 부서 없음/비활성 담당자
+    status = Column(Enum(StatusEnum), primary_key=True)
+    priority = Column(Enum(PriorityEnum), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
+    overdue_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -44,6 +44,10 @@ class User(Base):
 
 class EmailVerificationToken(Base):
     __tablename__ = "email_verification_tokens"
+    __table_args__ = (
+        Index("ix_email_verification_tokens_user_used", "user_id", "used"),
+        Index("ix_email_verification_tokens_expires_at", "expires_at"),  # 만료 토큰 정리 (services/token_cleanup.py)
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -57,6 +61,10 @@ class EmailVerificationToken(Base):
 
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
+    __table_args__ = (
+        Index("ix_password_reset_tokens_user_used", "user_id", "used"),
+        Index("ix_password_reset_tokens_expires_at", "expires_at"),  # 만료 토큰 정리 (services/token_cleanup.py)
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -71,6 +79,11 @@ class PasswordResetToken(Base):
 class RefreshToken(Base):
     """Refresh Token — Access Token 만료 시 재발급용 (7일 유효)"""
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # 사용자의 유효 토큰을 최신순으로 (로그인·재발급 때 오래된 토큰 폐기) — 인덱스만으로 처리
+        Index("ix_refresh_tokens_user_revoked_created", "user_id", "revoked", "created_at"),
+        Index("ix_refresh_tokens_expires_at", "expires_at"),  # 만료 토큰 정리 (services/token_cleanup.py)
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
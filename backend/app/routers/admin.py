@@ -1,15 +1,21 @@
 import secrets
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response, Query
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import func
+from sqlalchemy.orm import Session
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.database import get_db
 from app.models.user import User, Department, SystemSettings
-from app.models.task import Task, Notification, StatusEnum
-from app.utils.auth import get_current_user, hash_password, validate_password_strength
+from app.models.task import Notification
+from app.utils.auth import get_current_user, get_read_db, hash_password, validate_password_strength
+from app.utils.query_budget import query_budget
 from app.models.user import PasswordResetToken
+from app.models.job import BulkJob
+from app.services import bulk_reassign, stats, response_cache, retention, task_logs, token_cleanup
+from app.utils.compression import compression_stats
+from app.utils import profiling, slow_queries
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -29,6 +35,8 @@ class BulkReassignRequest(BaseModel):
     from_user_id: int
     to_user_id: int
     task_ids: Optional[List[int]] = None  # None이면 from_user_id의 모든 활성 업무
+    dry_run: bool = False  # True면 이관 대상 건수만 반환
+    chunk_size: int = Field(bulk_reassign.CHUNK_SIZE, ge=1, le=5000)
 
 
 class DepartmentCreate(BaseModel):
@@ -46,6 +54,7 @@ class SystemSettingUpdate(BaseModel):
 
 # ── 사용자 관리 ────────────────────────────────────────────
 @router.get("/users")
+@query_budget(7)
 def list_all_users(db: Session = Depends(get_db), _: User = Depends(require_admin)):
     users = db.query(User).order_by(User.created_at.asc()).all()
     return [
@@ -132,17 +141,26 @@ def force_reset_password(
 
 # ── 부서 관리 ──────────────────────────────────────────────
 @router.get("/departments")
-def list_departments(db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    depts = db.query(Department).order_by(Department.name).all()
-    return [
-        {
-            "id": d.id,
-            "name": d.name,
-            "user_count": len([u for u in d.users if u.is_active]),
-            "created_at": d.created_at.isoformat() if d.created_at else None,
-        }
-        for d in depts
-    ]
+@query_budget(4)
+def list_departments(request: Request, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+    def build():
+        counts = dict(
+            db.query(User.department_id, func.count(User.id))
+            .filter(User.is_active == True)
+            .group_by(User.department_id)
+            .all()
+        )
+        depts = db.query(Department).order_by(Department.name).all()
+        return [
+            {
+                "id": d.id,
+                "name": d.name,
+                "user_count": counts.get(d.id, 0),
+                "created_at": d.created_at.isoformat() if d.created_at else None,
+            }
+            for d in depts
+        ]
+    return response_cache.cached_json(request, "admin:departments", ("departments", "users"), build)
 
 
 @router.post("/departments", status_code=201)
@@ -204,88 +222,113 @@ def delete_department(
 
 # ── 전체 통계 대시보드 ─────────────────────────────────────
 @router.get("/stats")
-def admin_stats(db: Session = Depends(get_db), _: User = Depends(require_admin)):
-    """관리자용 전체 업무 통계"""
-    from datetime import date
-
-    today = date.today()
-
-    total_users = db.query(User).filter(User.is_active == True).count()
-    total_tasks = db.query(Task).filter(Task.is_subtask == False).count()
-
-    # 상태별
-    status_breakdown = {}
-    for s in StatusEnum:
-        count = db.query(Task).filter(Task.status == s, Task.is_subtask == False).count()
-        status_breakdown[s.value] = count
-
-    # 우선순위별
-    from app.models.task import PriorityEnum
-    priority_breakdown = {}
-    for p in PriorityEnum:
-        count = db.query(Task).filter(Task.priority == p, Task.is_subtask == False).count()
-        priority_breakdown[p.value] = count
-
-    # 마감 초과
-    overdue = db.query(Task).filter(
-        Task.due_date < today,
-        Task.status.notin_([StatusEnum.approved]),
-        Task.is_subtask == False,
-    ).count()
-
-    # 부서별 업무 수 (담당자 기준)
-    dept_stats = []
-    depts = db.query(Department).all()
-    for dept in depts:
-        user_ids = [u.id for u in dept.users if u.is_active]
-        if not user_ids:
-            continue
-        count = db.query(Task).filter(
-            Task.assignee_id.in_(user_ids),
-            Task.is_subtask == False,
-        ).count()
-        dept_stats.append({"department": dept.name, "task_count": count})
-
-    # 사용자별 미완료 업무 TOP 10
-    from sqlalchemy import desc
-    user_task_counts = (
-        db.query(User.id, User.name, func.count(Task.id).label("cnt"))
-        .join(Task, Task.assignee_id == User.id)
-        .filter(
-            User.is_active == True,
-            Task.status.notin_([StatusEnum.approved]),
-            Task.is_subtask == False,
-        )
-        .group_by(User.id, User.name)
-        .order_by(desc("cnt"))
-        .limit(10)
-        .all()
-    )
+@query_budget(5)
+def admin_stats(
+    live: bool = Query(False),
+    db: Session = Depends(get_read_db),
+    _: User = Depends(require_admin),
+):
+    """관리자용 전체 업무 통계 (당일 롤업 기준, live=true면 즉시 집계)"""
+    return stats.build_summary(db, live=live)
+
+
+@router.get("/stats/trend")
+def admin_stats_trend(
+    days: int = Query(30, ge=1, le=365),
+    department_id: Optional[int] = Query(None),
+    db: Session = Depends(get_read_db),
+    _: User = Depends(require_admin),
+):
+    """일별 미완료·마감 초과 업무 추세"""
+    return stats.trend_series(db, days=days, department_id=department_id)
+
+
+@router.post("/stats/refresh")
+def refresh_stats(db: Session = Depends(get_db), _: User = Depends(require_admin)):
+    """당일 통계 롤업 즉시 갱신"""
+    rows = stats.refresh_today(db)
+    return {"message": "통계가 갱신되었습니다.", "rows": rows}
 
+
+# ── 알림 보존 정책 ─────────────────────────────────────────
+@router.get("/retention")
+def get_retention(db: Session = Depends(get_db), _: User = Depends(require_admin)):
+    """보존 정책(system_settings), 현재·처리 대기 행 수, 마지막 실행 결과 (알림·업무 이력·만료 토큰)"""
+    policy = retention.load_policy(db)
     return {
-        "total_users": total_users,
-        "total_tasks": total_tasks,
-        "overdue": overdue,
-        "status_breakdown": status_breakdown,
-        "priority_breakdown": priority_breakdown,
-        "dept_stats": dept_stats,
-        "top_assignees": [
-            {"user_id": r.id, "name": r.name, "pending_tasks": r.cnt}
-            for r in user_task_counts
-        ],
+        "policy": policy,
+        "rows": retention.pending_counts(db, policy),
+        "last_report": retention.last_report(db),
+        "task_logs_last_report": retention.last_report(db, task_logs.REPORT_KEY),
+        "tokens_last_report": retention.last_report(db, token_cleanup.REPORT_KEY),
     }
 
 
+@router.post("/retention/run")
+def run_retention(db: Session = Depends(get_db), _: User = Depends(require_admin)):
+    """보존 작업 즉시 실행 (스케줄러와 같은 배치 처리, 보관·삭제한 행 수 반환)"""
+    return retention.run(db)
+
+
+# ── 진단 ─────────────────────────────────────────────────
+@router.get("/metrics/compression")
+def get_compression_metrics(_: User = Depends(require_admin)):
+    """경로별 응답 원본/전송 바이트와 압축률 (프로세스 시작 이후 누적)"""
+    return compression_stats()
+
+
+@router.get("/profiles")
+def list_profiles(_: User = Depends(require_admin)):
+    """최근 프로파일된 요청 목록 (이 워커 프로세스의 링 버퍼, 최신 순)"""
+    return profiling.profiles()
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: int, top: int = Query(30, ge=1, le=500), _: User = Depends(require_admin)):
+    """프로파일 상세: 샘플이 많은 함수·스택, SQL 모양별 건수·시간"""
+    profile = profiling.get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다. (다른 워커에서 기록되었거나 버퍼에서 밀려남)")
+    return profile.detail(top)
+
+
+@router.get("/profiles/{profile_id}/collapsed", response_class=PlainTextResponse)
+def get_profile_collapsed(profile_id: int, _: User = Depends(require_admin)):
+    """flamegraph.pl / speedscope 에 바로 넣을 수 있는 collapsed stack 텍스트"""
+    profile = profiling.get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다. (다른 워커에서 기록되었거나 버퍼에서 밀려남)")
+    return PlainTextResponse(profile.collapsed())
+
+
+@router.delete("/profiles")
+def clear_profiles(_: User = Depends(require_admin)):
+    profiling.clear()
+    return {"message": "프로파일 버퍼를 비웠습니다."}
+
+
+@router.get("/slow-queries")
+def get_slow_queries(limit: int = Query(100, ge=1, le=500), _: User = Depends(require_admin)):
+    """임계값을 넘은 최근 쿼리와 쿼리 모양별 집계·EXPLAIN 결과 (이 워커 프로세스 기준)"""
+    return slow_queries.snapshot(limit)
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries(_: User = Depends(require_admin)):
+    slow_queries.clear()
+    return {"message": "느린 쿼리 기록을 비웠습니다."}
+
+
 # ── 업무 이관 ─────────────────────────────────────────────
-@router.post("/tasks/bulk-reassign")
+@router.post("/tasks/bulk-reassign", status_code=202)
 def bulk_reassign_tasks(
     req: BulkReassignRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
 ):
-    """특정 사용자의 업무를 다른 사용자에게 일괄 이관"""
-    from app.models.task import TaskLog
-
+    """특정 사용자의 업무를 다른 사용자에게 일괄 이관 (청크 단위 백그라운드 작업)"""
     from_user = db.query(User).filter(User.id == req.from_user_id).first()
     to_user = db.query(User).filter(User.id == req.to_user_id, User.is_active == True).first()
     if not from_user:
@@ -295,42 +338,56 @@ def bulk_reassign_tasks(
     if req.from_user_id == req.to_user_id:
         raise HTTPException(status_code=400, detail="같은 사용자로는 이관할 수 없습니다.")
 
-    query = db.query(Task).filter(
-        Task.assignee_id == req.from_user_id,
-        Task.status.notin_([StatusEnum.approved]),
-    )
-    if req.task_ids:
-        query = query.filter(Task.id.in_(req.task_ids))
-
-    tasks = query.all()
-    if not tasks:
+    total = bulk_reassign.count_reassignable(db, req.from_user_id, req.task_ids)
+    if req.dry_run:
+        response.status_code = 200
+        return {
+            "message": f"{total}개 업무가 {from_user.name} → {to_user.name}으로 이관될 예정입니다.",
+            "count": total,
+            "dry_run": True,
+        }
+    if not total:
         raise HTTPException(status_code=404, detail="이관할 업무가 없습니다.")
 
-    for task in tasks:
-        task.assignee_id = req.to_user_id
-        db.add(TaskLog(
-            task_id=task.id,
-            user_id=current_user.id,
-            action="reassigned",
-            old_value=from_user.name,
-            new_value=to_user.name,
-            comment=f"관리자에 의한 일괄 이관: {from_user.name} → {to_user.name}",
-        ))
-        # 이관 알림
-        db.add(Notification(
-            user_id=req.to_user_id,
-            task_id=task.id,
-            type="reassigned",
-            message=f"업무가 이관되었습니다: {task.title}",
-        ))
-
-    db.commit()
+    job = bulk_reassign.create_job(
+        db, current_user.id, req.from_user_id, req.to_user_id, req.task_ids, total, req.chunk_size,
+    )
+    background_tasks.add_task(bulk_reassign.run_job, job.id)
     return {
-        "message": f"{len(tasks)}개 업무가 {from_user.name} → {to_user.name}으로 이관되었습니다.",
-        "count": len(tasks),
+        "message": f"{total}개 업무 이관을 시작했습니다: {from_user.name} → {to_user.name}",
+        "count": total,
+        "job_id": job.id,
     }
 
 
+@router.get("/jobs/{job_id}")
+def get_bulk_job(job_id: int, db: Session = Depends(get_db), _: User = Depends(require_admin)):
+    """일괄 작업 진행 상황 조회"""
+    job = db.query(BulkJob).filter(BulkJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return bulk_reassign.job_to_dict(job)
+
+
+@router.post("/jobs/{job_id}/resume", status_code=202)
+def resume_bulk_job(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    _: User = Depends(require_admin),
+):
+    """실패했거나 서버 재시작으로 중단된 작업을 마지막 처리 청크 이후부터 재개"""
+    job = db.query(BulkJob).filter(BulkJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    if job.status == "done":
+        raise HTTPException(status_code=400, detail="이미 완료된 작업입니다.")
+    if job.status == "running" and not bulk_reassign.is_stale(db, job):
+        raise HTTPException(status_code=409, detail="이미 실행 중인 작업입니다.")
+    background_tasks.add_task(bulk_reassign.run_job, job.id)
+    return bulk_reassign.job_to_dict(job)
+
+
 # ── 공지 알림 발송 ─────────────────────────────────────────
 @router.post("/announcements")
 def send_announcement(
@@ -8,8 +8,11 @@ from app.models.user import User
 from app.models.task import Task, Attachment
 from app.utils.auth import get_current_user
 from app.config import get_settings
+from app.utils import lazy
 import aiofiles
 
+filetype = lazy.module("filetype")
+
 router = APIRouter(prefix="/api/attachments", tags=["attachments"])
 settings = get_settings()
 
@@ -55,7 +58,6 @@ ALLOWED_MIME_BY_EXT = {
 def _validate_file_type(content: bytes, ext: str) -> bool:
     """filetype 라이브러리로 실제 파일 서명(magic bytes) 검증"""
     try:
-        import filetype
         kind = filetype.guess(content)
         if kind is None:
             # 텍스트 파일(txt, csv, xml, json, svg, md)은 magic bytes가 없음 → 통과
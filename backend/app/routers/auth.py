@@ -2,6 +2,7 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from app.database import get_db
@@ -10,7 +11,7 @@ from app.utils.auth import (
     hash_password, verify_password, create_access_token,
     get_current_user, validate_password_strength, create_refresh_token_value,
 )
-from app.utils.email import send_verification_email, send_password_reset
+from app.utils.email import send_verification_email, send_password_reset, enqueue as enqueue_email
 from app.config import get_settings
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
@@ -18,6 +19,8 @@ settings = get_settings()
 
 # Refresh token 유효기간 (7일)
 _REFRESH_EXPIRE_DAYS = 7
+# 사용자당 유효 Refresh Token 수 (새로 발급하면 가장 오래된 것부터 폐기)
+_MAX_ACTIVE_REFRESH_TOKENS = 5
 
 
 # ── Schemas ──────────────────────────────────────────────
@@ -78,17 +81,19 @@ def _make_verification_token(db: Session, user_id: int) -> str:
 
 
 def _make_refresh_token(db: Session, user_id: int) -> str:
-    """새 Refresh Token 생성 후 DB 저장. 기존 만료 토큰 정리."""
-    # 기존 만료 토큰 정리 (최대 5개 유지)
-    old_tokens = (
-        db.query(RefreshToken)
-        .filter(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
-        .order_by(RefreshToken.created_at.asc())
-        .all()
-    )
-    if len(old_tokens) >= 5:
-        for t in old_tokens[:-4]:
-            t.revoked = True
+    """새 Refresh Token 생성 후 DB 저장. 새 토큰 포함 최대 5개만 유효하게 남기고 나머지 폐기."""
+    # 최신 4개를 건너뛴 나머지 ID만 (user_id, revoked, created_at) 인덱스로 조회 — 행을 읽지 않음
+    stale_ids = db.execute(
+        select(RefreshToken.id)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked == False)
+        .order_by(RefreshToken.created_at.desc(), RefreshToken.id.desc())
+        .offset(_MAX_ACTIVE_REFRESH_TOKENS - 1)
+    ).scalars().all()
+    if stale_ids:
+        db.execute(
+            update(RefreshToken).where(RefreshToken.id.in_(stale_ids)).values(revoked=True)
+            .execution_options(synchronize_session=False)
+        )
 
     raw = create_refresh_token_value()
     rt = RefreshToken(
@@ -170,7 +175,7 @@ async def register(
     db.refresh(user)
 
     verify_url = f"{settings.app_base_url}/#/verify-email/{raw_token}"
-    background_tasks.add_task(send_verification_email, user.email, user.name, verify_url)
+    enqueue_email(background_tasks, send_verification_email, user.email, user.name, verify_url)
 
     return _build_response(user, db)
 
@@ -298,7 +303,7 @@ async def forgot_password(
         db.commit()
 
         reset_url = f"{settings.app_base_url}/#/reset-password/{raw}"
-        background_tasks.add_task(send_password_reset, user.email, user.name, reset_url)
+        enqueue_email(background_tasks, send_password_reset, user.email, user.name, reset_url)
 
     return {"message": "입력한 이메일로 재설정 링크를 발송했습니다. (계정이 존재하는 경우)"}
 
@@ -342,5 +347,5 @@ async def resend_verification(
     db.commit()
 
     verify_url = f"{settings.app_base_url}/#/verify-email/{raw_token}"
-    background_tasks.add_task(send_verification_email, current_user.email, current_user.name, verify_url)
+    enqueue_email(background_tasks, send_verification_email, current_user.email, current_user.name, verify_url)
     return {"message": "인증 메일을 재발송했습니다."}
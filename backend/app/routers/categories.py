@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 from pydantic import BaseModel
@@ -6,6 +6,9 @@ from app.database import get_db
 from app.models.user import User
 from app.models.task import Category, Tag
 from app.utils.auth import get_current_user
+from app.utils.query_budget import query_budget
+from app.services import tags as tags_service
+from app.services import response_cache
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
@@ -27,9 +30,12 @@ class CategoryUpdate(BaseModel):
 
 
 @router.get("/")
-def list_categories(db: Session = Depends(get_db), _: User = Depends(get_current_user)):
-    cats = db.query(Category).order_by(Category.name).all()
-    return [{"id": c.id, "name": c.name, "color": c.color} for c in cats]
+@query_budget(3)
+def list_categories(request: Request, db: Session = Depends(get_db), _: User = Depends(get_current_user)):
+    def build():
+        cats = db.query(Category).order_by(Category.name).all()
+        return [{"id": c.id, "name": c.name, "color": c.color} for c in cats]
+    return response_cache.cached_json(request, "categories", ("categories",), build)
 
 
 @router.post("/", status_code=201)
@@ -106,3 +112,4 @@ def delete_tag(
         raise HTTPException(status_code=404, detail="태그를 찾을 수 없습니다.")
     db.delete(tag)
     db.commit()
+    tags_service.forget(tag.name)
@@ -3,17 +3,20 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.models.task import Notification
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_read_db
+from app.utils.responses import FastJSONResponse
+from app.utils.query_budget import query_budget
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
 
 @router.get("/")
+@query_budget(5)
 def list_notifications(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     unread_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     query = db.query(Notification).filter(Notification.user_id == current_user.id)
@@ -26,7 +29,7 @@ def list_notifications(
         .limit(page_size)
         .all()
     )
-    return {
+    return FastJSONResponse({
         "items": [
             {
                 "id": n.id,
@@ -34,7 +37,7 @@ def list_notifications(
                 "message": n.message,
                 "task_id": n.task_id,
                 "is_read": n.is_read,
-                "created_at": n.created_at.isoformat() if n.created_at else None,
+                "created_at": n.created_at,
             }
             for n in items
         ],
@@ -45,11 +48,11 @@ def list_notifications(
             Notification.user_id == current_user.id,
             Notification.is_read == False,
         ).count(),
-    }
+    })
 
 
 @router.get("/unread-count")
-def unread_count(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def unread_count(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     count = db.query(Notification).filter(
         Notification.user_id == current_user.id,
         Notification.is_read == False,
@@ -1,19 +1,31 @@
 import io
 import os
 import re
-from fastapi import APIRouter, Depends, HTTPException, Query
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, case
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, aliased
+from sqlalchemy import or_, and_, case, select, func, exists, insert
 from typing import Optional, List
-from datetime import date
+from datetime import date, timedelta
 from pydantic import BaseModel
 from app.database import get_db
 from app.models.user import User, TaskFavorite, UserNotificationPreference
-from app.models.task import Task, TaskLog, Notification, Category, Tag, StatusEnum, PriorityEnum, task_tags, Mention
-from app.utils.auth import get_current_user
+from app.models.task import Task, TaskLog, Notification, Category, Tag, StatusEnum, PriorityEnum, task_tags, Mention, Attachment
+from app.utils.auth import get_current_user, get_read_db
 from app.utils.email import send_task_assigned, send_status_changed
 from app.config import get_settings
+from app.utils.responses import FastJSONResponse
+from app.utils.query_budget import query_budget
+from app.utils import lazy
+from app.services import task_tree
+from app.services import tags as tags_service
+from app.services import task_import
+from app.services import task_logs
+from app.services import progress as progress_service
+
+openpyxl = lazy.module("openpyxl")
+openpyxl_styles = lazy.module("openpyxl.styles")
 
 _settings = get_settings()
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
@@ -41,6 +53,37 @@ SEARCH_PRIORITY_KEYWORDS: dict[str, PriorityEnum] = {
     "낮음": PriorityEnum.low,
 }
 
+# 상세 조회 시 함께 반환할 수 있는 하위 컬렉션
+DETAIL_INCLUDES = {"logs", "attachments", "subtasks"}
+
+# 목록 조회 fields= 로 선택 가능한 항목 (task_to_dict 키와 동일)
+TASK_COLUMN_FIELDS = {
+    "id": Task.id,
+    "title": Task.title,
+    "content": Task.content,
+    "priority": Task.priority,
+    "status": Task.status,
+    "progress": Task.progress,
+    "estimated_hours": Task.estimated_hours,
+    "due_date": Task.due_date,
+    "is_subtask": Task.is_subtask,
+    "parent_task_id": Task.parent_task_id,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+}
+TASK_LIST_FIELDS = set(TASK_COLUMN_FIELDS) | {
+    "assigner", "assignee", "category", "tags",
+    "attachment_count", "subtask_count", "subtasks_done", "is_favorite",
+}
+# 대시보드 목록 기본 프리셋 — content(TEXT) 등 화면에 없는 컬럼은 읽지 않음
+TASK_FIELD_PRESETS = {
+    "summary": (
+        "id", "title", "status", "priority", "progress", "due_date",
+        "assigner", "assignee", "category", "tags", "is_favorite",
+        "attachment_count", "subtask_count", "subtasks_done",
+    ),
+}
+
 
 # ── Schemas ──────────────────────────────────────────────
 class MaterialProvider(BaseModel):
@@ -95,7 +138,9 @@ class BulkStatusChange(BaseModel):
 
 
 # ── Helpers ──────────────────────────────────────────────
-def task_to_dict(t: Task, current_user_id: Optional[int] = None) -> dict:
+def task_to_dict(t: Task, current_user_id: Optional[int] = None, counts: Optional[dict] = None) -> dict:
+    """counts: 컬렉션을 읽지 않고 집계 컬럼으로 구한 attachment_count / subtask_count / subtasks_done"""
+    counts = counts or {}
     return {
         "id": t.id,
         "title": t.title,
@@ -105,34 +150,106 @@ def task_to_dict(t: Task, current_user_id: Optional[int] = None) -> dict:
         "category": {"id": t.category.id, "name": t.category.name, "color": t.category.color} if t.category else None,
         "priority": t.priority,
         "status": t.status,
-        "progress": t.progress,
+        "progress": progress_service.overlay(t.id, t.progress),
         "estimated_hours": float(t.estimated_hours) if t.estimated_hours else None,
-        "due_date": t.due_date.isoformat() if t.due_date else None,
+        "due_date": t.due_date,
         "is_subtask": t.is_subtask,
         "parent_task_id": t.parent_task_id,
         "tags": [{"id": tag.id, "name": tag.name} for tag in t.tags],
-        "attachment_count": len(t.attachments),
-        "subtask_count": len(t.subtasks),
-        "subtasks_done": sum(1 for s in t.subtasks if s.status == StatusEnum.approved),
+        "attachment_count": counts["attachment_count"] if "attachment_count" in counts else len(t.attachments),
+        "subtask_count": counts["subtask_count"] if "subtask_count" in counts else len(t.subtasks),
+        "subtasks_done": (counts["subtasks_done"] if "subtasks_done" in counts
+                          else sum(1 for s in t.subtasks if s.status == StatusEnum.approved)),
         "is_favorite": any(f.user_id == current_user_id for f in t.favorites) if current_user_id else False,
-        "created_at": t.created_at.isoformat() if t.created_at else None,
-        "updated_at": t.updated_at.isoformat() if t.updated_at else None,
+        # datetime/date는 응답 클래스가 ISO 형식으로 직렬화
+        "created_at": t.created_at,
+        "updated_at": t.updated_at,
     }
 
 
-def _get_or_create_tags(db: Session, names: List[str]) -> List[Tag]:
-    tags = []
-    for name in names:
-        name = name.strip()
-        if not name:
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields= 파라미터 해석. 생략하거나 "full"이면 None(전체 항목)."""
+    if not fields or fields.strip() == "full":
+        return None
+    names: List[str] = []
+    for f in (f.strip() for f in fields.split(",")):
+        if not f:
             continue
-        tag = db.query(Tag).filter(Tag.name == name).first()
-        if not tag:
-            tag = Tag(name=name)
-            db.add(tag)
-            db.flush()
-        tags.append(tag)
-    return tags
+        if f in TASK_FIELD_PRESETS:
+            names.extend(TASK_FIELD_PRESETS[f])
+        elif f in TASK_LIST_FIELDS:
+            names.append(f)
+        else:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 필드입니다: {f}")
+    return list(dict.fromkeys(["id"] + names))
+
+
+def _count_aggregates() -> dict:
+    """첨부·하위 업무 수 (Task 행에 상관된 스칼라 서브쿼리 — 컬렉션을 읽지 않음)"""
+    sub = aliased(Task)
+    return {
+        "attachment_count": select(func.count(Attachment.id))
+            .where(Attachment.task_id == Task.id).correlate(Task).scalar_subquery(),
+        "subtask_count": select(func.count(sub.id))
+            .where(sub.parent_task_id == Task.id).correlate(Task).scalar_subquery(),
+        "subtasks_done": select(func.count(sub.id))
+            .where(sub.parent_task_id == Task.id, sub.status == StatusEnum.approved).correlate(Task).scalar_subquery(),
+    }
+
+
+def _projected_task_query(db: Session, fields: List[str], current_user_id: int):
+    """요청한 항목에 필요한 컬럼·관계·집계만 SELECT 하는 쿼리. 결과 행은 (Task, 집계...)"""
+    wanted = set(fields)
+    columns = [TASK_COLUMN_FIELDS[f] for f in fields if f in TASK_COLUMN_FIELDS]
+    options = []
+    if "assigner" in wanted:
+        columns.append(Task.assigner_id)
+        options.append(joinedload(Task.assigner).load_only(User.id, User.name))
+    if "assignee" in wanted:
+        columns.append(Task.assignee_id)
+        options.append(joinedload(Task.assignee).load_only(User.id, User.name))
+    if "category" in wanted:
+        columns.append(Task.category_id)
+        options.append(joinedload(Task.category))
+    if "tags" in wanted:
+        options.append(selectinload(Task.tags))
+
+    aggregates = {
+        **_count_aggregates(),
+        "is_favorite": exists().where(
+            TaskFavorite.task_id == Task.id, TaskFavorite.user_id == current_user_id
+        ).correlate(Task),
+    }
+    query = db.query(Task).options(load_only(*columns), *options)
+    extra = [aggregates[f].label(f) for f in fields if f in aggregates]
+    return query.add_columns(*extra) if extra else query
+
+
+def _projected_task_dict(row, fields: List[str]) -> dict:
+    # 집계 컬럼이 있으면 Row(Task, 집계...), 없으면 Task 인스턴스
+    t, extras = (row[0], row._mapping) if hasattr(row, "_mapping") else (row, {})
+    result = {}
+    for f in fields:
+        if f in TASK_COLUMN_FIELDS:
+            value = getattr(t, f)
+            if f == "estimated_hours":
+                value = float(value) if value else None
+            elif f == "progress":
+                value = progress_service.overlay(t.id, value)
+            result[f] = value
+        elif f in ("assigner", "assignee"):
+            u = getattr(t, f)
+            result[f] = {"id": u.id, "name": u.name} if u else None
+        elif f == "category":
+            c = t.category
+            result[f] = {"id": c.id, "name": c.name, "color": c.color} if c else None
+        elif f == "tags":
+            result[f] = [{"id": tag.id, "name": tag.name} for tag in t.tags]
+        elif f == "is_favorite":
+            result[f] = bool(extras[f])
+        else:
+            result[f] = extras[f] or 0
+    return result
 
 
 def _add_notification(db: Session, user_id: int, task_id: int, ntype: str, message: str):
@@ -150,6 +267,26 @@ def _check_notify_pref(db: Session, user_id: int, pref_field: str) -> bool:
     return getattr(pref, pref_field, True)
 
 
+def _load_notify_prefs(db: Session, user_ids) -> dict:
+    """여러 사용자의 알림 설정을 한 번에 조회. 설정이 없는 사용자는 결과에 없음(기본 True).
+
+    commit 후 ORM 객체가 만료돼도 재조회하지 않도록 값(dict)으로 복사해 둔다.
+    """
+    ids = {uid for uid in user_ids if uid}
+    if not ids:
+        return {}
+    columns = UserNotificationPreference.__table__.columns
+    prefs = db.query(UserNotificationPreference).filter(UserNotificationPreference.user_id.in_(ids)).all()
+    return {p.user_id: {c.key: getattr(p, c.key) for c in columns} for p in prefs}
+
+
+def _pref_enabled(prefs: dict, user_id: int, pref_field: str) -> bool:
+    pref = prefs.get(user_id)
+    if not pref:
+        return True
+    return pref.get(pref_field, True)
+
+
 def _check_task_access(task: Task, current_user: User) -> bool:
     return (
         current_user.id == task.assigner_id
@@ -161,20 +298,81 @@ def _check_task_access(task: Task, current_user: User) -> bool:
 def _parse_mentions(comment: str, db: Session) -> List[User]:
     """댓글에서 @이름 패턴을 파싱해 실제 사용자 목록 반환"""
     mention_names = set(re.findall(r"@(\S+)", comment))
-    mentioned_users = []
-    for name in mention_names:
-        user = db.query(User).filter(User.name == name, User.is_active == True).first()
-        if user:
-            mentioned_users.append(user)
-    return mentioned_users
+    if not mention_names:
+        return []
+    users = db.query(User).filter(
+        User.name.in_(mention_names), User.is_active == True
+    ).order_by(User.id).all()
+    # 동명이인은 이름당 한 명만 (id가 가장 작은 사용자)
+    by_name = {}
+    for user in users:
+        by_name.setdefault(user.name, user)
+    return list(by_name.values())
+
+
+def _attachment_to_dict(a: Attachment) -> dict:
+    return {
+        "id": a.id,
+        "filename": a.filename,
+        "file_size": a.file_size,
+        "mime_type": a.mime_type,
+        "uploader": {"id": a.uploader.id, "name": a.uploader.name} if a.uploader else None,
+        "uploaded_at": a.uploaded_at.isoformat() if a.uploaded_at else None,
+    }
+
+
+def _subtask_to_dict(t: Task) -> dict:
+    return {
+        "id": t.id,
+        "title": t.title,
+        "status": t.status,
+        "priority": t.priority,
+        "progress": progress_service.overlay(t.id, t.progress),
+        "assignee": {"id": t.assignee.id, "name": t.assignee.name} if t.assignee else None,
+        "due_date": t.due_date.isoformat() if t.due_date else None,
+    }
+
+
+def _check_tag_names(names: Optional[List[str]]) -> None:
+    name = tags_service.too_long(names)
+    if name:
+        raise HTTPException(
+            status_code=400, detail=f"태그는 {tags_service.NAME_MAX_LENGTH}자를 초과할 수 없습니다: {name}")
+
+
+def _log_page(db: Session, task_id: int, limit: int, before_id: Optional[int] = None) -> dict:
+    """최신순 limit건의 이력 페이지 (before_id 이전 항목). 반환 items는 시간순."""
+    query = (
+        db.query(TaskLog)
+        .options(joinedload(TaskLog.user), selectinload(TaskLog.mentions).joinedload(Mention.mentioned_user))
+        .filter(TaskLog.task_id == task_id)
+    )
+    if before_id:
+        query = query.filter(TaskLog.id < before_id)
+    rows = query.order_by(TaskLog.id.desc()).limit(limit + 1).all()
+    items = [task_logs.log_to_dict(l) for l in reversed(rows)]
+    if len(rows) <= limit:
+        # 페이지가 덜 찼으면 콜드 스토리지로 옮긴 더 오래된 이력으로 채운다 (보관 이력 ID가 항상 더 작음)
+        archived = task_logs.archived_logs(db, task_id, before_id)
+        items = archived + items
+    has_more = len(items) > limit
+    items = items[-limit:]
+    return {
+        "items": items,
+        "has_more": has_more,
+        "next_before_id": items[0]["id"] if has_more and items else None,
+    }
 
 
 # ── Endpoints ─────────────────────────────────────────────
 @router.post("/", status_code=201)
+# 자료 요청 하위 업무는 로그·알림에 쓸 PK가 필요해 행마다 INSERT (MySQL은 RETURNING 미지원)
+@query_budget(12, allow=("INSERT INTO tasks",))
 async def create_task(req: TaskCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     assignee = db.query(User).filter(User.id == req.assignee_id).first()
     if not assignee:
         raise HTTPException(status_code=404, detail="담당자를 찾을 수 없습니다.")
+    _check_tag_names(req.tag_names)
 
     task = Task(
         title=req.title,
@@ -188,17 +386,23 @@ async def create_task(req: TaskCreate, db: Session = Depends(get_db), current_us
         parent_task_id=req.parent_task_id,
         is_subtask=req.is_subtask,
     )
-    task.tags = _get_or_create_tags(db, req.tag_names)
+    task.tags = tags_service.resolve_tags(db, req.tag_names)
     db.add(task)
     db.flush()
 
+    provider_ids = {mp.assignee_id for mp in req.material_providers}
+    providers = (
+        {u.id: u for u in db.query(User).filter(User.id.in_(provider_ids)).all()} if provider_ids else {}
+    )
+    prefs = _load_notify_prefs(db, {assignee.id} | set(providers))
+
     db.add(TaskLog(task_id=task.id, user_id=current_user.id, action="created", new_value="pending"))
-    if _check_notify_pref(db, assignee.id, "notify_assigned"):
+    if _pref_enabled(prefs, assignee.id, "notify_assigned"):
         _add_notification(db, assignee.id, task.id, "assigned", f"새 업무가 배정되었습니다: {task.title}")
 
     material_assignees = []
     for mp in req.material_providers:
-        provider = db.query(User).filter(User.id == mp.assignee_id).first()
+        provider = providers.get(mp.assignee_id)
         if not provider:
             continue
         subtask = Task(
@@ -212,35 +416,52 @@ async def create_task(req: TaskCreate, db: Session = Depends(get_db), current_us
             is_subtask=True,
         )
         db.add(subtask)
-        db.flush()
-        db.add(TaskLog(task_id=subtask.id, user_id=current_user.id, action="created", new_value="pending"))
-        if _check_notify_pref(db, mp.assignee_id, "notify_assigned"):
-            _add_notification(db, mp.assignee_id, subtask.id, "assigned", f"자료 제공 요청: {mp.title}")
         material_assignees.append((provider, subtask))
 
+    if material_assignees:
+        db.flush()
+        db.execute(insert(TaskLog), [
+            {"task_id": subtask.id, "user_id": current_user.id, "action": "created", "new_value": "pending"}
+            for _, subtask in material_assignees
+        ])
+        notifications = [
+            {"user_id": provider.id, "task_id": subtask.id, "type": "assigned",
+             "message": f"자료 제공 요청: {subtask.title}"}
+            for provider, subtask in material_assignees
+            if _pref_enabled(prefs, provider.id, "notify_assigned")
+        ]
+        if notifications:
+            db.execute(insert(Notification), notifications)
+    # commit 후에는 객체가 만료되어 속성 접근마다 재조회하므로 메일 발송에 쓸 값을 미리 복사
+    assignee_email, assignee_name = assignee.email, assignee.name
+    material_emails = [
+        (provider.id, provider.email, provider.name, subtask.title, subtask.due_date)
+        for provider, subtask in material_assignees
+    ]
+
     db.commit()
 
     try:
-        if _check_notify_pref(db, assignee.id, "email_assigned"):
+        if _pref_enabled(prefs, req.assignee_id, "email_assigned"):
             await send_task_assigned(
-                to=assignee.email,
-                assignee_name=assignee.name,
-                task_title=task.title,
+                to=assignee_email,
+                assignee_name=assignee_name,
+                task_title=req.title,
                 assigner_name=current_user.name,
                 due_date=str(req.due_date) if req.due_date else "미정",
             )
     except Exception:
         pass
 
-    for provider, subtask in material_assignees:
+    for provider_id, email, name, title, due_date in material_emails:
         try:
-            if _check_notify_pref(db, provider.id, "email_assigned"):
+            if _pref_enabled(prefs, provider_id, "email_assigned"):
                 await send_task_assigned(
-                    to=provider.email,
-                    assignee_name=provider.name,
-                    task_title=subtask.title,
+                    to=email,
+                    assignee_name=name,
+                    task_title=title,
                     assigner_name=current_user.name,
-                    due_date=str(subtask.due_date) if subtask.due_date else "미정",
+                    due_date=str(due_date) if due_date else "미정",
                 )
         except Exception:
             pass
@@ -265,17 +486,12 @@ def export_tasks(
     due_date_from: Optional[date] = Query(None),
     due_date_to: Optional[date] = Query(None),
     fmt: str = Query("xlsx", regex="^(xlsx|csv)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """업무 목록을 Excel(.xlsx) 또는 CSV로 내보내기"""
-    STATUS_LABELS = {
-        "pending": "대기", "in_progress": "진행중", "review": "검토요청",
-        "approved": "완료", "rejected": "반려",
-    }
-    PRIORITY_LABELS = {
-        "urgent": "긴급", "high": "높음", "normal": "보통", "low": "낮음",
-    }
+    STATUS_LABELS = task_import.STATUS_LABELS
+    PRIORITY_LABELS = task_import.PRIORITY_LABELS
 
     query = db.query(Task).options(
         joinedload(Task.assigner), joinedload(Task.assignee),
@@ -317,7 +533,7 @@ def export_tasks(
         ("우선순위", lambda t: PRIORITY_LABELS.get(t.priority.value if t.priority else "", "")),
         ("카테고리", lambda t: t.category.name if t.category else ""),
         ("태그", lambda t: ", ".join(tag.name for tag in t.tags)),
-        ("진행도(%)", lambda t: t.progress or 0),
+        ("진행도(%)", lambda t: progress_service.overlay(t.id, t.progress) or 0),
         ("마감일", lambda t: t.due_date.isoformat() if t.due_date else ""),
         ("생성일", lambda t: t.created_at.strftime("%Y-%m-%d %H:%M") if t.created_at else ""),
     ]
@@ -336,20 +552,18 @@ def export_tasks(
             headers={"Content-Disposition": "attachment; filename=tasks.csv"},
         )
     else:
-        import openpyxl
-        from openpyxl.styles import Font, PatternFill, Alignment
         wb = openpyxl.Workbook()
         ws = wb.active
         ws.title = "업무 목록"
 
         # 헤더
-        header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        header_fill = openpyxl_styles.PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+        header_font = openpyxl_styles.Font(color="FFFFFF", bold=True)
         for col, (header, _) in enumerate(headers_map, 1):
             cell = ws.cell(row=1, column=col, value=header)
             cell.fill = header_fill
             cell.font = header_font
-            cell.alignment = Alignment(horizontal="center")
+            cell.alignment = openpyxl_styles.Alignment(horizontal="center")
 
         # 데이터
         for row, t in enumerate(tasks, 2):
@@ -371,7 +585,29 @@ def export_tasks(
         )
 
 
+@router.post("/import")
+def import_tasks(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """CSV/XLSX 파일로 업무 일괄 생성 (내보내기와 같은 열 구성).
+
+    오류가 있는 행은 건너뛰고 행 번호별 오류 목록을 반환한다. dry_run=true면 검증만 수행.
+    """
+    ext = os.path.splitext(file.filename or "")[1].lower()
+    if ext not in (".csv", ".xlsx"):
+        raise HTTPException(status_code=400, detail="CSV 또는 XLSX 파일만 가져올 수 있습니다.")
+    try:
+        return task_import.import_tasks(db, file.file, ext[1:], current_user, dry_run=dry_run)
+    except task_import.ImportFormatError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/favorites")
+@query_budget(3)
 def list_favorites(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -390,42 +626,45 @@ def list_favorites(
         .order_by(TaskFavorite.created_at.desc())
         .all()
     )
-    return [task_to_dict(t, current_user.id) for t in favs]
+    return FastJSONResponse([task_to_dict(t, current_user.id) for t in favs])
 
 
 @router.get("/dashboard")
-def dashboard_summary(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    from datetime import timedelta
+@query_budget(3)
+def dashboard_summary(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     today = date.today()
-    in_3_days = today + date.fromordinal(today.toordinal() + 3) - today  # timedelta(days=3)
-    in_3_days = today.__class__.fromordinal(today.toordinal() + 3)
-
-    my_tasks = db.query(Task).filter(Task.assignee_id == current_user.id, Task.is_subtask == False)
-    total = my_tasks.count()
-    urgent = my_tasks.filter(Task.priority == PriorityEnum.urgent, Task.status != StatusEnum.approved).count()
-    due_soon = my_tasks.filter(
-        Task.due_date <= in_3_days,
-        Task.due_date >= today,
-        Task.status.notin_([StatusEnum.approved]),
-    ).count()
-    overdue = my_tasks.filter(
-        Task.due_date < today,
-        Task.status.notin_([StatusEnum.approved]),
-    ).count()
-    rejected = my_tasks.filter(Task.status == StatusEnum.rejected).count()
-    status_breakdown = {s.value: my_tasks.filter(Task.status == s).count() for s in StatusEnum}
-
+    in_3_days = today + timedelta(days=3)
+
+    # 건수 항목별 COUNT 쿼리 대신 조건부 합계 1회 + 상태별 GROUP BY 1회
+    mine = (Task.assignee_id == current_user.id, Task.is_subtask == False)
+    not_done = Task.status != StatusEnum.approved
+
+    def count_if(*conditions):
+        return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+    total, urgent, due_soon, overdue, rejected = db.query(
+        func.count(Task.id),
+        count_if(Task.priority == PriorityEnum.urgent, not_done),
+        count_if(Task.due_date <= in_3_days, Task.due_date >= today, not_done),
+        count_if(Task.due_date < today, not_done),
+        count_if(Task.status == StatusEnum.rejected),
+    ).filter(*mine).one()
+    counts = dict(db.query(Task.status, func.count(Task.id)).filter(*mine).group_by(Task.status).all())
+    status_breakdown = {s.value: counts.get(s, 0) for s in StatusEnum}
+
+    # MySQL의 SUM은 DECIMAL을 반환하므로 int로 맞춘다
     return {
         "total": total,
-        "urgent": urgent,
-        "due_soon": due_soon,
-        "overdue": overdue,
-        "rejected": rejected,
+        "urgent": int(urgent),
+        "due_soon": int(due_soon),
+        "overdue": int(overdue),
+        "rejected": int(rejected),
         "status_breakdown": status_breakdown,
     }
 
 
 @router.get("/")
+@query_budget(5)
 def list_tasks(
     section: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -439,9 +678,11 @@ def list_tasks(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     favorites_only: bool = Query(False),
-    db: Session = Depends(get_db),
+    fields: Optional[str] = Query(None, description="쉼표 구분 항목 또는 프리셋(summary). 생략 시 전체"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
+    selected_fields = _parse_fields(fields)
     text_terms: List[str] = []
     implied_status: Optional[StatusEnum] = None
     implied_priority: Optional[PriorityEnum] = None
@@ -525,7 +766,20 @@ def list_tasks(
     order_expr = sort_map.get(sort_by, Task.created_at.desc())
     order_clause = list(order_expr) if isinstance(order_expr, tuple) else [order_expr]
 
-    total = apply_filters(db.query(Task)).count()
+    # 건수 조회는 id만 — 서브쿼리에 TEXT 컬럼이 포함되지 않도록
+    total = apply_filters(db.query(Task.id)).count()
+
+    if selected_fields is not None:
+        rows = apply_filters(
+            _projected_task_query(db, selected_fields, current_user.id)
+        ).order_by(*order_clause).offset((page - 1) * page_size).limit(page_size).all()
+        return FastJSONResponse({
+            "items": [_projected_task_dict(r, selected_fields) for r in rows],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+        })
+
     items = apply_filters(
         db.query(Task).options(
             joinedload(Task.assigner), joinedload(Task.assignee),
@@ -535,10 +789,16 @@ def list_tasks(
         )
     ).order_by(*order_clause).offset((page - 1) * page_size).limit(page_size).all()
 
-    return {"items": [task_to_dict(t, current_user.id) for t in items], "total": total, "page": page, "page_size": page_size}
+    return FastJSONResponse({
+        "items": [task_to_dict(t, current_user.id) for t in items],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.post("/bulk-status")
+@query_budget(8)
 async def bulk_change_status(
     req: BulkStatusChange,
     db: Session = Depends(get_db),
@@ -549,41 +809,56 @@ async def bulk_change_status(
     if not req.task_ids:
         raise HTTPException(status_code=400, detail="업무를 선택해주세요.")
 
-    updated = 0
-    for task_id in req.task_ids:
-        task = db.query(Task).options(
-            joinedload(Task.assigner), joinedload(Task.assignee)
-        ).filter(Task.id == task_id).first()
-        if not task or not _check_task_access(task, current_user):
+    task_ids = list(dict.fromkeys(req.task_ids))
+    tasks_by_id = {
+        t.id: t for t in db.query(Task).filter(Task.id.in_(task_ids)).all()
+        if _check_task_access(t, current_user)
+    }
+    prefs = _load_notify_prefs(db, {
+        t.assigner_id if current_user.id == t.assignee_id else t.assignee_id
+        for t in tasks_by_id.values()
+    })
+
+    # 로그·알림은 PK가 필요 없으므로 행마다 INSERT 하지 않고 다중 행 INSERT 한 번씩
+    logs, notifications = [], []
+    for task_id in task_ids:
+        task = tasks_by_id.get(task_id)
+        if not task:
             continue
 
         old_status = task.status
         task.status = req.status
-        db.add(TaskLog(
-            task_id=task.id,
-            user_id=current_user.id,
-            action="status_changed",
-            old_value=old_status,
-            new_value=req.status,
-            comment=req.comment,
-        ))
+        logs.append({
+            "task_id": task.id,
+            "user_id": current_user.id,
+            "action": "status_changed",
+            "old_value": old_status,
+            "new_value": req.status,
+            "comment": req.comment,
+        })
         notify_user_id = task.assigner_id if current_user.id == task.assignee_id else task.assignee_id
-        if _check_notify_pref(db, notify_user_id, "notify_status_changed"):
-            _add_notification(db, notify_user_id, task.id, "status_changed",
-                              f"업무 상태 변경: {task.title} → {req.status}")
-        updated += 1
-
+        if _pref_enabled(prefs, notify_user_id, "notify_status_changed"):
+            notifications.append({
+                "user_id": notify_user_id, "task_id": task.id, "type": "status_changed",
+                "message": f"업무 상태 변경: {task.title} → {req.status}",
+            })
+
+    if logs:
+        db.execute(insert(TaskLog), logs)
+    if notifications:
+        db.execute(insert(Notification), notifications)
     db.commit()
+    updated = len(logs)
     return {"message": f"{updated}건의 업무 상태가 변경되었습니다.", "updated": updated}
 
 
 @router.get("/{task_id}")
+@query_budget(7)
 def get_task(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     task = db.query(Task).options(
-        joinedload(Task.assigner), joinedload(Task.assignee),
-        joinedload(Task.category), joinedload(Task.tags),
-        joinedload(Task.attachments), joinedload(Task.subtasks),
-        joinedload(Task.logs), joinedload(Task.favorites),
+        joinedload(Task.assigner), joinedload(Task.assignee), joinedload(Task.category),
+        selectinload(Task.tags), selectinload(Task.attachments),
+        selectinload(Task.subtasks), selectinload(Task.favorites),
     ).filter(Task.id == task_id).first()
     if not task:
         raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
@@ -593,6 +868,75 @@ def get_task(task_id: int, db: Session = Depends(get_db), current_user: User = D
     return task_to_dict(task, current_user.id)
 
 
+@router.get("/{task_id}/detail")
+@query_budget(9)
+def get_task_detail(
+    task_id: int,
+    include: str = Query("logs,attachments,subtasks"),
+    logs_limit: int = Query(50, ge=1, le=200),
+    logs_before_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """업무 상세 화면용 — 업무·이력·첨부·하위 업무를 한 번의 요청으로 반환.
+
+    하위 컬렉션은 각각 selectinload 쿼리 1회로 읽으므로 쿼리 수가 데이터 양과 무관하다.
+    include에 없는 첨부·하위 업무는 읽지 않고 개수만 같은 SELECT의 집계 컬럼으로 구한다.
+    이력은 최신 logs_limit건만 반환하며 logs.next_before_id로 이전 페이지를 조회한다.
+    """
+    includes = {i.strip() for i in include.split(",") if i.strip()}
+    unknown = includes - DETAIL_INCLUDES
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 include 항목입니다: {', '.join(sorted(unknown))}")
+
+    options = [
+        joinedload(Task.assigner), joinedload(Task.assignee), joinedload(Task.category),
+        selectinload(Task.tags), selectinload(Task.favorites),
+    ]
+    counts = []
+    aggregates = _count_aggregates()
+    if "attachments" in includes:
+        options.append(selectinload(Task.attachments).joinedload(Attachment.uploader))
+    else:
+        counts.append(aggregates["attachment_count"].label("attachment_count"))
+    if "subtasks" in includes:
+        options.append(selectinload(Task.subtasks).joinedload(Task.assignee))
+    else:
+        counts += [aggregates[f].label(f) for f in ("subtask_count", "subtasks_done")]
+    query = db.query(Task).options(*options).filter(Task.id == task_id)
+    row = query.add_columns(*counts).first() if counts else query.first()
+    task = row[0] if counts and row else row
+    if not task:
+        raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
+    if not _check_task_access(task, current_user):
+        raise HTTPException(status_code=403, detail="이 업무에 접근할 권한이 없습니다.")
+
+    result = task_to_dict(task, current_user.id, {c.name: int(row._mapping[c.name] or 0) for c in counts})
+    if "attachments" in includes:
+        result["attachments"] = [_attachment_to_dict(a) for a in task.attachments]
+    if "subtasks" in includes:
+        result["subtasks"] = [_subtask_to_dict(st) for st in task.subtasks]
+    if "logs" in includes:
+        result["logs"] = _log_page(db, task_id, logs_limit, logs_before_id)
+    return result
+
+
+@router.get("/{task_id}/tree")
+@query_budget(4)
+def get_task_tree(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """하위 업무 전체 계층 (모든 깊이). 재귀 CTE 1회로 조회하며
+    각 노드에 하위 전체 기준 descendant_count / descendants_done / rollup_progress 를 포함한다."""
+    _get_accessible_task(db, task_id, current_user)
+    tree = task_tree.load_tree(db, task_id)
+    if tree is None:
+        raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
+    return task_tree.strip_internal(tree)
+
+
 @router.post("/{task_id}/favorite")
 def toggle_favorite(
     task_id: int,
@@ -633,6 +977,19 @@ def update_task(
     if not _check_task_access(task, current_user):
         raise HTTPException(status_code=403, detail="업무를 수정할 권한이 없습니다.")
 
+    if req.progress is not None:
+        progress_only = all(v is None for v in [
+            req.title, req.content, req.assignee_id, req.category_id, req.priority,
+            req.estimated_hours, req.due_date, req.tag_names,
+        ])
+        if progress_only and progress_service.buffer.enabled:
+            # 슬라이더 드래그: 업무별 마지막 값만 모았다가 한 번에 기록 (services/progress.py)
+            progress_service.buffer.put(task.id, max(0, min(100, req.progress)), (current_user.id, time.time()))
+            return {"message": "업무가 수정되었습니다."}
+        # 이 요청이 직접 쓰므로 대기 중인 값이 나중에 덮어쓰지 않게 버린다 (쓰기 전에 호출).
+        # 다른 워커에 대기 중인 값은 아래 progress_at보다 이른 요청이면 기록되지 않는다.
+        progress_service.buffer.discard(task.id)
+
     if req.title is not None:
         task.title = req.title
     if req.content is not None:
@@ -647,8 +1004,10 @@ def update_task(
         task.due_date = req.due_date
     if req.progress is not None:
         task.progress = max(0, min(100, req.progress))
+        task.progress_at = time.time()
     if req.tag_names is not None:
-        task.tags = _get_or_create_tags(db, req.tag_names)
+        _check_tag_names(req.tag_names)
+        task.tags = tags_service.resolve_tags(db, req.tag_names)
 
     reassigned = False
     if req.assignee_id is not None and current_user.id == task.assigner_id:
@@ -668,7 +1027,7 @@ def update_task(
         req.estimated_hours, req.due_date, req.progress, req.tag_names,
     ])
     if other_fields_changed or not reassigned:
-        db.add(TaskLog(task_id=task.id, user_id=current_user.id, action="updated"))
+        task_logs.add_update_log(db, task.id, current_user.id)
     db.commit()
     return {"message": "업무가 수정되었습니다."}
 
@@ -702,14 +1061,15 @@ async def change_status(
     ))
 
     notify_user_id = task.assigner_id if current_user.id == task.assignee_id else task.assignee_id
-    if _check_notify_pref(db, notify_user_id, "notify_status_changed"):
+    prefs = _load_notify_prefs(db, [notify_user_id])
+    if _pref_enabled(prefs, notify_user_id, "notify_status_changed"):
         _add_notification(db, notify_user_id, task.id, "status_changed",
                           f"업무 상태 변경: {task.title} → {req.status}")
     db.commit()
 
     notify_user = db.query(User).filter(User.id == notify_user_id).first()
     try:
-        if notify_user and _check_notify_pref(db, notify_user_id, "email_status_changed"):
+        if notify_user and _pref_enabled(prefs, notify_user_id, "email_status_changed"):
             await send_status_changed(
                 to=notify_user.email,
                 user_name=notify_user.name,
@@ -723,40 +1083,53 @@ async def change_status(
     return {"message": "상태가 변경되었습니다."}
 
 
-@router.get("/{task_id}/logs")
-def get_logs(task_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def _get_accessible_task(db: Session, task_id: int, current_user: User) -> Task:
     task = db.query(Task).filter(Task.id == task_id).first()
     if not task:
         raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
     if not _check_task_access(task, current_user):
         raise HTTPException(status_code=403, detail="이 업무에 접근할 권한이 없습니다.")
+    return task
+
+
+@router.get("/{task_id}/logs")
+@query_budget(5)
+def get_logs(
+    task_id: int,
+    latest: Optional[int] = Query(None, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """업무 이력 (시간순). latest=N이면 최신 N건만 반환 (상세 화면용)."""
+    _get_accessible_task(db, task_id, current_user)
+    if latest:
+        return _log_page(db, task_id, latest)["items"]
 
     logs = (
         db.query(TaskLog)
-        .options(joinedload(TaskLog.user), joinedload(TaskLog.mentions).joinedload(Mention.mentioned_user))
+        .options(joinedload(TaskLog.user), selectinload(TaskLog.mentions).joinedload(Mention.mentioned_user))
         .filter(TaskLog.task_id == task_id)
         .order_by(TaskLog.created_at.asc())
         .all()
     )
-    return [
-        {
-            "id": l.id,
-            "user": {"id": l.user.id, "name": l.user.name} if l.user else None,
-            "action": l.action,
-            "old_value": l.old_value,
-            "new_value": l.new_value,
-            "comment": l.comment,
-            "mentions": [
-                {"user_id": m.mentioned_user_id, "name": m.mentioned_user.name}
-                for m in l.mentions
-            ],
-            "created_at": l.created_at.isoformat(),
-        }
-        for l in logs
-    ]
+    return task_logs.archived_logs(db, task_id) + [task_logs.log_to_dict(l) for l in logs]
+
+
+@router.get("/{task_id}/activity")
+def get_activity(
+    task_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """이력 피드 (최신 limit건, keyset pagination). 다음 페이지는 next_before_id로 조회."""
+    _get_accessible_task(db, task_id, current_user)
+    return _log_page(db, task_id, limit, before_id)
 
 
 @router.post("/{task_id}/comment")
+@query_budget(10)
 def add_comment(
     task_id: int,
     req: CommentRequest,
@@ -782,21 +1155,27 @@ def add_comment(
 
     # @멘션 파싱 후 알림 생성
     mentioned_users = _parse_mentions(req.comment, db)
+    other_party_id = task.assigner_id if current_user.id == task.assignee_id else task.assignee_id
+    prefs = _load_notify_prefs(db, {u.id for u in mentioned_users} | {other_party_id})
+    mentions, notifications = [], []
     for mentioned_user in mentioned_users:
         if mentioned_user.id == current_user.id:
             continue
-        db.add(Mention(log_id=log.id, mentioned_user_id=mentioned_user.id))
-        if _check_notify_pref(db, mentioned_user.id, "notify_mentioned"):
-            _add_notification(
-                db, mentioned_user.id, task_id, "mentioned",
-                f"{current_user.name}님이 댓글에서 멘션했습니다: {task.title}",
-            )
+        mentions.append({"log_id": log.id, "mentioned_user_id": mentioned_user.id})
+        if _pref_enabled(prefs, mentioned_user.id, "notify_mentioned"):
+            notifications.append({
+                "user_id": mentioned_user.id, "task_id": task_id, "type": "mentioned",
+                "message": f"{current_user.name}님이 댓글에서 멘션했습니다: {task.title}",
+            })
+    if mentions:
+        db.execute(insert(Mention), mentions)
+    if notifications:
+        db.execute(insert(Notification), notifications)
 
     # 댓글 알림: 상대방에게 알림 (멘션 외)
-    other_party_id = task.assigner_id if current_user.id == task.assignee_id else task.assignee_id
     mentioned_ids = {u.id for u in mentioned_users}
     if other_party_id not in mentioned_ids and other_party_id != current_user.id:
-        if _check_notify_pref(db, other_party_id, "notify_commented"):
+        if _pref_enabled(prefs, other_party_id, "notify_commented"):
             _add_notification(
                 db, other_party_id, task_id, "commented",
                 f"{current_user.name}님이 댓글을 작성했습니다: {task.title}",
@@ -846,31 +1225,14 @@ def delete_task(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    task = db.query(Task).options(
-        joinedload(Task.subtasks).joinedload(Task.attachments),
-        joinedload(Task.attachments),
-    ).filter(Task.id == task_id).first()
+    task = db.query(Task).filter(Task.id == task_id).first()
     if not task:
         raise HTTPException(status_code=404, detail="업무를 찾을 수 없습니다.")
     if current_user.id != task.assigner_id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="업무를 삭제할 권한이 없습니다.")
 
-    all_attachments = list(task.attachments)
-    for subtask in task.subtasks:
-        all_attachments.extend(subtask.attachments)
-    for att in all_attachments:
-        fpath = os.path.join(_settings.file_storage_path, att.stored_name)
-        if os.path.exists(fpath):
-            try:
-                os.remove(fpath)
-            except OSError:
-                pass
-
-    for subtask in list(task.subtasks):
-        db.delete(subtask)
-    db.flush()
-    db.delete(task)
-    db.commit()
+    # 모든 깊이의 하위 업무와 첨부 파일까지 함께 삭제
+    task_tree.delete_subtree(db, task_id, _settings.file_storage_path)
 
 
 @router.patch("/{task_id}/comments/{log_id}")
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 from pydantic import BaseModel
 from app.database import get_db
 from app.models.user import User, Department, UserNotificationPreference, FilterPreset
 from app.utils.auth import get_current_user
+from app.utils.query_budget import query_budget
+from app.services import response_cache
 from datetime import date
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -42,16 +44,22 @@ class FilterPresetCreate(BaseModel):
 
 
 @router.get("/departments/list")
-def departments_list(db: Session = Depends(get_db)):
+def departments_list(request: Request, db: Session = Depends(get_db)):
     """인증 없이 가입 화면에서 사용하는 부서 목록 (DB 기반)"""
-    depts = db.query(Department).order_by(Department.name).all()
-    return [d.name for d in depts]
+    def build():
+        return [d.name for d in db.query(Department).order_by(Department.name).all()]
+    return response_cache.cached_json(
+        request, "departments:names", ("departments",), build, cache_control="public, no-cache"
+    )
 
 
 @router.get("/departments")
-def list_departments(db: Session = Depends(get_db), _: User = Depends(get_current_user)):
-    depts = db.query(Department).order_by(Department.name).all()
-    return [{"id": d.id, "name": d.name} for d in depts]
+@query_budget(3)
+def list_departments(request: Request, db: Session = Depends(get_db), _: User = Depends(get_current_user)):
+    def build():
+        depts = db.query(Department).order_by(Department.name).all()
+        return [{"id": d.id, "name": d.name} for d in depts]
+    return response_cache.cached_json(request, "departments", ("departments",), build)
 
 
 @router.get("/me/notification-preferences")
@@ -174,18 +182,22 @@ def delete_filter_preset(
 
 
 @router.get("/")
-def list_users(db: Session = Depends(get_db), _: User = Depends(get_current_user)):
-    users = db.query(User).filter(User.is_active == True).all()
-    return [
-        {
-            "id": u.id,
-            "name": u.name,
-            "email": u.email,
-            "department": u.department.name if u.department else "",
-            "job_title": u.job_title,
-        }
-        for u in users
-    ]
+@query_budget(3)
+def list_users(request: Request, db: Session = Depends(get_db), _: User = Depends(get_current_user)):
+    def build():
+        users = db.query(User).options(joinedload(User.department)).filter(User.is_active == True).all()
+        return [
+            {
+                "id": u.id,
+                "name": u.name,
+                "email": u.email,
+                "department": u.department.name if u.department else "",
+                "job_title": u.job_title,
+            }
+            for u in users
+        ]
+    # 부서명 변경도 목록에 반영되어야 하므로 departments 버전도 함께 사용
+    return response_cache.cached_json(request, "users", ("users", "departments"), build)
 
 
 @router.get("/{user_id}")
@@ -0,0 +1,191 @@
+"""관리자 일괄 업무 이관 — 청크 단위 set-based UPDATE
+
+퇴사자처럼 미완료 업무가 수천 건인 경우 한 트랜잭션으로 처리하면 tasks 테이블 잠금이
+길어져 다른 사용자 요청이 타임아웃된다. 업무 ID 순으로 CHUNK_SIZE 건씩 잠그고
+UPDATE·로그·알림을 일괄 처리한 뒤 바로 커밋하며, 진행 상황(last_task_id)을 같은
+트랜잭션에 기록하므로 중단되더라도 마지막 청크 이후부터 안전하게 재개할 수 있다.
+실행 권한은 조건부 UPDATE(claim_job)로 한 실행자만 얻으며, running 상태라도 청크 커밋마다
+갱신되는 updated_at이 STALE_SECONDS 넘게 멈춰 있으면(서버 재시작 등) 다시 가져갈 수 있다.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import select, update, insert, func
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.job import BulkJob
+from app.models.task import Task, TaskLog, Notification, StatusEnum
+from app.models.user import User
+
+JOB_TYPE = "bulk_reassign"
+CHUNK_SIZE = 500
+# running 작업의 updated_at(청크마다 갱신)이 이보다 오래 멈춰 있으면 중단된 것으로 본다
+STALE_SECONDS = 600
+
+
+def _target_filters(from_user_id: int, task_ids: Optional[List[int]]) -> list:
+    filters = [
+        Task.assignee_id == from_user_id,
+        Task.status != StatusEnum.approved,
+    ]
+    if task_ids:
+        filters.append(Task.id.in_(task_ids))
+    return filters
+
+
+def count_reassignable(db: Session, from_user_id: int, task_ids: Optional[List[int]] = None) -> int:
+    """이관 대상 업무 수 (dry-run 및 진행률 계산용)"""
+    return db.execute(
+        select(func.count(Task.id)).where(*_target_filters(from_user_id, task_ids))
+    ).scalar_one()
+
+
+def create_job(
+    db: Session,
+    created_by: int,
+    from_user_id: int,
+    to_user_id: int,
+    task_ids: Optional[List[int]],
+    total: int,
+    chunk_size: int = CHUNK_SIZE,
+) -> BulkJob:
+    job = BulkJob(
+        job_type=JOB_TYPE,
+        created_by=created_by,
+        params=json.dumps({
+            "from_user_id": from_user_id,
+            "to_user_id": to_user_id,
+            "task_ids": task_ids,
+            "chunk_size": chunk_size,
+        }),
+        status="pending",
+        total=total,
+        processed=0,
+        last_task_id=0,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _process_chunk(db: Session, job: BulkJob, params: dict, from_name: str, to_name: str) -> int:
+    """한 청크를 잠그고 이관한 뒤 커밋. 처리한 건수 반환 (0이면 완료)."""
+    rows = db.execute(
+        select(Task.id, Task.title)
+        .where(*_target_filters(params["from_user_id"], params.get("task_ids")), Task.id > job.last_task_id)
+        .order_by(Task.id)
+        .limit(params.get("chunk_size") or CHUNK_SIZE)
+        .with_for_update()
+    ).all()
+    if not rows:
+        return 0
+
+    ids = [r.id for r in rows]
+    db.execute(
+        update(Task)
+        .where(Task.id.in_(ids))
+        .values(assignee_id=params["to_user_id"])
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(insert(TaskLog), [
+        {
+            "task_id": r.id,
+            "user_id": job.created_by,
+            "action": "reassigned",
+            "old_value": from_name,
+            "new_value": to_name,
+            "comment": f"관리자에 의한 일괄 이관: {from_name} → {to_name}",
+        }
+        for r in rows
+    ])
+    db.execute(insert(Notification), [
+        {
+            "user_id": params["to_user_id"],
+            "task_id": r.id,
+            "type": "reassigned",
+            "message": f"업무가 이관되었습니다: {r.title}",
+            "is_read": False,
+        }
+        for r in rows
+    ])
+    job.processed = (job.processed or 0) + len(ids)
+    job.last_task_id = ids[-1]
+    db.commit()
+    return len(ids)
+
+
+def _stale_before(db: Session) -> datetime:
+    # updated_at은 DB 시각(func.now())으로 기록되므로 기준도 DB 시각으로 계산
+    return db.execute(select(func.now())).scalar_one() - timedelta(seconds=STALE_SECONDS)
+
+
+def is_stale(db: Session, job: BulkJob) -> bool:
+    """running 작업의 실행자가 멈췄는지 (재개 허용 여부)"""
+    return job.updated_at is not None and job.updated_at < _stale_before(db)
+
+
+def claim_job(db: Session, job_id: int) -> bool:
+    """pending/failed 또는 멈춘 running 작업을 running으로 바꾼다 — 조건부 UPDATE라 한 실행자만 성공"""
+    result = db.execute(
+        update(BulkJob)
+        .where(
+            BulkJob.id == job_id,
+            (BulkJob.status.in_(("pending", "failed")))
+            | ((BulkJob.status == "running") & (BulkJob.updated_at < _stale_before(db))),
+        )
+        .values(status="running", error=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def run_job(job_id: int) -> None:
+    """BackgroundTasks/재개 요청에서 호출. 자체 세션을 사용한다."""
+    db: Session = SessionLocal()
+    try:
+        if not claim_job(db, job_id):
+            return  # 완료됐거나 다른 실행자가 처리 중
+        job = db.get(BulkJob, job_id)
+        params = json.loads(job.params)
+        from_user = db.get(User, params["from_user_id"])
+        to_user = db.get(User, params["to_user_id"])
+        if not from_user or not to_user:
+            job.status = "failed"
+            job.error = "이관 사용자를 찾을 수 없습니다."
+            db.commit()
+            return
+
+        try:
+            while _process_chunk(db, job, params, from_user.name, to_user.name):
+                pass
+        except Exception as e:
+            db.rollback()
+            job.status = "failed"
+            job.error = str(e)[:1000]
+            db.commit()
+            return
+
+        job.status = "done"
+        job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+    finally:
+        db.close()
+
+
+def job_to_dict(job: BulkJob) -> dict:
+    total = job.total or 0
+    processed = job.processed or 0
+    return {
+        "id": job.id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "total": total,
+        "processed": processed,
+        "percent": round(processed * 100 / total, 1) if total else 100.0,
+        "last_task_id": job.last_task_id,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
@@ -0,0 +1,169 @@
+"""스케줄러 리더 선출 (멀티 워커에서 예약 작업을 한 프로세스만 실행)
+
+워커마다 lifespan에서 SchedulerElection을 시작하면, 잠금을 얻은 프로세스 하나만
+on_elected(스케줄러 시작)를 실행한다. 나머지는 interval마다 다시 시도하므로 리더 워커가
+재시작·종료되어 잠금이 풀리면 다른 워커가 이어받는다.
+- file:     fcntl.flock 파일 잠금 — 같은 서버의 워커끼리 (기본)
+- database: MySQL GET_LOCK — 여러 서버에 나눠 띄울 때. 잠금을 잡은 연결이 끊기면
+            리더를 내려놓고(on_resign) 다시 선출에 참여한다.
+- none:     선출 없이 모든 프로세스가 실행 (단일 워커 개발 환경)
+"""
+import asyncio
+import logging
+import os
+import tempfile
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from app.utils import metrics
+
+logger = logging.getLogger("leader")
+
+LOCK_NAME = "collab_todo_scheduler"
+
+IS_LEADER = metrics.Gauge("collab_scheduler_leader", "이 프로세스가 스케줄러 리더인지 (1/0)")
+
+
+class FileLock:
+    name = "file"
+
+    def __init__(self, path: str = ""):
+        self.path = path or os.path.join(tempfile.gettempdir(), f"{LOCK_NAME}.lock")
+        self._fd = None
+
+    def acquire(self) -> bool:
+        import fcntl
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def is_held(self) -> bool:
+        return self._fd is not None
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # 닫으면 flock도 풀린다
+            self._fd = None
+
+
+class DatabaseLock:
+    name = "database"
+
+    def __init__(self, database_url: str):
+        # 잠금은 연결에 묶이므로 풀·pool_recycle과 무관한 전용 연결을 쓴다
+        self._engine = create_engine(database_url, poolclass=NullPool)
+        self._conn = None
+
+    def acquire(self) -> bool:
+        conn = self._engine.connect()
+        try:
+            got = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": LOCK_NAME}).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if got == 1:
+            self._conn = conn
+            return True
+        conn.close()
+        return False
+
+    def is_held(self) -> bool:
+        if self._conn is None:
+            return False
+        try:
+            return self._conn.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": LOCK_NAME}
+            ).scalar() == 1
+        except Exception:
+            self._conn = None
+            return False
+
+    def release(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+            finally:
+                self._conn.close()
+                self._conn = None
+
+
+class AlwaysLeader:
+    name = "none"
+
+    def acquire(self) -> bool:
+        return True
+
+    def is_held(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+
+def make_lock(kind: str, database_url: str = "", path: str = ""):
+    if kind == "file":
+        return FileLock(path)
+    if kind == "database":
+        return DatabaseLock(database_url)
+    if kind == "none":
+        return AlwaysLeader()
+    raise ValueError(f"SCHEDULER_LOCK은 file, database, none 중 하나여야 합니다: {kind}")
+
+
+class SchedulerElection:
+    def __init__(self, lock, on_elected, on_resign, interval: float = 15.0):
+        self.lock = lock
+        self.on_elected = on_elected
+        self.on_resign = on_resign
+        self.interval = interval
+        self.leader = False
+        self._task = None
+
+    def _set_leader(self, leader: bool) -> None:
+        self.leader = leader
+        IS_LEADER.set(1 if leader else 0)
+        if leader:
+            logger.info("스케줄러 리더로 선출됨 (pid=%s, lock=%s)", os.getpid(), self.lock.name)
+            self.on_elected()
+        else:
+            logger.warning("스케줄러 리더 잠금을 잃음 (pid=%s) — 다시 선출에 참여", os.getpid())
+            self.on_resign()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self.leader:
+                    if await run_in_threadpool(self.lock.acquire):
+                        self._set_leader(True)
+                elif not await run_in_threadpool(self.lock.is_held):
+                    self._set_leader(False)
+            except Exception as e:
+                logger.warning("스케줄러 리더 선출 오류: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        IS_LEADER.set(0)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self.leader:
+            self.leader = False
+            self.on_resign()
+        await run_in_threadpool(self.lock.release)
+        IS_LEADER.set(0)
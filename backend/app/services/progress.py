@@ -0,0 +1,59 @@
+"""진행률만 바꾸는 PATCH의 쓰기 합치기
+
+진행률 슬라이더는 움직일 때마다 PATCH를 보내 쓰기 요청 대부분을 차지한다. 진행률만 바꾸는
+요청은 권한 확인 후 바로 응답하고, 업무별 마지막 값을 PROGRESS_COALESCE_MS 동안 모았다가
+UPDATE 한 번(CASE)과 업무당 "updated" 이력 하나(task_logs.add_update_log)로 기록한다.
+updated_at도 그때 갱신되므로 증분 동기화·목록 새로고침은 기록 후 변경을 받는다.
+조회 응답은 overlay()로 기록 전 값을 바로 보여 준다 (같은 워커 기준, 다른 워커는 최대 한 주기 늦음).
+버퍼는 워커마다 있으므로 값마다 요청 시각을 같이 들고, tasks.progress_at(지금 값을 정한 요청의
+시각)보다 나중 요청일 때만 기록한다 — 다른 워커가 먼저 기록한 더 새 값이나 그 사이의 직접 수정
+(진행률을 함께 바꾸는 PATCH도 progress_at을 적는다)을 늦게 기록되는 옛 값이 덮어쓰지 않는다.
+PROGRESS_COALESCE_MS=0이면 끄고 요청마다 바로 기록한다.
+"""
+import logging
+from sqlalchemy import select, update, case, or_
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services import task_logs
+from app.utils.write_buffer import WriteBuffer
+
+logger = logging.getLogger("progress")
+
+
+def _flush(items: dict) -> None:
+    """items: 업무 ID → (진행률, (마지막으로 바꾼 사용자 ID, 그 요청 시각))"""
+    db = SessionLocal()
+    try:
+        # 그 사이 삭제된 업무(이력 FK)와 더 나중 요청이 이미 진행률을 쓴 업무는 건너뛴다.
+        # 행을 잠가 두어 확인과 기록 사이에 다른 워커의 기록이 끼어들지 않게 한다.
+        requested_at = case({task_id: meta[1] for task_id, (_, meta) in items.items()}, value=Task.id)
+        task_ids = db.execute(
+            select(Task.id)
+            .where(Task.id.in_(list(items)), or_(Task.progress_at.is_(None), Task.progress_at < requested_at))
+            .with_for_update()
+        ).scalars().all()
+        if not task_ids:
+            db.rollback()
+            return
+        db.execute(
+            update(Task).where(Task.id.in_(task_ids))
+            .values(
+                progress=case({task_id: items[task_id][0] for task_id in task_ids}, value=Task.id),
+                progress_at=case({task_id: items[task_id][1][1] for task_id in task_ids}, value=Task.id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        for task_id in task_ids:
+            task_logs.add_update_log(db, task_id, items[task_id][1][0])
+        db.commit()
+    finally:
+        db.close()
+
+
+buffer = WriteBuffer("task_progress", get_settings().progress_coalesce_ms / 1000, _flush)
+
+
+def overlay(task_id: int, progress):
+    """기록 전 진행률이 있으면 그 값 (조회 응답용)"""
+    return buffer.get(task_id, progress)
@@ -0,0 +1,194 @@
+"""참조 데이터 응답 캐시 — 데이터 버전별로 한 번만 직렬화하고 ETag/304로 재검증
+
+카테고리·부서·사용자 목록은 거의 바뀌지 않지만 화면마다 호출된다. 응답 본문을
+(네임스페이스 버전 조합) 단위로 미리 직렬화해 두고, 본문 해시를 강한 ETag로 내려준다.
+If-None-Match가 일치하면 본문 없이 304를 반환한다.
+
+버전은 ORM 세션 이벤트로 자동 증가한다. 감시 대상 테이블에 INSERT/DELETE 또는
+목록에 노출되는 컬럼의 UPDATE가 커밋되면 해당 네임스페이스 버전이 올라간다.
+워커가 여럿이면 다른 워커의 변경도 알아야 하므로 같은 트랜잭션에서 cache_versions 행도
+올리고, 각 워커는 VERSION_CHECK_SECONDS마다 그 테이블을 읽어 버전을 맞춘다.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, inspect, select, update, insert
+from sqlalchemy.orm import Session
+from app import database
+from app.models.cache import CacheVersion
+
+logger = logging.getLogger("response_cache")
+
+# 다른 경로(직접 SQL 등)로 바뀐 데이터도 이 시간 안에는 반영되도록 하는 상한
+MAX_AGE_SECONDS = 300
+# 다른 워커가 커밋한 변경을 확인하는 주기 (이 시간 안에 반영)
+VERSION_CHECK_SECONDS = 1.0
+
+# 테이블 → (네임스페이스, 변경 감지 대상 컬럼; None이면 모든 컬럼)
+_WATCHED: Dict[str, Tuple[str, Optional[set]]] = {
+    "categories": ("categories", None),
+    "departments": ("departments", None),
+    "users": ("users", {"name", "email", "department_id", "job_title", "is_active"}),
+}
+
+_versions: Dict[str, int] = {}
+_entries: Dict[str, Tuple[tuple, float, bytes, str]] = {}  # key → (버전, 생성 시각, 본문, ETag)
+_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def bump(*namespaces: str) -> None:
+    with _lock:
+        for ns in namespaces:
+            _versions[ns] = _versions.get(ns, 0) + 1
+
+
+def _refresh() -> None:
+    """cache_versions를 읽어 다른 워커의 변경을 반영 (VERSION_CHECK_SECONDS에 한 번)"""
+    global _checked_at
+    now = time.monotonic()
+    with _lock:
+        if now - _checked_at < VERSION_CHECK_SECONDS:
+            return
+        _checked_at = now
+    try:
+        with database.engine.connect() as conn:
+            rows = conn.execute(select(CacheVersion.namespace, CacheVersion.version)).all()
+    except Exception as e:
+        logger.warning("응답 캐시 버전 조회 실패 (이 워커의 변경만 반영): %s", e)
+        return
+    with _lock:
+        for namespace, version in rows:
+            # 조회 직후 이 워커가 올린 값을 되돌리지 않도록 큰 값을 유지
+            _versions[namespace] = max(_versions.get(namespace, 0), version)
+
+
+def _current(namespaces: Iterable[str]) -> tuple:
+    _refresh()
+    with _lock:
+        return tuple(_versions.get(ns, 0) for ns in namespaces)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [c.strip() for c in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def cached_json(
+    request: Request,
+    key: str,
+    namespaces: Tuple[str, ...],
+    build: Callable[[], object],
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """key에 대한 미리 직렬화된 JSON 응답. 버전이 바뀌었거나 만료됐을 때만 build() 호출."""
+    version = _current(namespaces)
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(key)
+    if entry is None or entry[0] != version or now - entry[1] > MAX_AGE_SECONDS:
+        # 버전을 build 전에 읽으므로 그 사이 커밋된 변경은 다음 요청에서 다시 빌드된다
+        body = json.dumps(
+            jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = (version, now, body, etag)
+        with _lock:
+            _entries[key] = entry
+
+    _, _, body, etag = entry
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+
+
+# ── ORM 변경 감지 ─────────────────────────────────────────
+def _pending(session: Session) -> set:
+    return session.info.setdefault("response_cache_bumps", set())
+
+
+def _share(session: Session) -> None:
+    """감지한 네임스페이스의 cache_versions 행을 같은 트랜잭션에서 올린다 (커밋돼야 보임)"""
+    pending = session.info.get("response_cache_bumps")
+    if not pending:
+        return
+    shared = session.info.setdefault("response_cache_shared", set())
+    conn = session.connection()
+    for namespace in sorted(pending - shared):  # 잠금 순서 고정
+        result = conn.execute(
+            update(CacheVersion).where(CacheVersion.namespace == namespace)
+            .values(version=CacheVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            conn.execute(insert(CacheVersion).values(namespace=namespace, version=1))
+        shared.add(namespace)
+
+
+def _changed_namespace(obj, is_dirty: bool) -> Optional[str]:
+    table = getattr(obj, "__tablename__", None)
+    watched = _WATCHED.get(table)
+    if not watched:
+        return None
+    namespace, columns = watched
+    if not is_dirty or columns is None:
+        return namespace
+    state = inspect(obj)
+    for col in columns:
+        if col in state.attrs and state.attrs[col].history.has_changes():
+            return namespace
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session: Session, flush_context) -> None:
+    for objs, is_dirty in ((session.new, False), (session.deleted, False), (session.dirty, True)):
+        for obj in objs:
+            ns = _changed_namespace(obj, is_dirty)
+            if ns:
+                _pending(session).add(ns)
+    _share(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_execute(orm_execute_state) -> None:
+    # query.update()/delete(), update()/insert() 구문은 flush를 거치지 않으므로 별도로 감지
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    watched = _WATCHED.get(getattr(table, "name", None))
+    if watched:
+        _pending(orm_execute_state.session).add(watched[0])
+
+
+@event.listens_for(Session, "before_commit")
+def _before_commit(session: Session) -> None:
+    # 일괄 UPDATE/DELETE 구문으로 감지한 변경 (flush로 감지한 것은 after_flush에서 처리)
+    _share(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    session.info.pop("response_cache_shared", None)
+    namespaces = session.info.pop("response_cache_bumps", None)
+    if namespaces:
+        bump(*namespaces)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop("response_cache_bumps", None)
+    session.info.pop("response_cache_shared", None)
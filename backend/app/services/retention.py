@@ -0,0 +1,173 @@
+"""알림 보존 정책 — 오래된 알림을 보관 테이블로 옮기고 보관 기간이 지나면 삭제
+
+notifications는 배정·상태 변경·댓글·멘션·마감 알림·공지마다 행이 쌓이므로 그대로 두면
+(user_id, is_read) 조회와 created_at 탐색이 계속 느려진다. 외래 키가 있어 MySQL 파티셔닝은
+쓸 수 없으므로, 기준일이 지난 행을 ID 순으로 batch_size건씩 notifications_archive
+(외래 키 없이 인덱스 하나, 압축 행 형식)에 복사·삭제하고 배치마다 커밋한다. 잠금은 배치
+하나 동안만 유지되고, 배치 사이에는 잠시 쉬어 다른 요청이 끼어들 수 있게 한다.
+기준 일수는 system_settings에서 읽는다 (없으면 DEFAULTS, 0이면 그 단계를 건너뜀).
+- notification_read_retention_days:     읽은 알림 → 보관
+- notification_retention_days:          읽지 않은 알림도 → 보관
+- notification_archive_retention_days:  보관 테이블에서 삭제
+스케줄러가 매일 새벽 실행하고, 관리자는 /api/admin/retention 으로 상태 확인·즉시 실행한다.
+"""
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import select, insert, delete, func, and_, or_
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.task import Notification, NotificationArchive
+from app.models.user import SystemSettings
+from app.utils import metrics
+
+logger = logging.getLogger("retention")
+
+DEFAULTS = {
+    "notification_read_retention_days": 30,
+    "notification_retention_days": 180,
+    "notification_archive_retention_days": 730,
+    "retention_batch_size": 1000,
+}
+REPORT_KEY = "retention_last_report"
+BATCH_PAUSE = 0.05  # 배치 사이 대기(초)
+MAX_BATCHES = 10000  # 한 번 실행의 상한 (batch_size 1000이면 1천만 행)
+
+RETENTION_ROWS = metrics.Counter(
+    "collab_retention_rows_total", "보존 정책으로 처리한 행 수", ("table", "action"))
+
+_ARCHIVE_COLUMNS = ("id", "user_id", "task_id", "type", "message", "is_read", "created_at")
+
+
+def load_policy(db: Session) -> dict:
+    rows = dict(db.execute(
+        select(SystemSettings.key, SystemSettings.value).where(SystemSettings.key.in_(DEFAULTS))
+    ).all())
+    policy = {}
+    for key, default in DEFAULTS.items():
+        try:
+            policy[key] = max(int(rows.get(key, default)), 0)
+        except (TypeError, ValueError):
+            logger.warning("system_settings.%s 값이 정수가 아님 (%r) — 기본값 %s 사용", key, rows[key], default)
+            policy[key] = default
+    policy["retention_batch_size"] = policy["retention_batch_size"] or DEFAULTS["retention_batch_size"]
+    return policy
+
+
+def _archive_filter(policy: dict, now: datetime):
+    conditions = []
+    if policy["notification_read_retention_days"]:
+        cutoff = now - timedelta(days=policy["notification_read_retention_days"])
+        conditions.append(and_(Notification.is_read == True, Notification.created_at < cutoff))
+    if policy["notification_retention_days"]:
+        conditions.append(Notification.created_at < now - timedelta(days=policy["notification_retention_days"]))
+    return or_(*conditions) if conditions else None
+
+
+def pending_counts(db: Session, policy: dict, now: Optional[datetime] = None) -> dict:
+    """다음 실행 때 처리될 행 수 (관리자 화면의 미리보기)"""
+    now = now or datetime.now()
+    condition = _archive_filter(policy, now)
+    archive_days = policy["notification_archive_retention_days"]
+    return {
+        "notifications": db.execute(select(func.count(Notification.id))).scalar_one(),
+        "archive": db.execute(select(func.count(NotificationArchive.id))).scalar_one(),
+        "to_archive": 0 if condition is None else db.execute(
+            select(func.count(Notification.id)).where(condition)).scalar_one(),
+        "to_purge": 0 if not archive_days else db.execute(
+            select(func.count(NotificationArchive.id)).where(
+                NotificationArchive.created_at < now - timedelta(days=archive_days))).scalar_one(),
+    }
+
+
+def archive_notifications(db: Session, policy: dict, now: Optional[datetime] = None, pause: float = BATCH_PAUSE) -> int:
+    """기준일이 지난 알림을 배치 단위로 보관 테이블에 옮긴다. 옮긴 행 수 반환."""
+    condition = _archive_filter(policy, now or datetime.now())
+    if condition is None:
+        return 0
+    moved = 0
+    for _ in range(MAX_BATCHES):
+        ids = db.execute(
+            select(Notification.id).where(condition).order_by(Notification.id)
+            .limit(policy["retention_batch_size"])
+        ).scalars().all()
+        if not ids:
+            break
+        source = select(*(getattr(Notification, c) for c in _ARCHIVE_COLUMNS)).where(Notification.id.in_(ids))
+        db.execute(insert(NotificationArchive).from_select(_ARCHIVE_COLUMNS, source))
+        db.execute(delete(Notification).where(Notification.id.in_(ids)))
+        db.commit()
+        moved += len(ids)
+        RETENTION_ROWS.inc(len(ids), table="notifications", action="archived")
+        if len(ids) < policy["retention_batch_size"]:
+            break
+        time.sleep(pause)
+    return moved
+
+
+def purge_archive(db: Session, policy: dict, now: Optional[datetime] = None, pause: float = BATCH_PAUSE) -> int:
+    """보관 기간이 지난 보관 알림을 배치 단위로 삭제. 삭제한 행 수 반환."""
+    days = policy["notification_archive_retention_days"]
+    if not days:
+        return 0
+    cutoff = (now or datetime.now()) - timedelta(days=days)
+    purged = 0
+    for _ in range(MAX_BATCHES):
+        ids = db.execute(
+            select(NotificationArchive.id).where(NotificationArchive.created_at < cutoff)
+            .order_by(NotificationArchive.id).limit(policy["retention_batch_size"])
+        ).scalars().all()
+        if not ids:
+            break
+        db.execute(delete(NotificationArchive).where(NotificationArchive.id.in_(ids)))
+        db.commit()
+        purged += len(ids)
+        RETENTION_ROWS.inc(len(ids), table="notifications_archive", action="purged")
+        if len(ids) < policy["retention_batch_size"]:
+            break
+        time.sleep(pause)
+    return purged
+
+
+def save_report(db: Session, report: dict, key: str = REPORT_KEY,
+                description: str = "마지막 보존 작업 결과 (자동 기록)") -> None:
+    value = json.dumps(report, ensure_ascii=False)
+    setting = db.get(SystemSettings, key)
+    if setting is None:
+        db.add(SystemSettings(key=key, value=value, description=description))
+    else:
+        setting.value = value
+    db.commit()
+
+
+def last_report(db: Session, key: str = REPORT_KEY) -> Optional[dict]:
+    setting = db.get(SystemSettings, key)
+    return json.loads(setting.value) if setting else None
+
+
+def run(db: Optional[Session] = None, pause: float = BATCH_PAUSE) -> dict:
+    """보존 정책 전체 실행 — 결과를 system_settings에 기록하고 반환 (스케줄러는 스레드풀에서 호출)"""
+    own = db is None
+    db = db or SessionLocal()
+    try:
+        started = time.perf_counter()
+        now = datetime.now()
+        policy = load_policy(db)
+        archived = archive_notifications(db, policy, now, pause)
+        purged = purge_archive(db, policy, now, pause)
+        report = {
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - started, 2),
+            "archived": archived,
+            "purged": purged,
+            "reclaimed": archived + purged,  # notifications에서 빠진 행 + 보관 테이블에서 지운 행
+            "policy": policy,
+        }
+        save_report(db, report)
+        logger.info("알림 보존 작업: 보관 %d건, 삭제 %d건 (%.1f초)", archived, purged, report["seconds"])
+        return report
+    finally:
+        if own:
+            db.close()
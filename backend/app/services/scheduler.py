@@ -1,44 +1,76 @@
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from sqlalchemy.orm import Session
-from datetime import date, timedelta
+import functools
+import time
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload
+from datetime import date, datetime, timedelta
+from starlette.concurrency import run_in_threadpool
 from app.database import SessionLocal
 from app.models.task import Task, Notification, StatusEnum
 from app.utils.email import send_due_soon_reminder
+from app.services import stats, retention, task_logs, token_cleanup
+from app.utils import lazy, metrics
 
-scheduler = AsyncIOScheduler()
+# 리더로 선출된 워커만 스케줄러를 띄우므로 apscheduler는 그때 불러온다
+apscheduler_asyncio = lazy.module("apscheduler.schedulers.asyncio")
+scheduler = None
 
+JOB_DURATION = metrics.Histogram(
+    "collab_scheduler_job_duration_seconds", "스케줄러 작업 실행 시간", ("job",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+JOB_RUNS = metrics.Counter("collab_scheduler_job_runs_total", "스케줄러 작업 실행 횟수", ("job", "result"))
 
+
+def _timed(func):
+    """작업 실행 시간·성공 여부를 메트릭으로 기록"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = "error"
+        try:
+            value = await func(*args, **kwargs)
+            result = "success"
+            return value
+        finally:
+            JOB_DURATION.observe(time.perf_counter() - start, job=func.__name__)
+            JOB_RUNS.inc(job=func.__name__, result=result)
+    return wrapper
+
+
+@_timed
 async def check_due_soon():
     db: Session = SessionLocal()
     try:
         today = date.today()
         for days in [3, 1]:
             target_date = today + timedelta(days=days)
-            tasks = db.query(Task).filter(
+            tasks = db.query(Task).options(joinedload(Task.assignee)).filter(
                 Task.due_date == target_date,
                 Task.status.notin_([StatusEnum.approved]),
             ).all()
+            if not tasks:
+                continue
 
+            # 중복 알림 방지: 이미 보낸 (사용자, 업무) 쌍을 한 번에 조회
+            already = {
+                (user_id, task_id) for user_id, task_id in db.query(Notification.user_id, Notification.task_id).filter(
+                    Notification.task_id.in_([t.id for t in tasks]),
+                    Notification.type == f"due_soon_{days}d",
+                )
+            }
+
+            notifications = []
             for task in tasks:
                 assignee = task.assignee
-                if not assignee:
+                if not assignee or (assignee.id, task.id) in already:
                     continue
 
-                # 중복 알림 방지
-                already = db.query(Notification).filter(
-                    Notification.user_id == assignee.id,
-                    Notification.task_id == task.id,
-                    Notification.type == f"due_soon_{days}d",
-                ).first()
-                if already:
-                    continue
-
-                db.add(Notification(
-                    user_id=assignee.id,
-                    task_id=task.id,
-                    type=f"due_soon_{days}d",
-                    message=f"마감 {days}일 전 알림: {task.title}",
-                ))
+                notifications.append({
+                    "user_id": assignee.id,
+                    "task_id": task.id,
+                    "type": f"due_soon_{days}d",
+                    "message": f"마감 {days}일 전 알림: {task.title}",
+                })
 
                 try:
                     await send_due_soon_reminder(
@@ -51,15 +83,63 @@ async def check_due_soon():
                 except Exception:
                     pass
 
+            if notifications:
+                db.execute(insert(Notification), notifications)
+
         db.commit()
     finally:
         db.close()
 
 
+@_timed
+async def refresh_task_stats():
+    db: Session = SessionLocal()
+    try:
+        stats.refresh_today(db)
+    finally:
+        db.close()
+
+
+@_timed
+async def run_retention():
+    # 배치마다 커밋·대기하며 오래 걸릴 수 있으므로 이벤트 루프를 막지 않게 스레드에서 실행
+    await run_in_threadpool(retention.run)
+
+
+@_timed
+async def archive_task_logs():
+    await run_in_threadpool(task_logs.run)
+
+
+@_timed
+async def purge_tokens():
+    await run_in_threadpool(token_cleanup.run)
+
+
 def start_scheduler():
-    scheduler.add_job(check_due_soon, "cron", hour=9, minute=0, timezone="Asia/Seoul")  # 매일 오전 9시 KST
+    """리더로 선출된 프로세스에서만 호출 (리더가 바뀌면 다시 호출되므로 작업 ID로 중복 등록 방지)"""
+    global scheduler
+    if scheduler is None:
+        scheduler = apscheduler_asyncio.AsyncIOScheduler()
+    scheduler.add_job(check_due_soon, "cron", hour=9, minute=0, timezone="Asia/Seoul",  # 매일 오전 9시 KST
+                      id="check_due_soon", replace_existing=True, misfire_grace_time=3600)
+    # 당일 통계 롤업 갱신 (10분마다, 자정 직전 실행분이 그날의 최종 스냅샷 — 날짜도 같은 시간대 기준)
+    scheduler.add_job(refresh_task_stats, "interval", minutes=10, next_run_time=datetime.now(),
+                      id="refresh_task_stats", replace_existing=True)
+    scheduler.add_job(refresh_task_stats, "cron", hour=23, minute=59, timezone=stats.STATS_TIMEZONE,
+                      id="refresh_task_stats_final", replace_existing=True)
+    # 알림 보존 정책 (사용량이 적은 새벽 3시 30분 KST)
+    scheduler.add_job(run_retention, "cron", hour=3, minute=30, timezone="Asia/Seoul",
+                      id="run_retention", replace_existing=True, misfire_grace_time=3600)
+    # 승인 후 오래된 업무 이력 → 월별 압축 파일 (매일 새벽 4시 KST)
+    scheduler.add_job(archive_task_logs, "cron", hour=4, minute=0, timezone="Asia/Seoul",
+                      id="archive_task_logs", replace_existing=True, misfire_grace_time=3600)
+    # 만료·폐기된 Refresh·인증·재설정 토큰 정리 (매일 새벽 3시 KST)
+    scheduler.add_job(purge_tokens, "cron", hour=3, minute=0, timezone="Asia/Seoul",
+                      id="purge_tokens", replace_existing=True, misfire_grace_time=3600)
     scheduler.start()
 
 
 def stop_scheduler():
-    scheduler.shutdown()
+    if scheduler is not None and scheduler.running:
+        scheduler.shutdown()
@@ -0,0 +1,185 @@
+"""관리자 통계 — 단일 GROUP BY 집계 + 일별 롤업 테이블
+
+부서·상태·우선순위별 업무 수와 마감 초과 수를 한 번의 GROUP BY로 집계한다.
+스케줄러가 당일(stat_date = 오늘) 행만 주기적으로 다시 쓰므로 지난 날짜의 행은
+그날의 마지막 스냅샷으로 남아 추세(일별 미완료/마감 초과) 조회에 사용된다.
+'오늘'은 서버 시간대가 아니라 스케줄러 cron과 같은 STATS_TIMEZONE(KST) 기준이다.
+갱신은 매번 전체를 다시 집계한다 — 삭제된 업무, 담당자의 부서·활성 상태 변경, 날짜가 바뀌어
+생기는 마감 초과는 tasks.updated_at으로 골라낼 수 없고, 리더 워커에서 GROUP BY 한 번이면 된다.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import select, func, case, delete, insert, desc
+from sqlalchemy.orm import Session
+from app.models.task import Task, TaskStatsDaily, StatusEnum, PriorityEnum
+from app.models.user import User, Department
+
+STATS_TIMEZONE = "Asia/Seoul"
+# KST는 일광 절약 시간이 없으므로 고정 오프셋으로 충분하다 (tz 데이터베이스 불필요)
+_STATS_TZ = timezone(timedelta(hours=9), STATS_TIMEZONE)
+
+
+def stats_today() -> date:
+    """롤업의 stat_date 기준 날짜 (STATS_TIMEZONE)"""
+    return datetime.now(_STATS_TZ).date()
+
+
+def collect_live_rows(db: Session, today: Optional[date] = None) -> List[dict]:
+    """tasks 전체를 (부서, 상태, 우선순위)로 한 번에 집계 — 하위 업무 제외"""
+    today = today or stats_today()
+    # 기존 통계와 동일하게 활성 담당자의 업무만 부서별로 집계
+    dept_expr = case((User.is_active == True, func.coalesce(User.department_id, 0)), else_=0)
+    overdue_expr = case(
+        ((Task.due_date < today) & (Task.status != StatusEnum.approved), 1),
+        else_=0,
+    )
+    rows = db.execute(
+        select(
+            dept_expr.label("department_id"),
+            Task.status,
+            Task.priority,
+            func.count(Task.id).label("task_count"),
+            func.sum(overdue_expr).label("overdue_count"),
+        )
+        .join(User, User.id == Task.assignee_id)
+        .where(Task.is_subtask == False)
+        .group_by(dept_expr, Task.status, Task.priority)
+    ).all()
+    return [
+        {
+            "stat_date": today,
+            "department_id": r.department_id,
+            "status": r.status or StatusEnum.pending,
+            "priority": r.priority or PriorityEnum.normal,
+            "task_count": int(r.task_count or 0),
+            "overdue_count": int(r.overdue_count or 0),
+        }
+        for r in rows
+    ]
+
+
+def refresh_today(db: Session, today: Optional[date] = None) -> int:
+    """당일 롤업 행을 다시 계산해 교체. 기록한 행 수 반환."""
+    today = today or stats_today()
+    rows = collect_live_rows(db, today)
+    # 같은 (부서, 상태, 우선순위)가 NULL 보정으로 겹칠 수 있으므로 합산
+    merged: dict = {}
+    for r in rows:
+        key = (r["department_id"], r["status"], r["priority"])
+        if key in merged:
+            merged[key]["task_count"] += r["task_count"]
+            merged[key]["overdue_count"] += r["overdue_count"]
+        else:
+            merged[key] = r
+    db.execute(delete(TaskStatsDaily).where(TaskStatsDaily.stat_date == today))
+    if merged:
+        db.execute(insert(TaskStatsDaily), list(merged.values()))
+    db.commit()
+    return len(merged)
+
+
+def load_rollup_rows(db: Session, today: Optional[date] = None) -> List[dict]:
+    today = today or stats_today()
+    rows = db.execute(
+        select(
+            TaskStatsDaily.department_id,
+            TaskStatsDaily.status,
+            TaskStatsDaily.priority,
+            TaskStatsDaily.task_count,
+            TaskStatsDaily.overdue_count,
+        ).where(TaskStatsDaily.stat_date == today)
+    ).all()
+    return [r._asdict() for r in rows]
+
+
+def build_summary(db: Session, live: bool = False) -> dict:
+    """관리자 대시보드 통계. 롤업이 없거나 live=True면 집계 쿼리를 직접 실행."""
+    today = stats_today()
+    rows = [] if live else load_rollup_rows(db, today)
+    source = "rollup"
+    if not rows:
+        rows = collect_live_rows(db, today)
+        source = "live"
+
+    status_breakdown = {s.value: 0 for s in StatusEnum}
+    priority_breakdown = {p.value: 0 for p in PriorityEnum}
+    dept_counts: dict = {}
+    total_tasks = 0
+    overdue = 0
+    for r in rows:
+        status = r["status"].value if hasattr(r["status"], "value") else r["status"]
+        priority = r["priority"].value if hasattr(r["priority"], "value") else r["priority"]
+        status_breakdown[status] = status_breakdown.get(status, 0) + r["task_count"]
+        priority_breakdown[priority] = priority_breakdown.get(priority, 0) + r["task_count"]
+        dept_counts[r["department_id"]] = dept_counts.get(r["department_id"], 0) + r["task_count"]
+        total_tasks += r["task_count"]
+        overdue += r["overdue_count"]
+
+    # 부서별 활성 사용자 수 + 부서명 (부서 수와 무관하게 쿼리 1회)
+    user_rows = db.execute(
+        select(User.department_id, Department.name, func.count(User.id).label("cnt"))
+        .outerjoin(Department, Department.id == User.department_id)
+        .where(User.is_active == True)
+        .group_by(User.department_id, Department.name)
+    ).all()
+    total_users = sum(r.cnt for r in user_rows)
+    dept_stats = [
+        {"department": r.name, "task_count": dept_counts.get(r.department_id, 0)}
+        for r in sorted(user_rows, key=lambda r: r.name or "")
+        if r.department_id is not None
+    ]
+
+    user_task_counts = db.execute(
+        select(User.id, User.name, func.count(Task.id).label("cnt"))
+        .join(Task, Task.assignee_id == User.id)
+        .where(
+            User.is_active == True,
+            Task.status != StatusEnum.approved,
+            Task.is_subtask == False,
+        )
+        .group_by(User.id, User.name)
+        .order_by(desc("cnt"))
+        .limit(10)
+    ).all()
+
+    return {
+        "total_users": total_users,
+        "total_tasks": total_tasks,
+        "overdue": overdue,
+        "status_breakdown": status_breakdown,
+        "priority_breakdown": priority_breakdown,
+        "dept_stats": dept_stats,
+        "top_assignees": [
+            {"user_id": r.id, "name": r.name, "pending_tasks": r.cnt}
+            for r in user_task_counts
+        ],
+        "source": source,
+    }
+
+
+def trend_series(db: Session, days: int = 30, department_id: Optional[int] = None) -> List[dict]:
+    """일별 미완료/마감 초과/전체 업무 수 추세 (롤업 테이블 기준)"""
+    since = stats_today() - timedelta(days=days - 1)
+    open_expr = case((TaskStatsDaily.status != StatusEnum.approved, TaskStatsDaily.task_count), else_=0)
+    query = (
+        select(
+            TaskStatsDaily.stat_date,
+            func.sum(TaskStatsDaily.task_count).label("total"),
+            func.sum(open_expr).label("open"),
+            func.sum(TaskStatsDaily.overdue_count).label("overdue"),
+        )
+        .where(TaskStatsDaily.stat_date >= since)
+        .group_by(TaskStatsDaily.stat_date)
+        .order_by(TaskStatsDaily.stat_date)
+    )
+    if department_id is not None:
+        query = query.where(TaskStatsDaily.department_id == department_id)
+    return [
+        {
+            "date": r.stat_date.isoformat(),
+            "total": int(r.total or 0),
+            "open": int(r.open or 0),
+            "overdue": int(r.overdue or 0),
+        }
+        for r in db.execute(query).all()
+    ]
@@ -0,0 +1,107 @@
+"""태그 이름 → Tag 일괄 변환
+
+업무 생성/수정 시 태그 수와 무관하게 기존 태그는 IN 조회 1회, 새 태그가 있으면
+INSERT IGNORE 1회 + 재조회 1회로 끝낸다. 동시에 같은 이름을 추가해도 unique 제약과
+IGNORE 덕분에 중복 오류가 나지 않는다. 이름→ID는 프로세스 로컬 캐시에 보관해
+이미 알려진 태그는 PK로 조회한다.
+MySQL의 INSERT IGNORE는 긴 이름을 경고만 내고 잘라 저장하므로(재조회에서 누락) 호출 측은
+too_long()으로 먼저 길이를 검사해야 한다.
+"""
+import threading
+from typing import Dict, List, Optional
+from sqlalchemy import select, insert, or_
+from sqlalchemy.orm import Session
+from app.models.task import Tag
+
+NAME_MAX_LENGTH = Tag.__table__.c.name.type.length
+
+_cache: Dict[str, int] = {}
+_cache_lock = threading.Lock()
+
+
+def _normalize(names: List[str]) -> List[str]:
+    seen = set()
+    result = []
+    for name in names or []:
+        name = (name or "").strip()
+        if name and name not in seen:
+            seen.add(name)
+            result.append(name)
+    return result
+
+
+def too_long(names: List[str]) -> Optional[str]:
+    """NAME_MAX_LENGTH자를 넘는 첫 태그 이름 (없으면 None)"""
+    return next((n for n in _normalize(names) if len(n) > NAME_MAX_LENGTH), None)
+
+
+def _insert_ignore(db: Session, names: List[str]) -> None:
+    stmt = insert(Tag)
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = stmt.prefix_with("IGNORE")
+    elif dialect == "sqlite":
+        stmt = stmt.prefix_with("OR IGNORE")
+    db.execute(stmt, [{"name": n} for n in names])
+
+
+def _select(db: Session, names: List[str], cached_ids: List[int]) -> List[Tag]:
+    conds = []
+    if cached_ids:
+        conds.append(Tag.id.in_(cached_ids))
+    if names:
+        conds.append(Tag.name.in_(names))
+    if not conds:
+        return []
+    return list(db.execute(select(Tag).where(or_(*conds))).scalars())
+
+
+def resolve_tags(db: Session, names: List[str]) -> List[Tag]:
+    """태그 이름 목록을 Tag 객체로 변환 (없으면 생성). 입력 순서 유지, 중복·공백 제거."""
+    names = _normalize(names)
+    if not names:
+        return []
+    if any(len(n) > NAME_MAX_LENGTH for n in names):
+        raise ValueError(f"태그는 {NAME_MAX_LENGTH}자를 초과할 수 없습니다.")
+
+    with _cache_lock:
+        cached = {n: _cache[n] for n in names if n in _cache}
+    uncached = [n for n in names if n not in cached]
+
+    found = {t.name: t for t in _select(db, uncached, list(cached.values()))}
+    # 캐시에 있었지만 삭제된 태그는 새 태그로 취급
+    missing = [n for n in names if _match(found, n) is None]
+    if missing:
+        _insert_ignore(db, missing)
+        for t in _select(db, missing, []):
+            found[t.name] = t
+
+    with _cache_lock:
+        for n in missing:
+            _cache.pop(n, None)
+        for t in found.values():
+            _cache[t.name] = t.id
+
+    tags = []
+    seen_ids = set()
+    for n in names:
+        tag = _match(found, n)
+        if tag is not None and tag.id not in seen_ids:
+            seen_ids.add(tag.id)
+            tags.append(tag)
+    return tags
+
+
+def _match(found: Dict[str, Tag], name: str):
+    """MySQL 기본 콜레이션은 대소문자를 구분하지 않으므로 'Foo'와 'foo'는 같은 태그"""
+    tag = found.get(name)
+    if tag is None:
+        lowered = name.lower()
+        tag = next((t for n, t in found.items() if n.lower() == lowered), None)
+    return tag
+
+
+def forget(name: str) -> None:
+    """태그 삭제 시 캐시에서 제거"""
+    with _cache_lock:
+        _cache.pop(name, None)
@@ -0,0 +1,347 @@
+"""업무 일괄 가져오기 (CSV / XLSX)
+
+내보내기(export_tasks)와 같은 열 구성을 그대로 읽는다. 번호·지시자·생성일 열은 무시하고
+지시자는 가져오기를 실행한 사용자가 된다. 파일은 한 행씩 스트리밍으로 읽어 CHUNK_SIZE 단위로
+처리하며, 청크마다 담당자·카테고리·태그를 IN 조회로 한 번에 찾고 업무·이력·알림·태그 연결을
+묶어서 INSERT 한 뒤 커밋한다. 개별 생성 API와 달리 메일은 보내지 않고 알림만 남긴다.
+MySQL은 RETURNING이 없어 ORM으로 넣으면 행마다 INSERT가 나가므로, 업무도 청크당 다중 행
+INSERT 한 문장으로 넣고 새 ID는 LAST_INSERT_ID()(첫 행 ID)와 행 수로 계산한다 — 행 수를 미리 아는
+한 문장의 AUTO_INCREMENT 값은 InnoDB의 어느 잠금 모드에서도 연속으로 한 번에 할당된다.
+"""
+import csv
+import io
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import select, insert, or_, text
+from sqlalchemy.orm import Session
+from app.models.task import Task, TaskLog, Notification, Category, StatusEnum, PriorityEnum, task_tags
+from app.models.user import User, UserNotificationPreference
+from app.services import tags as tags_service
+from app.utils import lazy
+
+openpyxl = lazy.module("openpyxl")
+
+CHUNK_SIZE = 500
+MAX_ROWS = 20000
+
+STATUS_LABELS = {
+    "pending": "대기", "in_progress": "진행중", "review": "검토요청",
+    "approved": "완료", "rejected": "반려",
+}
+PRIORITY_LABELS = {
+    "urgent": "긴급", "high": "높음", "normal": "보통", "low": "낮음",
+}
+
+# 내보내기 헤더 → 필드 (번호·지시자·생성일은 가져오기 대상 아님)
+IMPORT_HEADERS = {
+    "제목": "title",
+    "내용": "content",
+    "담당자": "assignee",
+    "상태": "status",
+    "우선순위": "priority",
+    "카테고리": "category",
+    "태그": "tags",
+    "진행도(%)": "progress",
+    "마감일": "due_date",
+}
+REQUIRED_HEADERS = ("제목", "담당자")
+
+_STATUS_BY_TEXT = {**{v: k for k, v in STATUS_LABELS.items()}, **{k: k for k in STATUS_LABELS}}
+_PRIORITY_BY_TEXT = {**{v: k for k, v in PRIORITY_LABELS.items()}, **{k: k for k in PRIORITY_LABELS}}
+
+
+class ImportFormatError(ValueError):
+    """파일 자체를 읽을 수 없는 경우 (헤더 누락, 인코딩 오류 등)"""
+
+
+# ── 파싱 ─────────────────────────────────────────────────
+def _iter_csv(fileobj) -> Iterator[list]:
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.reader(text)
+    except UnicodeDecodeError:
+        raise ImportFormatError("CSV 파일은 UTF-8 인코딩이어야 합니다.")
+    finally:
+        # 업로드 파일 객체는 호출 측이 닫으므로 래퍼만 분리
+        try:
+            text.detach()
+        except ValueError:
+            pass
+
+
+def _iter_xlsx(fileobj) -> Iterator[list]:
+    try:
+        wb = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFormatError("XLSX 파일을 읽을 수 없습니다.")
+    try:
+        for row in wb.active.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        wb.close()
+
+
+def iter_rows(fileobj, fmt: str) -> Iterator[Tuple[int, dict]]:
+    """(행 번호, {필드: 원본 값}) 을 한 행씩 반환. 행 번호는 헤더를 1행으로 센다."""
+    rows = _iter_csv(fileobj) if fmt == "csv" else _iter_xlsx(fileobj)
+    header = next(rows, None)
+    if not header:
+        raise ImportFormatError("빈 파일입니다.")
+    header = [str(h).strip() if h is not None else "" for h in header]
+    missing = [h for h in REQUIRED_HEADERS if h not in header]
+    if missing:
+        raise ImportFormatError(f"필수 열이 없습니다: {', '.join(missing)}")
+    columns = [(i, IMPORT_HEADERS[h]) for i, h in enumerate(header) if h in IMPORT_HEADERS]
+
+    for line_no, raw in enumerate(rows, 2):
+        values = {field: raw[i] if i < len(raw) else None for i, field in columns}
+        if all(v is None or str(v).strip() == "" for v in values.values()):
+            continue
+        yield line_no, values
+
+
+# ── 행 검증 ──────────────────────────────────────────────
+def _text(value) -> str:
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _parse_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(_text(value)[:10])
+
+
+def _validate(values: dict) -> Tuple[dict, List[str]]:
+    """조회 없이 확인 가능한 형식 검증. (정규화된 행, 오류 목록) 반환."""
+    errors = []
+    row = {
+        "title": _text(values.get("title")),
+        "content": _text(values.get("content")) or None,
+        "assignee": _text(values.get("assignee")),
+        "category": _text(values.get("category")) or None,
+        "tags": [],
+        "status": StatusEnum.pending,
+        "priority": PriorityEnum.normal,
+        "progress": 0,
+        "due_date": None,
+    }
+    if not row["title"]:
+        errors.append("제목이 비어 있습니다.")
+    elif len(row["title"]) > 255:
+        errors.append("제목은 255자를 초과할 수 없습니다.")
+    if not row["assignee"]:
+        errors.append("담당자가 비어 있습니다.")
+
+    status = _text(values.get("status"))
+    if status:
+        if status in _STATUS_BY_TEXT:
+            row["status"] = StatusEnum(_STATUS_BY_TEXT[status])
+        else:
+            errors.append(f"알 수 없는 상태입니다: {status}")
+
+    priority = _text(values.get("priority"))
+    if priority:
+        if priority in _PRIORITY_BY_TEXT:
+            row["priority"] = PriorityEnum(_PRIORITY_BY_TEXT[priority])
+        else:
+            errors.append(f"알 수 없는 우선순위입니다: {priority}")
+
+    progress = _text(values.get("progress"))
+    if progress:
+        try:
+            row["progress"] = int(float(progress))
+            if not 0 <= row["progress"] <= 100:
+                raise ValueError
+        except ValueError:
+            errors.append(f"진행도는 0~100 사이 숫자여야 합니다: {progress}")
+
+    if _text(values.get("due_date")):
+        try:
+            row["due_date"] = _parse_date(values["due_date"])
+        except ValueError:
+            errors.append(f"마감일 형식이 올바르지 않습니다 (YYYY-MM-DD): {_text(values['due_date'])}")
+
+    tag_names = [t.strip() for t in _text(values.get("tags")).split(",") if t.strip()]
+    too_long = tags_service.too_long(tag_names)
+    if too_long:
+        errors.append(f"태그는 {tags_service.NAME_MAX_LENGTH}자를 초과할 수 없습니다: {too_long}")
+    row["tags"] = tag_names
+    return row, errors
+
+
+# ── 청크 처리 ────────────────────────────────────────────
+class _Lookups:
+    """가져오기 한 번 동안 유지되는 담당자·카테고리 조회 캐시 (청크마다 새 키만 IN 조회)"""
+
+    def __init__(self):
+        self.users: Dict[str, Optional[Tuple[int, bool]]] = {}  # 키 → (user_id, is_active)
+        self.ambiguous: set = set()
+        self.categories: Dict[str, Optional[int]] = {}
+        self.notify: Dict[int, bool] = {}
+
+    def load(self, db: Session, rows: List[dict]) -> None:
+        keys = {r["assignee"] for r in rows if r["assignee"] and r["assignee"] not in self.users}
+        if keys:
+            found = db.execute(
+                select(User.id, User.email, User.name, User.is_active)
+                .where(or_(User.email.in_(keys), User.name.in_(keys)))
+            ).all()
+            for key in keys:
+                by_email = [u for u in found if u.email == key]
+                by_name = [u for u in found if u.name == key]
+                if by_email:
+                    self.users[key] = (by_email[0].id, by_email[0].is_active)
+                elif len(by_name) == 1:
+                    self.users[key] = (by_name[0].id, by_name[0].is_active)
+                else:
+                    self.users[key] = None
+                    if len(by_name) > 1:
+                        self.ambiguous.add(key)
+
+        names = {r["category"] for r in rows if r["category"] and r["category"] not in self.categories}
+        if names:
+            found = dict(db.execute(select(Category.name, Category.id).where(Category.name.in_(names))).all())
+            for name in names:
+                self.categories[name] = found.get(name)
+
+        user_ids = {u[0] for u in self.users.values() if u is not None and u[0] not in self.notify}
+        if user_ids:
+            prefs = dict(db.execute(
+                select(UserNotificationPreference.user_id, UserNotificationPreference.notify_assigned)
+                .where(UserNotificationPreference.user_id.in_(user_ids))
+            ).all())
+            for uid in user_ids:
+                self.notify[uid] = prefs.get(uid, True) is not False
+
+
+def _resolve(row: dict, lookups: _Lookups) -> List[str]:
+    errors = []
+    user = lookups.users.get(row["assignee"])
+    if row["assignee"] in lookups.ambiguous:
+        errors.append(f"같은 이름의 사용자가 여러 명입니다. 이메일로 지정해 주세요: {row['assignee']}")
+    elif user is None:
+        errors.append(f"담당자를 찾을 수 없습니다: {row['assignee']}")
+    elif not user[1]:
+        errors.append(f"비활성 사용자에게는 배정할 수 없습니다: {row['assignee']}")
+    if row["category"] and lookups.categories.get(row["category"]) is None:
+        errors.append(f"카테고리를 찾을 수 없습니다: {row['category']}")
+    return errors
+
+
+def _inserted_ids(db: Session, lastrowid: int, count: int) -> List[int]:
+    """다중 행 INSERT 한 문장이 만든 ID (입력 순)
+
+    MySQL의 LAST_INSERT_ID()는 첫 행의 ID이고 이후 행은 auto_increment_increment씩 증가한다
+    (복제 구성에 따라 1이 아닐 수 있음). SQLite의 lastrowid는 마지막 행의 ID다.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return list(range(lastrowid - count + 1, lastrowid + 1))
+    step = db.execute(text("SELECT @@auto_increment_increment")).scalar() or 1
+    return [lastrowid + i * step for i in range(count)]
+
+
+def _insert_chunk(db: Session, rows: List[dict], lookups: _Lookups, importer: User) -> None:
+    tag_ids: Dict[str, int] = {}
+    all_tags = [t for r in rows for t in r["tags"]]
+    if all_tags:
+        for tag in tags_service.resolve_tags(db, all_tags):
+            tag_ids[tag.name.lower()] = tag.id
+
+    # executemany가 아니라 VALUES 여러 개짜리 한 문장 (드라이버가 나눠 보내지 않도록)
+    result = db.execute(insert(Task).values([
+        {
+            "title": r["title"],
+            "content": r["content"],
+            "assigner_id": importer.id,
+            "assignee_id": lookups.users[r["assignee"]][0],
+            "category_id": lookups.categories.get(r["category"]) if r["category"] else None,
+            "priority": r["priority"],
+            "status": r["status"],
+            "progress": r["progress"],
+            "due_date": r["due_date"],
+            "is_subtask": False,
+        }
+        for r in rows
+    ]))
+    if result.rowcount != len(rows):
+        raise RuntimeError(f"가져온 업무 수가 맞지 않습니다: {result.rowcount}/{len(rows)}")
+    task_ids = _inserted_ids(db, result.lastrowid, len(rows))
+
+    db.execute(insert(TaskLog), [
+        {"task_id": tid, "user_id": importer.id, "action": "created",
+         "new_value": r["status"].value, "comment": "일괄 가져오기"}
+        for tid, r in zip(task_ids, rows)
+    ])
+    notifications = []
+    for tid, r in zip(task_ids, rows):
+        assignee_id = lookups.users[r["assignee"]][0]
+        if lookups.notify.get(assignee_id, True):
+            notifications.append({
+                "user_id": assignee_id, "task_id": tid, "type": "assigned",
+                "message": f"새 업무가 배정되었습니다: {r['title']}", "is_read": False,
+            })
+    if notifications:
+        db.execute(insert(Notification), notifications)
+    links = {
+        (tid, tag_ids[name.lower()])
+        for tid, r in zip(task_ids, rows) for name in r["tags"] if name.lower() in tag_ids
+    }
+    if links:
+        db.execute(insert(task_tags), [{"task_id": tid, "tag_id": gid} for tid, gid in links])
+    db.commit()
+
+
+def import_tasks(db: Session, fileobj, fmt: str, importer: User, dry_run: bool = False) -> dict:
+    """파일을 읽어 업무를 생성하고 행별 오류 보고서를 반환.
+
+    오류가 있는 행만 건너뛰고 나머지는 가져온다. dry_run이면 검증만 수행한다.
+    """
+    lookups = _Lookups()
+    errors: List[dict] = []
+    total = 0
+    imported = 0
+    truncated = False
+    chunk: List[Tuple[int, dict]] = []
+
+    def flush_chunk():
+        nonlocal imported
+        lookups.load(db, [r for _, r in chunk])
+        valid = []
+        for line_no, r in chunk:
+            row_errors = _resolve(r, lookups)
+            if row_errors:
+                errors.append({"row": line_no, "title": r["title"], "errors": row_errors})
+            else:
+                valid.append(r)
+        if valid and not dry_run:
+            _insert_chunk(db, valid, lookups, importer)
+        imported += len(valid)
+        chunk.clear()
+
+    for line_no, values in iter_rows(fileobj, fmt):
+        if total >= MAX_ROWS:
+            truncated = True
+            break
+        total += 1
+        row, row_errors = _validate(values)
+        if row_errors:
+            errors.append({"row": line_no, "title": row["title"], "errors": row_errors})
+            continue
+        chunk.append((line_no, row))
+        if len(chunk) >= CHUNK_SIZE:
+            flush_chunk()
+    if chunk:
+        flush_chunk()
+
+    return {
+        "total_rows": total,
+        "imported": imported,
+        "failed": len(errors),
+        "dry_run": dry_run,
+        "truncated": truncated,  # MAX_ROWS 초과분은 읽지 않음
+        "errors": errors,
+    }
@@ -0,0 +1,249 @@
+"""업무 이력(task_logs) 압축·콜드 스토리지
+
+task_logs는 생성·수정·상태 변경·재배정·댓글마다 쌓이고, 특히 진행률 슬라이더를 움직일 때마다
+PATCH가 "updated" 행을 남겨 가장 빨리 커진다. 두 가지로 hot 테이블을 작게 유지한다.
+- 합치기(coalesce): 업무의 마지막 이력이 같은 사용자의 "updated"이고 TASK_LOG_COALESCE_SECONDS
+  안이면 새 행 대신 그 행의 시각만 갱신한다. 이미 쌓인 행은 scripts/compact_task_logs.py 로 정리.
+- 콜드 스토리지: 승인된 뒤 task_log_archive_months(system_settings)가 지난 업무의 이력을
+  TASK_LOG_ARCHIVE_PATH/YYYY-MM.jsonl.gz (업무의 마지막 수정 월)에 업무당 한 줄로 덧붙이고
+  task_logs·mentions에서 지운다. 위치는 task_log_archives에 남고, get_logs·활동 피드는
+  archived_logs()로 파일에서 읽어 같은 모양으로 돌려준다 (작성자·멘션 이름은 보관 시점 값).
+파일을 먼저 쓰고 DB를 커밋하므로 중간에 실패하면 다음 실행 때 같은 이력이 다시 덧붙을 수 있다 —
+읽을 때 이력 ID로 중복을 걸러낸다. 업무를 삭제하면 위치 행은 지워지고 파일의 줄은 남는다.
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import select, delete, exists, func
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.task import Task, TaskLog, TaskLogArchive, Mention, StatusEnum
+from app.models.user import SystemSettings
+from app.services import retention
+from app.utils import metrics
+
+logger = logging.getLogger("task_logs")
+_settings = get_settings()
+
+ARCHIVE_MONTHS_KEY = "task_log_archive_months"
+DEFAULT_ARCHIVE_MONTHS = 12
+REPORT_KEY = "task_log_archive_last_report"
+TASK_BATCH = 200  # 콜드 스토리지 배치당 업무 수
+BATCH_PAUSE = 0.05
+
+TASK_LOG_ROWS = metrics.Counter(
+    "collab_task_log_rows_total", "합치거나 콜드 스토리지로 옮긴 업무 이력 행 수", ("action",))
+
+
+def log_to_dict(l: TaskLog) -> dict:
+    return {
+        "id": l.id,
+        "user": {"id": l.user.id, "name": l.user.name} if l.user else None,
+        "action": l.action,
+        "old_value": l.old_value,
+        "new_value": l.new_value,
+        "comment": l.comment,
+        "mentions": [
+            {"user_id": m.mentioned_user_id, "name": m.mentioned_user.name}
+            for m in l.mentions
+        ],
+        "created_at": l.created_at.isoformat(),
+    }
+
+
+# ── 합치기 ─────────────────────────────────────────────────
+
+def add_update_log(db: Session, task_id: int, user_id: int) -> None:
+    """"updated" 이력 추가 — 직전 이력이 같은 사용자의 "updated"이고 합치기 시간 안이면 그 행의 시각만 갱신"""
+    window = _settings.task_log_coalesce_seconds
+    if window > 0:
+        last = (
+            db.query(TaskLog)
+            .options(load_only(TaskLog.id, TaskLog.user_id, TaskLog.action, TaskLog.created_at))
+            .filter(TaskLog.task_id == task_id)
+            .order_by(TaskLog.id.desc())
+            .first()
+        )
+        if (last is not None and last.action == "updated" and last.user_id == user_id
+                and last.created_at is not None
+                and last.created_at >= datetime.now() - timedelta(seconds=window)):
+            last.created_at = func.now()
+            TASK_LOG_ROWS.inc(action="coalesced")
+            return
+    db.add(TaskLog(task_id=task_id, user_id=user_id, action="updated"))
+
+
+def compact_backlog(db: Session, window: int, after_task_id: int = 0, task_batch: int = TASK_BATCH,
+                    dry_run: bool = False) -> tuple:
+    """이미 쌓인 연속 "updated" 행을 업무 task_batch개씩 정리 → (지운 행 수, 다음 after_task_id 또는 None)
+
+    같은 업무에서 바로 이어지는 두 행이 모두 같은 사용자의 "updated"이고 간격이 window초 이하면
+    앞의 행을 지운다 (마지막 행이 가장 늦은 시각을 가짐). add_update_log와 같은 기준.
+    """
+    task_ids = db.execute(
+        select(TaskLog.task_id).where(TaskLog.task_id > after_task_id, TaskLog.action == "updated")
+        .group_by(TaskLog.task_id).order_by(TaskLog.task_id).limit(task_batch)
+    ).scalars().all()
+    if not task_ids:
+        return 0, None
+    rows = db.execute(
+        select(TaskLog.id, TaskLog.task_id, TaskLog.user_id, TaskLog.action, TaskLog.created_at)
+        .where(TaskLog.task_id.in_(task_ids)).order_by(TaskLog.task_id, TaskLog.id)
+    ).all()
+    redundant = []
+    for prev, row in zip(rows, rows[1:]):
+        if (prev.task_id == row.task_id and prev.action == row.action == "updated"
+                and prev.user_id == row.user_id and prev.created_at and row.created_at
+                and (row.created_at - prev.created_at).total_seconds() <= window):
+            redundant.append(prev.id)
+    if redundant and not dry_run:
+        db.execute(delete(TaskLog).where(TaskLog.id.in_(redundant)))
+        db.commit()
+        TASK_LOG_ROWS.inc(len(redundant), action="coalesced")
+    return len(redundant), (task_ids[-1] if len(task_ids) == task_batch else None)
+
+
+# ── 콜드 스토리지 ─────────────────────────────────────────
+
+def _archive_file(month: str) -> str:
+    return os.path.join(_settings.task_log_archive_path, f"{month}.jsonl.gz")
+
+
+def _line_prefix(task_id: int) -> bytes:
+    return f'{{"task_id": {task_id},'.encode()
+
+
+def archived_logs(db: Session, task_id: int, before_id: Optional[int] = None) -> list:
+    """콜드 스토리지로 옮긴 이력 (시간순, log_to_dict와 같은 모양). 옮긴 적이 없으면 쿼리 한 번으로 끝."""
+    months = db.execute(
+        select(TaskLogArchive.month).where(TaskLogArchive.task_id == task_id).order_by(TaskLogArchive.month)
+    ).scalars().all()
+    if not months:
+        return []
+    prefix = _line_prefix(task_id)
+    items = {}
+    for month in months:
+        path = _archive_file(month)
+        if not os.path.exists(path):
+            logger.error("업무 %d의 보관 이력 파일이 없습니다: %s", task_id, path)
+            continue
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                if line.startswith(prefix):
+                    for item in json.loads(line)["logs"]:
+                        items[item["id"]] = item  # 재시도로 중복 기록된 이력은 하나만
+    logs = sorted(items.values(), key=lambda item: item["id"])
+    if before_id:
+        logs = [item for item in logs if item["id"] < before_id]
+    return logs
+
+
+def _cutoff(now: datetime, months: int) -> datetime:
+    """now가 속한 달의 months개월 전 1일 0시"""
+    index = now.year * 12 + now.month - 1 - months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _archive_months(db: Session) -> int:
+    value = db.execute(select(SystemSettings.value).where(SystemSettings.key == ARCHIVE_MONTHS_KEY)).scalar()
+    try:
+        return max(int(value), 0) if value is not None else DEFAULT_ARCHIVE_MONTHS
+    except ValueError:
+        logger.warning("system_settings.%s 값이 정수가 아님 (%r) — 기본값 %d 사용",
+                       ARCHIVE_MONTHS_KEY, value, DEFAULT_ARCHIVE_MONTHS)
+        return DEFAULT_ARCHIVE_MONTHS
+
+
+def _append(month: str, lines: list) -> None:
+    """월 파일에 gzip 멤버 하나로 덧붙인다 (gzip은 이어 붙인 멤버를 한 스트림으로 읽음)"""
+    os.makedirs(_settings.task_log_archive_path, exist_ok=True)
+    with open(_archive_file(month), "ab") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+            gz.write(b"".join(lines))
+        raw.flush()
+        os.fsync(raw.fileno())
+
+
+def archive_cold(db: Session, now: Optional[datetime] = None, pause: float = BATCH_PAUSE) -> dict:
+    """승인 후 보관 기간이 지난 업무의 이력을 업무 TASK_BATCH개씩 월별 압축 파일로 옮긴다"""
+    started = time.perf_counter()
+    months = _archive_months(db)
+    report = {"tasks": 0, "logs": 0, "files": [], "archive_months": months}
+    if not months:
+        return report
+    cutoff = _cutoff(now or datetime.now(), months)
+    files = set()
+    last_id = 0
+    while True:
+        tasks = db.execute(
+            select(Task.id, Task.updated_at)
+            .where(Task.id > last_id, Task.status == StatusEnum.approved, Task.updated_at < cutoff,
+                   exists().where(TaskLog.task_id == Task.id))
+            .order_by(Task.id).limit(TASK_BATCH)
+        ).all()
+        if not tasks:
+            break
+        last_id = tasks[-1].id
+        month_of = {t.id: t.updated_at.strftime("%Y-%m") for t in tasks}
+        logs = (
+            db.query(TaskLog)
+            .options(joinedload(TaskLog.user), selectinload(TaskLog.mentions).joinedload(Mention.mentioned_user))
+            .filter(TaskLog.task_id.in_(list(month_of)))
+            .order_by(TaskLog.id)
+            .all()
+        )
+        by_task = {}
+        for log in logs:
+            by_task.setdefault(log.task_id, []).append(log_to_dict(log))
+
+        lines = {}
+        for task_id, items in by_task.items():
+            line = json.dumps({"task_id": task_id, "logs": items}, ensure_ascii=False)
+            lines.setdefault(month_of[task_id], []).append(line.encode() + b"\n")
+        for month, month_lines in lines.items():
+            _append(month, month_lines)
+            files.add(month)
+
+        log_ids = [log.id for log in logs]
+        db.expunge_all()
+        db.execute(delete(Mention).where(Mention.log_id.in_(log_ids)))
+        db.execute(delete(TaskLog).where(TaskLog.id.in_(log_ids)))
+        for task_id, items in by_task.items():
+            entry = db.get(TaskLogArchive, (task_id, month_of[task_id]))
+            if entry is None:
+                db.add(TaskLogArchive(task_id=task_id, month=month_of[task_id], log_count=len(items)))
+            else:
+                entry.log_count += len(items)
+        db.commit()
+
+        report["tasks"] += len(by_task)
+        report["logs"] += len(log_ids)
+        TASK_LOG_ROWS.inc(len(log_ids), action="archived")
+        if len(tasks) < TASK_BATCH:
+            break
+        time.sleep(pause)
+
+    report["files"] = sorted(files)
+    report["seconds"] = round(time.perf_counter() - started, 2)
+    return report
+
+
+def run(db: Optional[Session] = None, pause: float = BATCH_PAUSE) -> dict:
+    """콜드 스토리지 작업 실행 — 결과를 system_settings에 기록하고 반환 (스케줄러는 스레드풀에서 호출)"""
+    own = db is None
+    db = db or SessionLocal()
+    try:
+        report = archive_cold(db, pause=pause)
+        report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        retention.save_report(db, report, REPORT_KEY, "마지막 업무 이력 콜드 스토리지 작업 결과 (자동 기록)")
+        logger.info("업무 이력 콜드 스토리지: 업무 %d건, 이력 %d건 → %s",
+                    report["tasks"], report["logs"], ", ".join(report["files"]) or "-")
+        return report
+    finally:
+        if own:
+            db.close()
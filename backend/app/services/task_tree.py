@@ -0,0 +1,135 @@
+"""업무 트리 — WITH RECURSIVE 한 번으로 하위 업무 전체(모든 깊이)를 조회
+
+Task.subtasks 관계는 한 단계씩 지연 로드되어 깊은 계층에서 노드마다 쿼리가 발생한다.
+여기서는 재귀 CTE로 서브트리를 한 번에 읽고, 진행률·완료 수를 모든 깊이에 걸쳐 집계한다.
+"""
+import os
+from typing import Dict, List, Optional
+from sqlalchemy import select, delete, literal
+from sqlalchemy.orm import Session, aliased
+from app.models.task import Task, Attachment, StatusEnum
+from app.models.user import User
+from app.services import progress
+
+# 잘못된 parent_task_id 순환 참조 방지용 최대 깊이
+MAX_DEPTH = 32
+
+
+def _subtree_cte(root_id: int):
+    base = select(Task.id, Task.parent_task_id, literal(0).label("depth")).where(Task.id == root_id)
+    tree = base.cte(name="task_tree", recursive=True)
+    child = aliased(Task)
+    return tree.union_all(
+        select(child.id, child.parent_task_id, (tree.c.depth + 1).label("depth"))
+        .where(child.parent_task_id == tree.c.id, tree.c.depth < MAX_DEPTH)
+    )
+
+
+def subtree_ids(db: Session, root_id: int) -> Dict[int, int]:
+    """루트 포함 서브트리의 {task_id: depth}"""
+    tree = _subtree_cte(root_id)
+    return {r.id: r.depth for r in db.execute(select(tree.c.id, tree.c.depth)).all()}
+
+
+def load_tree(db: Session, root_id: int) -> Optional[dict]:
+    """서브트리 전체를 쿼리 1회로 읽어 중첩 dict로 반환. 루트가 없으면 None."""
+    tree = _subtree_cte(root_id)
+    rows = db.execute(
+        select(
+            Task.id, Task.title, Task.status, Task.priority, Task.progress,
+            Task.due_date, Task.parent_task_id, Task.assignee_id, Task.assigner_id,
+            User.name.label("assignee_name"), tree.c.depth,
+        )
+        .join(tree, tree.c.id == Task.id)
+        .outerjoin(User, User.id == Task.assignee_id)
+        .order_by(tree.c.depth, Task.id)
+    ).all()
+    if not rows:
+        return None
+
+    nodes: Dict[int, dict] = {}
+    for r in rows:
+        nodes[r.id] = {
+            "id": r.id,
+            "title": r.title,
+            "status": r.status,
+            "priority": r.priority,
+            "progress": progress.overlay(r.id, r.progress) or 0,
+            "due_date": r.due_date.isoformat() if r.due_date else None,
+            "parent_task_id": r.parent_task_id,
+            "assigner_id": r.assigner_id,
+            "assignee": {"id": r.assignee_id, "name": r.assignee_name} if r.assignee_id else None,
+            "depth": r.depth,
+            "children": [],
+        }
+    root = nodes[rows[0].id]
+    for r in rows[1:]:
+        parent = nodes.get(r.parent_task_id)
+        if parent is not None:
+            parent["children"].append(nodes[r.id])
+
+    _rollup(root)
+    return root
+
+
+def _rollup(node: dict) -> None:
+    """하위 모든 깊이의 업무 수·완료 수·평균 진행률을 후위 순회로 집계 (승인 완료는 100%로 계산)"""
+    total = 0
+    done = 0
+    progress_sum = 0
+    for child in node["children"]:
+        _rollup(child)
+        total += 1 + child["descendant_count"]
+        done += (1 if child["status"] == StatusEnum.approved else 0) + child["descendants_done"]
+        progress_sum += _effective_progress(child) + child["_progress_sum"]
+    node["descendant_count"] = total
+    node["descendants_done"] = done
+    node["_progress_sum"] = progress_sum
+    node["subtask_count"] = len(node["children"])
+    node["subtasks_done"] = sum(1 for c in node["children"] if c["status"] == StatusEnum.approved)
+    node["rollup_progress"] = round(progress_sum / total) if total else _effective_progress(node)
+
+
+def _effective_progress(node: dict) -> int:
+    return 100 if node["status"] == StatusEnum.approved else node["progress"]
+
+
+def strip_internal(node: dict) -> dict:
+    node.pop("_progress_sum", None)
+    for child in node["children"]:
+        strip_internal(child)
+    return node
+
+
+def delete_subtree(db: Session, root_id: int, storage_path: str) -> int:
+    """루트와 모든 하위 업무를 삭제하고 첨부 파일도 제거. 삭제한 업무 수 반환.
+
+    첨부·이력·즐겨찾기·태그 연결은 FK ON DELETE CASCADE로 함께 삭제되며,
+    parent_task_id 참조 때문에 깊은 단계부터 단계별로 한 번씩 DELETE 한다.
+    """
+    depths = subtree_ids(db, root_id)
+    if not depths:
+        return 0
+
+    stored_names: List[str] = list(db.execute(
+        select(Attachment.stored_name).where(Attachment.task_id.in_(list(depths)))
+    ).scalars())
+
+    by_depth: Dict[int, List[int]] = {}
+    for task_id, depth in depths.items():
+        by_depth.setdefault(depth, []).append(task_id)
+    for depth in sorted(by_depth, reverse=True):
+        db.execute(
+            delete(Task).where(Task.id.in_(by_depth[depth])).execution_options(synchronize_session=False)
+        )
+    db.commit()
+
+    # 파일은 DB 커밋 이후 제거 (롤백 시 파일만 사라지는 상황 방지)
+    for name in stored_names:
+        fpath = os.path.join(storage_path, name)
+        if os.path.exists(fpath):
+            try:
+                os.remove(fpath)
+            except OSError:
+                pass
+    return len(depths)
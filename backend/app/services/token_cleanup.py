@@ -0,0 +1,75 @@
+"""만료·폐기된 토큰 정리
+
+Refresh·이메일 인증·비밀번호 재설정 토큰은 폐기(revoked)되거나 사용(used)돼도 행이 남아
+사용자당 매주 몇 행씩 쌓인다. 조회는 모두 token(UNIQUE) 또는 (user_id, 상태) 인덱스로 하지만
+테이블·인덱스가 커질수록 버퍼 풀을 차지하므로, 만료됐거나 폐기·사용된 행을 스케줄러가 매일 지운다.
+폐기·사용된 토큰은 검증에서 이미 없는 토큰과 똑같이 거절되므로 바로 지워도 동작이 같다.
+retention과 같이 ID 순 retention_batch_size건씩 지우고 배치마다 커밋한다.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import select, delete, or_
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.user import RefreshToken, EmailVerificationToken, PasswordResetToken
+from app.services import retention
+from app.utils import metrics
+
+logger = logging.getLogger("token_cleanup")
+
+REPORT_KEY = "token_purge_last_report"
+MAX_BATCHES = 10000
+
+TOKEN_PURGED = metrics.Counter("collab_token_purged_total", "정리한 만료·폐기 토큰 수", ("table",))
+
+# 모델 → 폐기·사용 표시 컬럼
+_TABLES = (
+    (RefreshToken, RefreshToken.revoked),
+    (EmailVerificationToken, EmailVerificationToken.used),
+    (PasswordResetToken, PasswordResetToken.used),
+)
+
+
+def purge_table(db: Session, model, done_column, now: datetime, batch_size: int,
+                pause: float = retention.BATCH_PAUSE) -> int:
+    """만료됐거나 폐기·사용된 토큰을 배치 단위로 삭제. 삭제한 행 수 반환."""
+    condition = or_(done_column == True, model.expires_at < now)
+    purged = 0
+    for _ in range(MAX_BATCHES):
+        ids = db.execute(
+            select(model.id).where(condition).order_by(model.id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        db.execute(delete(model).where(model.id.in_(ids)))
+        db.commit()
+        purged += len(ids)
+        TOKEN_PURGED.inc(len(ids), table=model.__tablename__)
+        if len(ids) < batch_size:
+            break
+        time.sleep(pause)
+    return purged
+
+
+def run(db: Optional[Session] = None, pause: float = retention.BATCH_PAUSE) -> dict:
+    """세 토큰 테이블 정리 — 결과를 system_settings에 기록하고 반환 (스케줄러는 스레드풀에서 호출)"""
+    own = db is None
+    db = db or SessionLocal()
+    try:
+        started = time.perf_counter()
+        # expires_at은 UTC로 저장 (routers/auth.py)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        batch_size = retention.load_policy(db)["retention_batch_size"]
+        report = {"purged": {}}
+        for model, done_column in _TABLES:
+            report["purged"][model.__tablename__] = purge_table(db, model, done_column, now, batch_size, pause)
+        report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        report["seconds"] = round(time.perf_counter() - started, 2)
+        retention.save_report(db, report, REPORT_KEY, "마지막 만료 토큰 정리 결과 (자동 기록)")
+        logger.info("만료·폐기 토큰 정리: %s (%.1f초)", report["purged"], report["seconds"])
+        return report
+    finally:
+        if own:
+            db.close()
@@ -7,7 +7,7 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, read_session, SessionLocal
 from app.models.user import User
 from app.config import get_settings
 
@@ -71,3 +71,38 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     if user is None:
         raise credentials_exception
     return user
+
+
+def get_read_db(current_user: User = Depends(get_current_user)):
+    """조회 전용 핸들러의 DB 세션 — 읽기 복제본으로 라우팅 (쓰기 직후의 사용자는 primary)"""
+    with read_session(current_user.id) as db:
+        yield db
+
+
+def token_user_id(token: str) -> Optional[int]:
+    """액세스 토큰의 사용자 ID (서명만 확인, DB 조회 없음 — 미들웨어용)"""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        if payload.get("type", "access") != "access":
+            return None
+        return int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+
+def is_admin_token(token: str) -> bool:
+    """액세스 토큰이 활성 관리자 계정의 것인지 (의존성 주입 밖의 미들웨어용)"""
+    try:
+        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        if payload.get("type", "access") != "access":
+            return False
+        user_id = int(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return False
+    db = SessionLocal()
+    try:
+        return db.query(User.id).filter(
+            User.id == user_id, User.is_active == True, User.is_admin == True,
+        ).first() is not None
+    finally:
+        db.close()
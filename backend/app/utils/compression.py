@@ -0,0 +1,225 @@
+"""응답 압축 미들웨어 (gzip / brotli)
+
+Accept-Encoding 협상 후 JSON·CSV·텍스트 응답만 압축한다.
+- 단일 본문 응답은 minimum_size 미만이면 그대로 보낸다.
+- StreamingResponse(내보내기 등)는 원본이 STREAM_FLUSH_BYTES 쌓일 때마다 flush 해 보낸다.
+  청크마다 flush 하면 줄 단위 CSV에서 flush 블록 오버헤드로 압축하지 않은 것보다 커진다.
+- 첨부 파일처럼 이미 압축됐거나 바이너리인 경로는 exclude_paths로 제외한다.
+brotli 패키지가 없으면 gzip만 사용한다. 경로별 원본/전송 바이트는 compression_stats()로 조회.
+"""
+import threading
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+# 스트리밍 응답은 원본이 이만큼 쌓이면 그때까지의 압축 결과를 보낸다
+STREAM_FLUSH_BYTES = 64 * 1024
+
+_stats: Dict[Tuple[str, str], Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _is_compressible(content_type: str) -> bool:
+    base = content_type.split(";", 1)[0].strip().lower()
+    return base.startswith("text/") or base in _COMPRESSIBLE_TYPES or base.endswith("+json")
+
+
+def _negotiate(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", accepted.get("*", 0)) > 0:
+        return "gzip"
+    return None
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def encode(self, data: bytes, final: bool, flush: bool = True) -> bytes:
+        out = self._z.compress(data)
+        if final:
+            return out + self._z.flush(zlib.Z_FINISH)
+        return out + self._z.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._c = brotli.Compressor(quality=quality)
+
+    def encode(self, data: bytes, final: bool, flush: bool = True) -> bytes:
+        out = self._c.process(data)
+        if final:
+            return out + self._c.finish()
+        return out + self._c.flush() if flush else out
+
+
+def _record(method: str, route: str, bytes_in: int, bytes_out: int, compressed: bool) -> None:
+    with _stats_lock:
+        s = _stats.setdefault((method, route), {"responses": 0, "compressed": 0, "bytes_in": 0, "bytes_out": 0})
+        s["responses"] += 1
+        s["compressed"] += int(compressed)
+        s["bytes_in"] += bytes_in
+        s["bytes_out"] += bytes_out
+
+
+def compression_stats() -> list:
+    """경로별 누적 응답 바이트와 압축률 (원본 바이트 많은 순)"""
+    with _stats_lock:
+        items = [(k, dict(v)) for k, v in _stats.items()]
+    result = []
+    for (method, route), s in items:
+        result.append({
+            "method": method,
+            "route": route,
+            **s,
+            "ratio": round(s["bytes_out"] / s["bytes_in"], 3) if s["bytes_in"] else 1.0,
+            "saved_bytes": s["bytes_in"] - s["bytes_out"],
+        })
+    return sorted(result, key=lambda r: r["bytes_in"], reverse=True)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _Responder(self, scope, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _Responder:
+    def __init__(self, mw: CompressionMiddleware, scope, encoding: Optional[str], send):
+        self.mw = mw
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self.start_message = None
+        self.encoder = None
+        self.decided = False
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.pending_in = 0  # 마지막 flush 뒤 인코더에 넣은 원본 바이트
+        self.pending_out = bytearray()  # 아직 보내지 않은 압축 결과
+
+    def _route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or "(unmatched)"
+
+    def _should_compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if self.encoding is None or self.start_message["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers or not _is_compressible(headers.get("content-type", "")):
+            return False
+        if not more_body:
+            return len(body) >= self.mw.minimum_size
+        length = headers.get("content-length")
+        return length is None or int(length) >= self.mw.minimum_size
+
+    def _new_encoder(self):
+        if self.encoding == "br":
+            return _BrotliEncoder(self.mw.brotli_quality)
+        return _GzipEncoder(self.mw.gzip_level)
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # 인코딩된 표현은 원본과 바이트가 다르므로 강한 ETag를 약한 ETag로 (nginx gzip과 동일)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        self.bytes_in += len(body)
+
+        if not self.decided:
+            self.decided = True
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if self._should_compress(headers, body, more_body):
+                self.encoder = self._new_encoder()
+                encoded = self._encode(body, more_body)
+                if not more_body and len(encoded) >= len(body):
+                    # 압축 이득이 없으면 원본 전송
+                    self.encoder = None
+                else:
+                    self._mark_encoded(headers)
+                    if more_body:
+                        del headers["content-length"]
+                    else:
+                        headers["Content-Length"] = str(len(encoded))
+                    body = encoded
+            elif self.encoding is not None and _is_compressible(headers.get("content-type", "")):
+                headers.add_vary_header("Accept-Encoding")
+            await self._send(self.start_message)
+        elif self.encoder is not None:
+            body = self._encode(body, more_body)
+
+        self.bytes_out += len(body)
+        if body or not more_body:
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+        if not more_body:
+            _record(self.scope["method"], self._route(), self.bytes_in, self.bytes_out, self.encoder is not None)
+
+    def _encode(self, body: bytes, more_body: bool) -> bytes:
+        """압축 결과 중 지금 보낼 부분 (스트리밍 중에는 원본이 STREAM_FLUSH_BYTES 쌓일 때까지 모은다)"""
+        if not more_body:
+            out = bytes(self.pending_out) + self.encoder.encode(body, final=True)
+            self.pending_out.clear()
+            return out
+        self.pending_in += len(body)
+        flush = self.pending_in >= STREAM_FLUSH_BYTES
+        self.pending_out += self.encoder.encode(body, final=False, flush=flush)
+        if not flush:
+            return b""
+        self.pending_in = 0
+        out = bytes(self.pending_out)
+        self.pending_out.clear()
+        return out
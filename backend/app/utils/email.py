@@ -1,14 +1,25 @@
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
+import time
+from fastapi import BackgroundTasks
 from app.config import get_settings
+from app.utils import lazy, metrics
+
+fastapi_mail = lazy.module("fastapi_mail")  # import만 0.2초 — 첫 발송 때 불러온다
+
+EMAIL_QUEUE_DEPTH = metrics.Gauge("collab_email_queue_depth", "백그라운드 발송 대기·진행 중인 메일 수")
+EMAILS_SENT = metrics.Counter("collab_emails_total", "메일 발송 시도 수", ("result",))
+EMAIL_SEND_SECONDS = metrics.Histogram(
+    "collab_email_send_duration_seconds", "메일 1건 SMTP 발송 시간",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
 
 # FastMail 인스턴스를 지연 생성 (모듈 로드 시 .env 없어도 오류 없도록)
 _fm = None
 
-def _get_fm() -> FastMail:
+def _get_fm():
     global _fm
     if _fm is None:
         settings = get_settings()
-        mail_config = ConnectionConfig(
+        mail_config = fastapi_mail.ConnectionConfig(
             MAIL_USERNAME=settings.mail_username,
             MAIL_PASSWORD=settings.mail_password,
             MAIL_FROM=settings.mail_from,
@@ -18,18 +29,38 @@ def _get_fm() -> FastMail:
             MAIL_SSL_TLS=False,
             USE_CREDENTIALS=True,
         )
-        _fm = FastMail(mail_config)
+        _fm = fastapi_mail.FastMail(mail_config)
     return _fm
 
 
+def enqueue(background_tasks: BackgroundTasks, func, *args) -> None:
+    """응답 후 발송할 메일을 BackgroundTasks에 등록 (대기 건수를 메트릭으로 집계)"""
+    EMAIL_QUEUE_DEPTH.inc()
+    background_tasks.add_task(_run_queued, func, *args)
+
+
+async def _run_queued(func, *args):
+    try:
+        await func(*args)
+    finally:
+        EMAIL_QUEUE_DEPTH.dec()
+
+
 async def send_notification_email(to: str, subject: str, body: str):
-    message = MessageSchema(
+    message = fastapi_mail.MessageSchema(
         subject=subject,
         recipients=[to],
         body=body,
-        subtype=MessageType.html,
+        subtype=fastapi_mail.MessageType.html,
     )
-    await _get_fm().send_message(message)
+    start = time.perf_counter()
+    result = "error"
+    try:
+        await _get_fm().send_message(message)
+        result = "success"
+    finally:
+        EMAIL_SEND_SECONDS.observe(time.perf_counter() - start)
+        EMAILS_SENT.inc(result=result)
 
 
 async def send_task_assigned(to: str, assignee_name: str, task_title: str, assigner_name: str, due_date: str):
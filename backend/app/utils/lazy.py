@@ -0,0 +1,70 @@
+"""선택 기능 의존성의 지연 import
+
+메일(fastapi_mail), 엑셀 내보내기·가져오기(openpyxl), 첨부 파일 서명 검사(filetype),
+예약 작업(apscheduler)은 일부 요청·리더 워커에서만 쓰이므로 부팅 시 불러오지 않는다.
+모듈 상단에서 `openpyxl = lazy.module("openpyxl")` 로 선언하고 평소처럼 속성을 쓰면
+첫 사용 때 import된다. 워커 수만큼 곱해지는 기동 시간·상주 메모리(RSS)를 줄이기 위함.
+- 미설치면 첫 사용 때 ImportError (기존 인라인 import와 같은 동작)
+- 실제로 불러온 모듈과 걸린 시간은 /metrics 의 collab_lazy_import_seconds 로 확인
+- scripts/check_import_budget.py 가 이 목록이 부팅 시 import되지 않는지 검사한다
+"""
+import importlib
+import threading
+import time
+from types import ModuleType
+
+from app.utils import metrics
+
+_lock = threading.Lock()
+_declared: dict = {}  # 모듈 이름 → LazyModule
+_loaded: dict = {}    # 모듈 이름 → import에 걸린 초
+
+metrics.Gauge(
+    "collab_lazy_import_seconds", "지연 import한 선택 모듈의 첫 import 시간", ("module",),
+    collect=lambda: {(name,): seconds for name, seconds in list(_loaded.items())},
+)
+
+
+class LazyModule:
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            with _lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    self._module = importlib.import_module(self._name)
+                    _loaded[self._name] = time.perf_counter() - start
+                module = self._module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def module(name: str) -> LazyModule:
+    """첫 속성 접근 때 import되는 모듈 대리 객체 (같은 이름이면 같은 객체)"""
+    with _lock:
+        proxy = _declared.get(name)
+        if proxy is None:
+            proxy = _declared[name] = LazyModule(name)
+    return proxy
+
+
+def declared() -> list:
+    """지연 import로 선언된 모듈 이름 (부팅 시 import되면 안 되는 목록)"""
+    return sorted(_declared)
+
+
+def loaded() -> dict:
+    """지금까지 실제로 불러온 지연 모듈과 import 시간(ms)"""
+    return {name: round(seconds * 1000, 1) for name, seconds in _loaded.items()}
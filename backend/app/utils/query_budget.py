@@ -0,0 +1,155 @@
+"""요청 단위 SQL 예산 검사 / N+1 감지 (테스트·개발 모드 전용)
+
+QUERY_BUDGET_MODE=warn|enforce 일 때만 동작한다 (기본 off — 운영에서는 리스너도 달지 않음).
+- 요청 동안 실행된 SQL을 모두 기록하고, 리터럴·IN 목록을 ?로 치환한 "모양"이
+  repeat_threshold번 이상 반복되면 N+1 의심으로 본다.
+- 엔드포인트별 최대 쿼리 수는 @query_budget(n)으로 선언한다. 선언이 없으면 DEFAULT_BUDGET.
+  입력 크기에 비례하는 것이 의도된 SQL(예: PK가 필요한 행별 INSERT)은 allow=에 모양의
+  앞부분을 적어 예산·반복 검사에서 제외한다.
+- warn: 로그만 남긴다. enforce: 응답 후 QueryBudgetExceeded를 발생시켜
+  TestClient(raise_server_exceptions=True) 기반 검사를 실패시킨다.
+scripts/check_query_budgets.py가 SQLite 위에서 주요 엔드포인트를 호출해 예산을 검사한다.
+"""
+import logging
+import re
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger("query_budget")
+
+DEFAULT_BUDGET = 20
+MODES = ("off", "warn", "enforce")
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_ROWS = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_SPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(max_queries: int, allow: Tuple[str, ...] = ()):
+    """엔드포인트 최대 SQL 수 선언. 라우터 데코레이터 아래에 둔다."""
+    def decorator(func):
+        func.__query_budget__ = (max_queries, tuple(allow))
+        return func
+    return decorator
+
+
+def normalize(statement: str) -> str:
+    """SQL 문을 값과 무관한 모양으로 (같은 쿼리를 값만 바꿔 반복하면 같은 결과)"""
+    shape = _STRING.sub("?", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _SPACE.sub(" ", shape).strip()
+    shape = _IN_LIST.sub("(?)", shape)
+    return _VALUES_ROWS.sub(r"\1", shape)
+
+
+class _Recorder:
+    __slots__ = ("statements",)
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+
+_current: ContextVar[Optional[_Recorder]] = ContextVar("collab_query_recorder", default=None)
+_reports: deque = deque(maxlen=500)
+_reports_lock = threading.Lock()
+
+
+def install(engine) -> None:
+    """엔진의 모든 SQL을 현재 요청의 기록기에 추가"""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        recorder = _current.get()
+        if recorder is not None:
+            recorder.statements.append(statement)
+
+
+@contextmanager
+def recording():
+    """블록 안에서 실행된 SQL을 기록 (요청 밖의 스케줄러 작업 검사용)"""
+    recorder = _Recorder()
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+def evaluate(
+    label: str,
+    statements: List[str],
+    budget: int,
+    repeat_threshold: int = 5,
+    allow: Tuple[str, ...] = (),
+):
+    """(보고서, 문제 목록) — 예산 초과와 반복되는 SQL 모양을 찾는다"""
+    shapes = [normalize(s) for s in statements]
+    counted = [shape for shape in shapes if not shape.startswith(allow)] if allow else shapes
+    repeated = [(shape, n) for shape, n in Counter(counted).most_common() if n >= repeat_threshold]
+    report = {
+        "label": label,
+        "queries": len(counted),
+        "budget": budget,
+        "repeated": repeated,
+        "statements": list(statements),
+    }
+    problems = []
+    if len(counted) > budget:
+        problems.append(f"SQL {len(counted)}건 (예산 {budget}건)")
+    for shape, n in repeated:
+        problems.append(f"같은 모양의 SQL {n}회 반복(N+1 의심): {shape[:200]}")
+    return report, problems
+
+
+def reports() -> list:
+    """최근 요청별 검사 결과 (오래된 순)"""
+    with _reports_lock:
+        return list(_reports)
+
+
+def clear_reports() -> None:
+    with _reports_lock:
+        _reports.clear()
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app, mode: str = "warn", repeat_threshold: int = 5):
+        if mode not in MODES:
+            raise ValueError(f"QUERY_BUDGET_MODE는 {', '.join(MODES)} 중 하나여야 합니다: {mode}")
+        self.app = app
+        self.mode = mode
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if self.mode == "off" or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with recording() as recorder:
+            await self.app(scope, receive, send)
+
+        route = scope.get("route")
+        label = f"{scope['method']} {getattr(route, 'path', None) or scope['path']}"
+        budget, allow = getattr(getattr(route, "endpoint", None), "__query_budget__", (DEFAULT_BUDGET, ()))
+        report, problems = evaluate(label, recorder.statements, budget, self.repeat_threshold, allow)
+        report["problems"] = problems
+        with _reports_lock:
+            _reports.append(report)
+        if not problems:
+            return
+        message = f"{label}: " + " / ".join(problems)
+        if self.mode == "enforce":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
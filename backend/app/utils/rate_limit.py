@@ -0,0 +1,338 @@
+"""요청 제한 (토큰 버킷, 워커 간 공유 저장소)
+
+- 키: 유효한 액세스 토큰이면 사용자 ID, 아니면 실제 클라이언트 IP.
+  nginx 등 신뢰하는 프록시(RATE_LIMIT_TRUSTED_PROXIES)에서 온 요청은 X-Forwarded-For를
+  오른쪽부터 읽어 처음 나오는 신뢰하지 않는 주소를 클라이언트로 본다.
+- 규칙: 비싼 경로(내보내기·가져오기·검색·일괄 변경·로그인)는 expensive, 나머지는 default 버킷.
+  "200/minute" 는 용량 200, 분당 200개씩 채워지는 버킷이다 (순간 폭주 200건까지 허용).
+- 저장소(RATE_LIMIT_STORAGE):
+  database — rate_limit_buckets 테이블을 SELECT ... FOR UPDATE 로 갱신 (기본값, 추가 인프라 없음)
+  redis    — Lua 스크립트로 원자적 갱신, 시각은 Redis 서버 기준 (redis 패키지 필요)
+  memory   — 프로세스 메모리. 워커마다 따로 세므로 run_server.py 멀티 워커에서는 시작을 거부한다
+- 저장소 장애 시에는 요청을 허용하고(fail-open) 오류 수만 메트릭에 남긴다.
+"""
+import ipaddress
+import logging
+import math
+import re
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+from urllib.parse import parse_qs
+
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+
+from app.utils import metrics
+from app.utils.workers import is_supervised
+
+logger = logging.getLogger("rate_limit")
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE_RE = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$")
+
+# (메서드, 경로 접두사) — 검색은 GET /api/tasks/ 중 search 파라미터가 있을 때
+EXPENSIVE_ROUTES = (
+    ("GET", "/api/tasks/export"),
+    ("POST", "/api/tasks/import"),
+    ("POST", "/api/tasks/bulk-status"),
+    ("POST", "/api/admin/tasks/bulk-reassign"),
+    ("POST", "/api/auth/login"),
+    ("POST", "/api/auth/register"),
+    ("POST", "/api/auth/change-password"),
+    ("POST", "/api/auth/forgot-password"),
+)
+SEARCH_ROUTES = ("/api/tasks/", "/api/tasks")
+
+DECISIONS = metrics.Counter(
+    "collab_rate_limit_requests_total", "요청 제한 판정 수", ("rule", "result"))
+STORE_ERRORS = metrics.Counter(
+    "collab_rate_limit_store_errors_total", "요청 제한 저장소 오류 수 (fail-open)", ("storage",))
+STORE_SECONDS = metrics.Histogram(
+    "collab_rate_limit_store_seconds", "요청 제한 저장소 갱신 시간", ("storage",), buckets=metrics.QUERY_BUCKETS)
+
+
+def parse_rate(value: str) -> Tuple[float, float]:
+    """'200/minute' → (용량 200, 초당 보충 200/60)"""
+    m = _RATE_RE.match(value)
+    if not m:
+        raise ValueError(f"요청 제한 형식이 잘못되었습니다 (예: 200/minute): {value}")
+    count = float(m.group(1))
+    return count, count / _PERIODS[m.group(2)]
+
+
+def _refill(tokens: float, elapsed: float, capacity: float, rate: float, cost: float):
+    """(허용 여부, 남은 토큰, 재시도까지 초)"""
+    tokens = min(capacity, tokens + max(0.0, elapsed) * rate)
+    if tokens >= cost:
+        return True, tokens - cost, 0.0
+    return False, tokens, (cost - tokens) / rate
+
+
+# ── 저장소 ────────────────────────────────────────────────────
+
+class MemoryStore:
+    name = "memory"
+    blocking = False
+    PRUNE_EVERY = 5000
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            allowed, tokens, retry_after = _refill(tokens, now - updated, capacity, rate, cost)
+            self._buckets[key] = (tokens, now)
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                self._prune(now)
+        return allowed, tokens, retry_after
+
+    def _prune(self, now: float) -> None:
+        # 한 시간 넘게 쓰이지 않은 버킷은 이미 가득 찼으므로 지워도 결과가 같다
+        stale = [k for k, (_, updated) in self._buckets.items() if now - updated > 3600]
+        for k in stale:
+            del self._buckets[k]
+
+
+_REDIS_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(b[1]) or capacity
+local ts = tonumber(b[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisStore:
+    name = "redis"
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "collab:rl:"):
+        import redis  # RATE_LIMIT_STORAGE=redis 일 때만 필요
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self._script = self._client.register_script(_REDIS_SCRIPT)
+        self._prefix = prefix
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0):
+        allowed, tokens = self._script(keys=[self._prefix + key], args=[capacity, rate, cost])
+        tokens = float(tokens)
+        return bool(allowed), tokens, 0.0 if allowed else (cost - tokens) / rate
+
+
+class DatabaseStore:
+    name = "database"
+    blocking = True
+    PRUNE_EVERY = 1000
+
+    def __init__(self):
+        self._calls = 0
+
+    def take(self, key: str, capacity: float, rate: float, cost: float = 1.0):
+        from sqlalchemy import delete, insert, select, update
+        from sqlalchemy.exc import IntegrityError
+        from app.database import engine
+        from app.models.rate_limit import RateLimitBucket
+
+        table = RateLimitBucket.__table__
+        for attempt in range(2):
+            now = time.time()
+            try:
+                with engine.begin() as conn:
+                    row = conn.execute(
+                        select(table.c.tokens, table.c.updated_at)
+                        .where(table.c.bucket_key == key).with_for_update()
+                    ).first()
+                    tokens, updated = (capacity, now) if row is None else (row.tokens, row.updated_at)
+                    allowed, tokens, retry_after = _refill(tokens, now - updated, capacity, rate, cost)
+                    if row is None:
+                        conn.execute(insert(table).values(bucket_key=key, tokens=tokens, updated_at=now))
+                    else:
+                        conn.execute(
+                            update(table).where(table.c.bucket_key == key).values(tokens=tokens, updated_at=now))
+                break
+            except IntegrityError:  # 다른 워커가 같은 새 키를 먼저 넣음 → 한 번 더
+                if attempt:
+                    raise
+        self._calls += 1
+        if self._calls % self.PRUNE_EVERY == 0:
+            with engine.begin() as conn:
+                conn.execute(delete(table).where(table.c.updated_at < now - 3600))
+        return allowed, tokens, retry_after
+
+
+def make_store(storage: str, redis_url: str = ""):
+    if storage == "memory":
+        return MemoryStore()
+    if storage == "redis":
+        return RedisStore(redis_url)
+    if storage == "database":
+        return DatabaseStore()
+    raise ValueError(f"RATE_LIMIT_STORAGE는 memory, redis, database 중 하나여야 합니다: {storage}")
+
+
+# ── 키·규칙 ───────────────────────────────────────────────────
+
+def _has_search(query_string: bytes) -> bool:
+    """search 파라미터가 비어 있지 않은지 (x_search= 나 search= 는 검색이 아님)"""
+    if b"search=" not in query_string:
+        return False
+    values = parse_qs(query_string.decode("latin-1")).get("search", [])
+    return any(v.strip() for v in values)
+
+
+def _parse_networks(values: Iterable[str]):
+    networks = []
+    for value in values:
+        value = value.strip()
+        if value:
+            networks.append(ipaddress.ip_network(value, strict=False))
+    return networks
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        store,
+        rules: Dict[str, str],
+        trusted_proxies: Iterable[str] = ("127.0.0.1", "::1"),
+        secret_key: str = "",
+        enabled: bool = True,
+    ):
+        self.store = store
+        self.rules = {name: parse_rate(rate) for name, rate in rules.items()}
+        self.limits = dict(rules)
+        self.trusted = _parse_networks(trusted_proxies)
+        self.secret_key = secret_key
+        self.enabled = enabled
+
+    @classmethod
+    def from_settings(cls, settings) -> "RateLimiter":
+        if settings.rate_limit_enabled and settings.rate_limit_storage == "memory" and is_supervised():
+            raise ValueError(
+                "RATE_LIMIT_STORAGE=memory는 워커마다 따로 세므로 멀티 워커에서 쓸 수 없습니다. "
+                "database 또는 redis로 설정하세요.")
+        return cls(
+            make_store(settings.rate_limit_storage, settings.rate_limit_redis_url),
+            {"default": settings.rate_limit_default, "expensive": settings.rate_limit_expensive},
+            trusted_proxies=settings.rate_limit_trusted_proxies,
+            secret_key=settings.secret_key,
+            enabled=settings.rate_limit_enabled,
+        )
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted)
+
+    def client_ip(self, scope, headers: dict) -> str:
+        peer = (scope.get("client") or ("unknown",))[0]
+        if not self._is_trusted(peer):
+            return peer
+        forwarded = [a.strip() for a in headers.get(b"x-forwarded-for", b"").decode("latin-1").split(",") if a.strip()]
+        for address in reversed(forwarded):
+            if not self._is_trusted(address):
+                return address
+        return forwarded[0] if forwarded else peer
+
+    def identity(self, scope, headers: dict) -> str:
+        """'user:<id>' (유효한 액세스 토큰) 또는 'ip:<주소>'"""
+        scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+        if token and scheme.lower() == "bearer" and self.secret_key:
+            try:
+                payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+                if payload.get("type", "access") == "access" and payload.get("sub"):
+                    return f"user:{payload['sub']}"
+            except JWTError:
+                pass
+        return f"ip:{self.client_ip(scope, headers)}"
+
+    @staticmethod
+    def rule_for(scope) -> str:
+        method, path = scope["method"], scope["path"]
+        if any(method == m and path.startswith(p) for m, p in EXPENSIVE_ROUTES):
+            return "expensive"
+        if method == "GET" and path in SEARCH_ROUTES and _has_search(scope.get("query_string", b"")):
+            return "expensive"
+        return "default"
+
+    async def check(self, scope) -> Tuple[str, bool, float, float]:
+        """(규칙, 허용 여부, 남은 토큰, 재시도까지 초)"""
+        headers = dict(scope.get("headers", ()))
+        rule = self.rule_for(scope)
+        capacity, rate = self.rules[rule]
+        key = f"{rule}:{self.identity(scope, headers)}"
+        start = time.perf_counter()
+        try:
+            if self.store.blocking:
+                allowed, remaining, retry_after = await run_in_threadpool(self.store.take, key, capacity, rate)
+            else:
+                allowed, remaining, retry_after = self.store.take(key, capacity, rate)
+        except Exception as e:
+            STORE_ERRORS.inc(storage=self.store.name)
+            logger.warning("요청 제한 저장소 오류 (요청 허용): %s", e)
+            return rule, True, capacity, 0.0
+        finally:
+            STORE_SECONDS.observe(time.perf_counter() - start, storage=self.store.name)
+        DECISIONS.inc(rule=rule, result="allowed" if allowed else "throttled")
+        return rule, allowed, remaining, retry_after
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, limiter: RateLimiter, exclude_paths: Iterable[str] = ("/health", "/metrics")):
+        self.app = app
+        self.limiter = limiter
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http" or not self.limiter.enabled
+            or scope["method"] == "OPTIONS" or scope["path"].startswith(self.exclude_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        rule, allowed, remaining, retry_after = await self.limiter.check(scope)
+        limit_headers = [
+            (b"x-ratelimit-limit", self.limiter.limits[rule].encode()),
+            (b"x-ratelimit-remaining", str(int(remaining)).encode()),
+        ]
+        if not allowed:
+            body = '{"detail":"요청이 너무 많습니다. 잠시 후 다시 시도해주세요."}'.encode()
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": limit_headers + [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + limit_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,37 @@
+"""orjson 기반 JSON 응답 클래스
+
+datetime/date/Enum은 orjson이 직접 직렬화하고(Python isoformat과 같은 형식),
+Decimal·set 등은 _default에서 jsonable_encoder와 같은 규칙으로 변환한다.
+FastAPI는 dict를 반환하면 jsonable_encoder를 한 번 더 거치므로, 목록 엔드포인트는
+FastJSONResponse 인스턴스를 직접 반환해 그 단계를 건너뛴다.
+orjson이 설치되지 않은 환경에서는 기존 JSONResponse 동작으로 대체된다.
+"""
+from decimal import Decimal
+from typing import Any
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        # jsonable_encoder(decimal_encoder)와 동일: 정수값이면 int, 아니면 float
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
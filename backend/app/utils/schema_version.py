@@ -0,0 +1,71 @@
+"""부팅 시 DB 스키마 버전 확인 (Alembic)
+
+create_all은 테이블마다 메타데이터를 조회해 부팅이 느리고, 기존 테이블의 컬럼·인덱스 변경은
+반영하지도 못한다. SCHEMA_BOOT_MODE=verify(기본)면 alembic_version을 한 번 조회해
+코드의 head 리비전과 비교하고, 다르면 바로 실패한다 — 테이블 생성·변경은 `alembic upgrade head`로만.
+head는 alembic을 import하지 않고 versions/*.py의 revision / down_revision 선언만 읽어 계산한다.
+"""
+import re
+from pathlib import Path
+from typing import Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+VERSIONS_DIR = Path(__file__).resolve().parents[2] / "alembic" / "versions"
+BOOT_MODES = ("verify", "create_all", "skip")
+# alembic_version 기록을 넣기 전의 sql/schema.sql이 만든 스키마 (그 뒤 마이그레이션은 미적용)
+BASELINE_REVISION = "0001"
+
+_REVISION = re.compile(r"^revision\s*(?::[^=]+)?=\s*[\"'](\w+)[\"']", re.M)
+_DOWN_REVISION = re.compile(r"^down_revision\s*(?::[^=]+)?=\s*(?:[\"'](\w+)[\"']|None)", re.M)
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def code_heads(versions_dir: Path = VERSIONS_DIR) -> Set[str]:
+    """마이그레이션 파일에서 다른 리비전의 down_revision이 아닌 리비전(= head)"""
+    revisions, parents = set(), set()
+    for path in versions_dir.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION.search(source)
+        if not revision:
+            continue
+        revisions.add(revision.group(1))
+        down = _DOWN_REVISION.search(source)
+        if down and down.group(1):
+            parents.add(down.group(1))
+    return revisions - parents
+
+
+def db_revision(engine) -> Optional[str]:
+    """DB에 기록된 리비전 (alembic_version 테이블이 없으면 None)"""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except DBAPIError as e:
+        if "alembic_version" in str(e.orig if e.orig is not None else e):
+            return None
+        raise
+
+
+def verify(engine) -> str:
+    heads = code_heads()
+    if len(heads) != 1:
+        raise SchemaVersionError(f"마이그레이션 head가 하나가 아닙니다: {sorted(heads)} (alembic merge 필요)")
+    head = heads.pop()
+    current = db_revision(engine)
+    if current != head:
+        if current is None:
+            # 리비전 기록이 없는 DB는 alembic_version을 넣기 전의 sql/schema.sql(= 0001)로 만든 것
+            action = (f"`alembic stamp {BASELINE_REVISION} && alembic upgrade head`를 실행하세요 "
+                      "(stamp head는 그 뒤 테이블을 만들지 않고 건너뛰므로 안 됨)")
+        else:
+            action = "`alembic upgrade head`를 실행하세요"
+        raise SchemaVersionError(
+            f"DB 스키마 버전 불일치: DB={current or '없음'}, 코드={head}. {action}. "
+            "개발 환경에서는 SCHEMA_BOOT_MODE=create_all 로 실행할 수 있습니다."
+        )
+    return head
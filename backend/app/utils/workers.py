@@ -0,0 +1,48 @@
+"""멀티 프로세스 실행 보조 (run_server.py)
+
+- default_workers(): WEB_CONCURRENCY 설정이 없으면 이 프로세스가 쓸 수 있는 CPU 수
+  (bcrypt 해시·JSON 직렬화가 CPU를 쓰므로 코어당 워커 하나)
+- RecycleMiddleware: 워커가 max_requests(+0~jitter 무작위)건을 처리하면 자기 자신에게 SIGTERM을
+  보내 진행 중인 요청을 마치고 종료한다. uvicorn 수퍼바이저가 새 워커를 띄우며, 워커마다 한도가
+  달라 동시에 재시작되지 않는다. 수퍼바이저 아래(run_server.py, 워커 2개 이상)에서만 설치한다.
+"""
+import logging
+import os
+import random
+import signal
+
+logger = logging.getLogger("workers")
+
+SUPERVISED_ENV = "COLLAB_TODO_SUPERVISED"
+
+
+def cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS·Windows
+        return os.cpu_count() or 1
+
+
+def default_workers(configured: int = 0) -> int:
+    return configured if configured > 0 else cpu_count()
+
+
+def is_supervised() -> bool:
+    return os.environ.get(SUPERVISED_ENV) == "1"
+
+
+class RecycleMiddleware:
+    def __init__(self, app, max_requests: int, jitter: int = 0):
+        self.app = app
+        self.limit = max_requests + random.randint(0, max(jitter, 0))
+        self.count = 0
+        self.recycling = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.count += 1
+            if self.count >= self.limit and not self.recycling:
+                self.recycling = True
+                logger.info("워커 재시작: %d건 처리 (pid=%s)", self.count, os.getpid())
+                os.kill(os.getpid(), signal.SIGTERM)
+        await self.app(scope, receive, send)
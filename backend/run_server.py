@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Collab Todo 백엔드 실행 (멀티 프로세스)
+============================================================
+사용법:
+  cd backend
+  python run_server.py                 # WEB_CONCURRENCY 또는 CPU 수만큼 워커
+  python run_server.py --workers 1     # 단일 프로세스
+
+- 워커는 각각 DB 커넥션 풀(기본 최대 15개)을 가지므로 MySQL max_connections를 확인할 것.
+- 예약 작업은 리더로 선출된 워커 하나만 실행한다 (SCHEDULER_LOCK, app/services/leader.py).
+- 워커 재시작: WORKER_MAX_REQUESTS(+ 무작위 JITTER)건마다 하나씩 자동 교체.
+  전체 교체는 마스터에 SIGHUP (kill -HUP <PID>) — 워커를 하나씩 새로 띄운다.
+- 종료 시 진행 중인 요청은 WORKER_GRACEFUL_TIMEOUT초까지 기다린다.
+- /metrics는 어느 워커가 받든 전체 워커 합산 (워커별 값을 임시 디렉터리에 공유, app/utils/metrics.py).
+============================================================
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+import uvicorn
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import get_settings
+from app.utils.metrics import SHARED_DIR_ENV
+from app.utils.workers import SUPERVISED_ENV, default_workers
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Collab Todo 백엔드 실행")
+    parser.add_argument("--host", default=settings.app_host)
+    parser.add_argument("--port", type=int, default=settings.app_port)
+    parser.add_argument("--workers", type=int, default=default_workers(settings.web_concurrency))
+    args = parser.parse_args()
+
+    metrics_dir = None
+    if args.workers > 1:
+        os.environ[SUPERVISED_ENV] = "1"  # 워커 자동 재시작(RecycleMiddleware) 허용
+        if not os.environ.get(SHARED_DIR_ENV):
+            # 실행마다 새 디렉터리 — 이전 실행의 워커 값이 섞이지 않게
+            metrics_dir = os.environ[SHARED_DIR_ENV] = tempfile.mkdtemp(prefix="collab-metrics-")
+    print(f"CollabTodo 백엔드: {args.host}:{args.port}, 워커 {args.workers}개, 스케줄러 잠금 {settings.scheduler_lock}")
+    uvicorn.run(
+        "app.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        proxy_headers=True,
+        forwarded_allow_ips=",".join(settings.rate_limit_trusted_proxies),
+        timeout_graceful_shutdown=settings.worker_graceful_timeout,
+    )
+    if metrics_dir:
+        shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - 응답 압축 전송량 측정
+============================================================
+사용법:
+  cd backend
+  python scripts/bench_compression.py [--rows 5000] [--encoding gzip]
+
+업무 목록 형태의 payload를 CompressionMiddleware(app.utils.compression)에 통과시켜
+  - JSON 목록: 단일 본문 응답
+  - CSV 내보내기: export_tasks와 같이 StreamingResponse(io.BytesIO)로 한 줄씩 스트리밍
+의 원본 바이트, 전송 바이트, 본문 메시지 수를 한 번에 압축(gzip.compress / brotli)한 크기와 비교한다.
+스트리밍 전송량이 한 번에 압축한 크기보다 크게 늘면 flush 간격(STREAM_FLUSH_BYTES)을 의심할 것.
+DB 없이 실행된다.
+============================================================
+"""
+import argparse
+import asyncio
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.responses import Response, StreamingResponse
+
+from app.utils.compression import CompressionMiddleware, STREAM_FLUSH_BYTES, brotli
+
+
+def _rows(n: int) -> list:
+    statuses = ["대기", "진행중", "검토요청", "완료", "반려"]
+    base = date(2026, 1, 1)
+    return [
+        {
+            "id": i,
+            "title": f"업무 {i} - 주간 보고서 작성 및 검토",
+            "status": statuses[i % len(statuses)],
+            "priority": ["긴급", "높음", "보통", "낮음"][i % 4],
+            "assigner": f"사용자{i % 37}",
+            "assignee": f"사용자{i % 53}",
+            "category": f"분류{i % 7}",
+            "tags": ", ".join(f"태그{j}" for j in range(i % 3)),
+            "progress": (i * 7) % 101,
+            "due_date": (base + timedelta(days=i % 365)).isoformat(),
+            "created_at": f"2026-01-{1 + i % 28:02d} 09:{i % 60:02d}",
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def _csv_bytes(rows: list) -> bytes:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(list(rows[0]))
+    for r in rows:
+        writer.writerow(list(r.values()))
+    return ("\ufeff" + output.getvalue()).encode("utf-8")
+
+
+async def _measure(response, encoding: str) -> dict:
+    app = CompressionMiddleware(response)
+    scope = {
+        "type": "http", "method": "GET", "path": "/api/tasks/export",
+        "headers": [(b"accept-encoding", encoding.encode())],
+    }
+    messages = []
+
+    async def receive():  # 연결 끊김 없음 (StreamingResponse가 끝까지 보내도록)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    bodies = [m for m in messages if m["type"] == "http.response.body"]
+    headers = dict(messages[0]["headers"])
+    return {
+        "encoding": headers.get(b"content-encoding", b"identity").decode(),
+        "messages": len(bodies),
+        "sent": sum(len(m.get("body", b"")) for m in bodies),
+    }
+
+
+def _one_shot(data: bytes, encoding: str) -> int:
+    if encoding == "br":
+        return len(brotli.compress(data, quality=4))
+    return len(gzip.compress(data, compresslevel=6))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="응답 압축 전송량 측정")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--encoding", choices=["gzip", "br"], default="gzip")
+    args = parser.parse_args()
+    if args.encoding == "br" and brotli is None:
+        sys.exit("brotli 패키지가 없습니다.")
+
+    rows = _rows(args.rows)
+    json_body = json.dumps({"items": rows}, ensure_ascii=False).encode("utf-8")
+    csv_body = _csv_bytes(rows)
+    cases = [
+        ("JSON 목록 (단일 본문)", json_body,
+         lambda: Response(json_body, media_type="application/json")),
+        ("CSV 내보내기 (줄 단위 스트리밍)", csv_body,
+         lambda: StreamingResponse(io.BytesIO(csv_body), media_type="text/csv; charset=utf-8")),
+    ]
+
+    print(f"행 {args.rows}개, {args.encoding}, STREAM_FLUSH_BYTES={STREAM_FLUSH_BYTES}")
+    print(f"{'응답':<32}{'원본':>10}{'전송':>10}{'한 번에':>10}{'배율':>7}{'메시지':>8}")
+    for name, raw, make in cases:
+        r = asyncio.run(_measure(make(), args.encoding))
+        one_shot = _one_shot(raw, args.encoding)
+        print(f"{name:<32}{len(raw):>10}{r['sent']:>10}{one_shot:>10}"
+              f"{r['sent'] / one_shot:>7.2f}{r['messages']:>8}  ({r['encoding']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - JSON 응답 직렬화 마이크로벤치마크
+============================================================
+사용법:
+  cd backend
+  python scripts/bench_json.py [--sizes 100,1000] [--repeat 50]
+
+목록 응답(list_tasks / sync / notifications) 형태의 payload를 만들어
+  - 기존 경로: dict 반환 → jsonable_encoder → JSONResponse(json.dumps)
+  - sync 기존 경로: 행마다 Pydantic 모델 생성 → jsonable_encoder → json.dumps
+  - 신규 경로: FastJSONResponse(orjson) 직접 반환
+의 1회 직렬화 시간을 비교한다. DB 없이 실행된다.
+============================================================
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.utils.responses import FastJSONResponse, orjson
+
+
+# api/app/routers/sync.py 의 응답 스키마와 동일
+class TaskOut(BaseModel):
+    id: int
+    title: str
+    description: Optional[str]
+    author_id: int
+    current_assignee_id: int
+    status: str
+    priority: Optional[str]
+    progress: Optional[int]
+    due_date: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+
+
+class NotificationOut(BaseModel):
+    id: int
+    task_id: Optional[int]
+    notification_type: str
+    message: str
+    is_read: bool
+    created_at: datetime
+
+
+class SyncResponse(BaseModel):
+    server_time: datetime
+    tasks: List[TaskOut]
+    notifications: List[NotificationOut]
+
+
+NOW = datetime(2026, 10, 19, 9, 30, 15, 123456)
+
+
+def task_item(i: int, iso: bool) -> dict:
+    """task_to_dict 결과 형태. iso=True면 기존처럼 날짜를 문자열로 미리 변환."""
+    created = NOW - timedelta(hours=i)
+    due = date(2026, 11, 1) + timedelta(days=i % 30)
+    return {
+        "id": i,
+        "title": f"현장 점검 보고서 작성 {i}",
+        "content": "주간 안전 점검 결과를 정리하여 보고" * 3,
+        "assigner": {"id": 1, "name": "김소장"},
+        "assignee": {"id": 2 + i % 20, "name": f"담당자{i % 20}"},
+        "category": {"id": 3, "name": "안전", "color": "#ef4444"},
+        "priority": "high",
+        "status": "in_progress",
+        "progress": i % 100,
+        "estimated_hours": 2.5,
+        "due_date": due.isoformat() if iso else due,
+        "is_subtask": False,
+        "parent_task_id": None,
+        "tags": [{"id": 1, "name": "안전"}, {"id": 2, "name": "주간"}],
+        "attachment_count": i % 3,
+        "subtask_count": 2,
+        "subtasks_done": 1,
+        "is_favorite": i % 7 == 0,
+        "created_at": created.isoformat() if iso else created,
+        "updated_at": created.isoformat() if iso else created,
+    }
+
+
+def sync_rows(n: int):
+    tasks = [
+        {
+            "id": i, "title": f"업무 {i}", "description": "설명" * 10,
+            "author_id": 1, "current_assignee_id": 2, "status": "in_progress",
+            "priority": "normal", "progress": i % 100, "due_date": date(2026, 11, 1),
+            "created_at": NOW, "updated_at": NOW,
+        }
+        for i in range(n)
+    ]
+    notifications = [
+        {
+            "id": i, "task_id": i, "notification_type": "assigned",
+            "message": f"새 업무가 배정되었습니다: 업무 {i}", "is_read": 0, "created_at": NOW,
+        }
+        for i in range(n)
+    ]
+    return tasks, notifications
+
+
+def notification_item(i: int, iso: bool) -> dict:
+    created = NOW - timedelta(minutes=i)
+    return {
+        "id": i, "type": "assigned", "message": f"새 업무가 배정되었습니다: 업무 {i}",
+        "task_id": i, "is_read": bool(i % 2), "created_at": created.isoformat() if iso else created,
+    }
+
+
+def _default_response(content) -> bytes:
+    # FastAPI가 dict 반환 시 수행하는 경로: serialize_response(jsonable_encoder) → JSONResponse.render
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _fast_response(content) -> bytes:
+    return FastJSONResponse(content).body
+
+
+def _sync_old(tasks, notifications) -> bytes:
+    resp = SyncResponse(
+        server_time=NOW,
+        tasks=[TaskOut(**t) for t in tasks],
+        notifications=[NotificationOut(**n) for n in notifications],
+    )
+    return JSONResponse(jsonable_encoder(resp)).body
+
+
+def _sync_new(tasks, notifications) -> bytes:
+    def task_out(t):
+        due = t["due_date"]
+        return {**t, "due_date": datetime(due.year, due.month, due.day) if due else None}
+
+    return FastJSONResponse({
+        "server_time": NOW.isoformat() + "Z",
+        "tasks": [task_out(t) for t in tasks],
+        "notifications": [{**n, "is_read": bool(n["is_read"])} for n in notifications],
+    }).body
+
+
+def timeit(fn, repeat: int) -> float:
+    fn()  # 워밍업
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 응답 직렬화 벤치마크")
+    parser.add_argument("--sizes", default="100,1000", help="payload 항목 수 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("경고: orjson 미설치 — FastJSONResponse가 기본 JSONResponse로 동작합니다.")
+
+    print(f"{'payload':<16}{'items':>7}{'기존(ms)':>12}{'신규(ms)':>12}{'배율':>8}{'bytes':>10}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        cases = []
+
+        old_tasks = {"items": [task_item(i, True) for i in range(size)], "total": size, "page": 1, "page_size": size}
+        new_tasks = {"items": [task_item(i, False) for i in range(size)], "total": size, "page": 1, "page_size": size}
+        cases.append(("list_tasks", lambda: _default_response(old_tasks), lambda: _fast_response(new_tasks)))
+
+        tasks, notifications = sync_rows(size)
+        cases.append(("sync", lambda: _sync_old(tasks, notifications), lambda: _sync_new(tasks, notifications)))
+
+        old_notifs = {"items": [notification_item(i, True) for i in range(size)], "total": size}
+        new_notifs = {"items": [notification_item(i, False) for i in range(size)], "total": size}
+        cases.append(("notifications", lambda: _default_response(old_notifs), lambda: _fast_response(new_notifs)))
+
+        for name, old_fn, new_fn in cases:
+            old_ms = timeit(old_fn, args.repeat)
+            new_ms = timeit(new_fn, args.repeat)
+            print(f"{name:<16}{size:>7}{old_ms:>12.2f}{new_ms:>12.2f}{old_ms / new_ms:>7.1f}x{len(new_fn()):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - 서버 기동 시간 벤치마크
+============================================================
+사용법:
+  cd backend
+  python scripts/bench_startup.py [--runs 5] [--modes verify,create_all] [--budget-ms 2500] [--out boot.json]
+
+새 프로세스를 띄워 (1) app.main import, (2) lifespan 시작(스키마 처리 + 스케줄러 리더 선출)에
+걸린 시간을 잰다. 부팅 모드(SCHEMA_BOOT_MODE)별로 --runs번 반복해 중앙값을 출력한다.
+--database-url을 주지 않으면 임시 SQLite 파일에 스키마를 만들고 head 리비전을 기록해서 쓴다
+(MySQL에서는 create_all의 테이블별 조회 비용이 훨씬 크다 — 실제 DB URL로 재 볼 것).
+--budget-ms를 넘는 모드가 있으면 종료 코드 1 — 컨테이너 재시작 시간 회귀 감시용.
+============================================================
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(database_url: str):
+    """자식 프로세스: import·lifespan 시간을 JSON 한 줄로 출력"""
+    import asyncio
+
+    start = time.perf_counter()
+    from sqlalchemy import create_engine
+    import app.database as database
+
+    if database_url:
+        database.engine = create_engine(database_url)
+        database.SessionLocal.configure(bind=database.engine)
+    from app.main import app
+    import app.main as main
+
+    main.engine = database.engine
+    imported = time.perf_counter()
+
+    async def boot():
+        async with app.router.lifespan_context(app):
+            return time.perf_counter()
+
+    booted = asyncio.run(boot())
+    print(json.dumps({"import_ms": (imported - start) * 1000, "lifespan_ms": (booted - imported) * 1000}))
+
+
+def prepare_sqlite() -> str:
+    """create_all로 스키마를 만들고 alembic_version에 head를 기록한 임시 SQLite DB"""
+    path = os.path.join(tempfile.mkdtemp(prefix="collab-boot-"), "boot.db")
+    url = f"sqlite:///{path}"
+    code = (
+        "from sqlalchemy import create_engine, text\n"
+        "import app.database as d\n"
+        "from app.models import user, task, job, rate_limit\n"
+        "from app.utils.schema_version import code_heads\n"
+        f"e = create_engine({url!r})\n"
+        "d.Base.metadata.create_all(e)\n"
+        "with e.begin() as c:\n"
+        "    c.execute(text('CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)'))\n"
+        "    c.execute(text('INSERT INTO alembic_version VALUES (:v)'), {'v': code_heads().pop()})\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=_env("skip"), check=True)
+    return url
+
+
+def _env(mode: str) -> dict:
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "bench-startup")
+    env["SCHEMA_BOOT_MODE"] = mode
+    env["SCHEDULER_LOCK"] = "none"
+    env["PYTHONPATH"] = BACKEND_DIR
+    return env
+
+
+def run_once(mode: str, database_url: str) -> dict:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--database-url", database_url],
+        cwd=BACKEND_DIR, env=_env(mode), capture_output=True, text=True,
+    )
+    total = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise SystemExit(f"[{mode}] 기동 실패:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_ms"] = total
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 기동 시간 벤치마크")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--database-url", default="")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", default="verify,create_all", help="SCHEMA_BOOT_MODE 목록 (쉼표 구분)")
+    parser.add_argument("--budget-ms", type=float, default=0, help="프로세스 기동 중앙값 상한 (0이면 검사 안 함)")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.database_url)
+        return 0
+
+    database_url = args.database_url or prepare_sqlite()
+    results = {}
+    print(f"{'모드':<12}{'import':>10}{'lifespan':>10}{'프로세스':>10}  (ms, {args.runs}회 중앙값)")
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        runs = [run_once(mode, database_url) for _ in range(args.runs)]
+        results[mode] = {key: round(statistics.median(r[key] for r in runs), 1)
+                         for key in ("import_ms", "lifespan_ms", "process_ms")}
+        r = results[mode]
+        print(f"{mode:<12}{r['import_ms']:>10}{r['lifespan_ms']:>10}{r['process_ms']:>10}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"database_url": database_url.split("@")[-1], "runs": args.runs, "modes": results}, f, indent=2)
+    over = [m for m, r in results.items() if args.budget_ms and r["process_ms"] > args.budget_ms]
+    if over:
+        print(f"기동 시간 예산 {args.budget_ms}ms 초과: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - import 시간 예산 / 지연 import 검사 (backend, api)
+============================================================
+사용법:
+  cd backend
+  python scripts/check_import_budget.py [--runs 3] [--backend-ms 2500] [--api-ms 2000] [--rss-mb 0] [--top 10]
+
+앱마다 새 프로세스에서 `python -X importtime -c "import app.main"` 을 실행해
+(1) app.main import 누적 시간(중앙값), (2) import 직후 RSS, (3) 시간이 큰 직속 모듈을 출력한다.
+backend는 app.utils.lazy 로 선언한 선택 모듈(메일·엑셀·파일 서명·스케줄러)이
+부팅 시 import되지 않았는지도 검사한다 — 누가 모듈 상단에서 직접 import하면 실패.
+예산을 넘거나 지연 모듈이 미리 불러와졌으면 종료 코드 1 — CI에서 그대로 사용한다.
+MySQL이나 .env 없이 실행된다. -X importtime 자체의 오버헤드로 실제보다 크게 나오고 머신마다
+편차가 있으므로 기본 예산은 여유 있게 잡았다 — CI 머신에서 잰 값에 맞춰 조정할 것.
+============================================================
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHILD = """
+import json, sys
+import app.main
+import app.{metrics} as metrics
+try:
+    from app.utils import lazy
+    deferred = lazy.declared()
+except ImportError:
+    deferred = []
+print(json.dumps({{"rss": metrics.rss_bytes(), "deferred": deferred,
+                  "eager": [n for n in deferred if n in sys.modules]}}))
+"""
+
+APPS = {
+    "backend": {
+        "dir": os.path.join(ROOT, "backend"),
+        "metrics": "utils.metrics",
+        "env": {"SECRET_KEY": "import-budget-check"},
+    },
+    "api": {
+        "dir": os.path.join(ROOT, "api"),
+        "metrics": "metrics",
+        "env": {
+            "COLLAB_TODO_DB_HOST": "localhost", "COLLAB_TODO_DB_USER": "collab_todo_user",
+            "COLLAB_TODO_DB_PASSWORD": "", "COLLAB_TODO_JWT_SECRET": "import-budget-check",
+        },
+    },
+}
+
+
+def parse_importtime(stderr: str):
+    """(-X importtime 출력) → app.main 누적 ms, app.main 직속 모듈 [(이름, 누적 ms)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        rows.append((name[1:].rstrip(), int(cumulative_us)))
+    total = 0.0
+    children = []
+    # 중첩 깊이는 이름 앞 공백 2칸 단위, 자식 모듈이 부모보다 먼저 출력된다
+    for name, cumulative in reversed(rows):
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0:
+            in_main = name == "app.main"
+            if in_main:
+                total = cumulative / 1000
+        elif depth == 1 and in_main:
+            children.append((name.strip(), cumulative / 1000))
+    return total, children
+
+
+def measure(name: str):
+    spec = APPS[name]
+    # .env 없이도 설정 로드가 되도록 기본값만 채운다 (DB에는 접속하지 않음)
+    env = {**spec["env"], **os.environ, "PYTHONPATH": spec["dir"]}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD.format(metrics=spec["metrics"])],
+        cwd=spec["dir"], env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"[{name}] import 실패:\n{proc.stderr[-2000:]}")
+    total, children = parse_importtime(proc.stderr)
+    return total, children, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간 예산 / 지연 import 검사")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--backend-ms", type=float, default=2500, help="backend app.main import 예산 (0이면 검사 안 함)")
+    parser.add_argument("--api-ms", type=float, default=2000, help="api app.main import 예산 (0이면 검사 안 함)")
+    parser.add_argument("--rss-mb", type=float, default=0, help="import 직후 RSS 상한 MB (0이면 검사 안 함)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 직속 모듈 수")
+    args = parser.parse_args()
+
+    budgets = {"backend": args.backend_ms, "api": args.api_ms}
+    failures = []
+    for name in APPS:
+        runs = [measure(name) for _ in range(args.runs)]
+        total = statistics.median(r[0] for r in runs)
+        rss_mb = statistics.median(r[2]["rss"] for r in runs) / (1024 * 1024)
+        children, info = runs[-1][1], runs[-1][2]
+
+        print(f"\n[{name}] app.main import {total:.0f}ms (중앙값 {args.runs}회), RSS {rss_mb:.1f}MB")
+        for module, ms in sorted(children, key=lambda c: c[1], reverse=True)[:args.top]:
+            print(f"  {ms:>8.1f}ms  {module}")
+        if info["deferred"]:
+            print(f"  지연 import 모듈: {', '.join(info['deferred'])}")
+
+        if budgets[name] and total > budgets[name]:
+            failures.append(f"{name}: import {total:.0f}ms > 예산 {budgets[name]:.0f}ms")
+        if args.rss_mb and rss_mb > args.rss_mb:
+            failures.append(f"{name}: RSS {rss_mb:.1f}MB > 상한 {args.rss_mb:.0f}MB")
+        if info["eager"]:
+            failures.append(f"{name}: 부팅 시 import된 지연 모듈 {', '.join(info['eager'])}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"FAIL {failure}")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
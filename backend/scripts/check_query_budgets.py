@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - 엔드포인트별 SQL 예산 / N+1 검사
+============================================================
+사용법:
+  cd backend
+  python scripts/check_query_budgets.py [--rows 30] [--verbose]
+
+SQLite 메모리 DB에 사용자·업무·댓글을 시드한 뒤 주요 엔드포인트를 호출하고,
+요청마다 실행된 SQL 수를 @query_budget 선언(없으면 DEFAULT_BUDGET)과 비교한다.
+같은 모양의 SQL이 반복되면(N+1 의심) 함께 실패로 처리한다.
+스케줄러 작업(check_due_soon)도 같은 기준으로 검사한다.
+위반이 하나라도 있으면 종료 코드 1 — CI에서 그대로 사용한다.
+MySQL이나 .env 없이 실행된다.
+============================================================
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SECRET_KEY", "query-budget-check")
+os.environ["QUERY_BUDGET_MODE"] = "warn"
+# 요청 제한 저장소(database)의 SQL은 엔드포인트 예산과 무관하므로 단일 프로세스용 memory로
+os.environ["RATE_LIMIT_STORAGE"] = "memory"
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+import app.database as database
+
+# 앱 import 전에 엔진을 SQLite로 교체 (main.py가 이 엔진에 검사 리스너를 단다)
+database.engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+)
+database.SessionLocal.configure(bind=database.engine)
+
+from fastapi.testclient import TestClient
+
+from app.config import get_settings
+from app.database import Base, SessionLocal
+from app.main import app
+from app.models.task import Task, TaskLog, Attachment, Category, Tag, Notification, StatusEnum
+from app.models.user import User, Department, TaskFavorite, UserNotificationPreference
+from app.services import scheduler
+from app.utils import query_budget
+from app.utils.auth import create_access_token
+
+
+def seed(db, rows: int) -> dict:
+    depts = [Department(name=f"부서{i}") for i in range(4)]
+    db.add_all(depts)
+    db.flush()
+    admin = User(email="admin@example.com", password_hash="x", name="관리자", is_admin=True,
+                 is_active=True, is_verified=True, department_id=depts[0].id)
+    users = [
+        User(email=f"user{i}@example.com", password_hash="x", name=f"사용자{i}", is_active=True,
+             is_verified=True, department_id=depts[i % len(depts)].id)
+        for i in range(rows // 3 or 1)
+    ]
+    db.add(admin)
+    db.add_all(users)
+    db.add_all([Category(name=f"분류{i}", color="#6366f1") for i in range(3)])
+    tags = [Tag(name=f"태그{i}") for i in range(5)]
+    db.add_all(tags)
+    db.flush()
+    db.add_all([UserNotificationPreference(user_id=u.id) for u in users[::2]])
+
+    due = date.today() + timedelta(days=3)
+    tasks = []
+    for i in range(rows):
+        assignee = users[i % len(users)]
+        task = Task(title=f"업무 {i}", content="내용 " * 20, assigner_id=admin.id, assignee_id=assignee.id,
+                    due_date=due if i % 2 else None, status=StatusEnum.in_progress)
+        task.tags = tags[: 1 + i % len(tags)]
+        tasks.append(task)
+    db.add_all(tasks)
+    db.flush()
+    for task in tasks:
+        db.add(Task(title=f"{task.title} 자료", assigner_id=admin.id, assignee_id=task.assignee_id,
+                    parent_task_id=task.id, is_subtask=True))
+        db.add(Attachment(task_id=task.id, uploader_id=admin.id, filename="a.pdf", stored_name=f"{task.id}.pdf"))
+        db.add(TaskLog(task_id=task.id, user_id=admin.id, action="comment", comment="확인 부탁드립니다"))
+        db.add(TaskFavorite(user_id=admin.id, task_id=task.id))
+        db.add(Notification(user_id=admin.id, task_id=task.id, type="assigned", message=task.title))
+    db.commit()
+    return {"admin": admin.id, "users": [u.id for u in users], "tasks": [t.id for t in tasks]}
+
+
+def scenarios(ids: dict) -> list:
+    task_id = ids["tasks"][0]
+    mentions = " ".join(f"@사용자{i}" for i in range(min(6, len(ids["users"]))))
+    return [
+        ("GET", "/api/tasks/?section=all&page_size=50", None),
+        ("GET", "/api/tasks/?section=all&page_size=50&fields=summary", None),
+        ("GET", "/api/tasks/favorites", None),
+        ("GET", "/api/tasks/dashboard", None),
+        ("GET", f"/api/tasks/{task_id}", None),
+        ("GET", f"/api/tasks/{task_id}/detail?include=logs,attachments,subtasks", None),
+        ("GET", f"/api/tasks/{task_id}/tree", None),
+        ("GET", f"/api/tasks/{task_id}/logs", None),
+        ("POST", f"/api/tasks/{task_id}/comment", {"comment": f"검토 요청 {mentions}"}),
+        ("POST", "/api/tasks/bulk-status", {"task_ids": ids["tasks"][:20], "status": "review"}),
+        ("POST", "/api/tasks/", {
+            "title": "신규 업무", "assignee_id": ids["users"][0],
+            "material_providers": [{"assignee_id": uid, "title": f"자료 {uid}"} for uid in ids["users"][:6]],
+        }),
+        ("GET", "/api/notifications/", None),
+        ("GET", "/api/categories/", None),
+        ("GET", "/api/users/", None),
+        ("GET", "/api/users/departments", None),
+        ("GET", "/api/admin/users", None),
+        ("GET", "/api/admin/departments", None),
+        ("GET", "/api/admin/stats?live=true", None),
+    ]
+
+
+def check_scheduler(repeat_threshold: int):
+    with query_budget.recording() as recorder:
+        asyncio.run(scheduler.check_due_soon.__wrapped__())
+    report, problems = query_budget.evaluate(
+        "scheduler check_due_soon", recorder.statements, query_budget.DEFAULT_BUDGET, repeat_threshold)
+    report["problems"] = problems
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트별 SQL 예산 / N+1 검사")
+    parser.add_argument("--rows", type=int, default=30, help="시드할 업무 수 (반복 패턴이 드러나도록 충분히)")
+    parser.add_argument("--verbose", action="store_true", help="위반 요청의 SQL 전체 출력")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=database.engine)
+    db = SessionLocal()
+    try:
+        ids = seed(db, args.rows)
+    finally:
+        db.close()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(ids['admin'])})}"}
+    client = TestClient(app)  # lifespan(스케줄러)은 띄우지 않는다
+    query_budget.clear_reports()
+    for method, path, body in scenarios(ids):
+        resp = client.request(method, path, json=body, headers=headers)
+        if resp.status_code >= 400:
+            print(f"요청 실패: {method} {path} → {resp.status_code} {resp.text[:200]}")
+            return 2
+
+    results = query_budget.reports()
+    results.append(check_scheduler(get_settings().query_budget_repeat_threshold))
+
+    failed = 0
+    print(f"{'요청':<58}{'SQL':>6}{'예산':>6}  결과")
+    for r in results:
+        ok = not r["problems"]
+        failed += not ok
+        print(f"{r['label']:<58}{r['queries']:>6}{r['budget']:>6}  {'OK' if ok else 'FAIL'}")
+        for problem in r["problems"]:
+            print(f"    - {problem}")
+        if not ok and args.verbose:
+            for statement in r["statements"]:
+                print("      " + " ".join(statement.split())[:240])
+
+    print(f"\n{len(results)}건 중 {failed}건 위반")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - 쌓여 있는 연속 "수정" 이력 정리 (한 번만 실행하면 됨)
+============================================================
+사용법:
+  cd backend
+  python scripts/compact_task_logs.py [--window 300] [--batch 200] [--dry-run]
+
+같은 업무에서 바로 이어지는 "updated" 이력이 같은 사용자이고 간격이 --window초 이하면
+마지막 행만 남기고 지운다. 새 이력은 update_task가 쓰는 시점에 같은 기준으로 합치므로
+(TASK_LOG_COALESCE_SECONDS) 도입 전에 쌓인 행만 정리하면 된다.
+업무 --batch개씩 지우고 커밋하므로 운영 중에 실행해도 잠금은 짧다.
+.env 파일이 backend/ 또는 부모 디렉토리에 있어야 합니다.
+============================================================
+"""
+import argparse
+import os
+import sys
+import time
+
+# backend 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services import task_logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='연속 "수정" 이력 정리')
+    parser.add_argument("--window", type=int, default=get_settings().task_log_coalesce_seconds or 300,
+                        help="합칠 간격(초), 기본 TASK_LOG_COALESCE_SECONDS")
+    parser.add_argument("--batch", type=int, default=task_logs.TASK_BATCH, help="배치당 업무 수")
+    parser.add_argument("--dry-run", action="store_true", help="지울 행 수만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    total = 0
+    after = 0
+    started = time.perf_counter()
+    try:
+        while after is not None:
+            removed, after = task_logs.compact_backlog(db, args.window, after, args.batch, args.dry_run)
+            total += removed
+            if removed:
+                print(f"  누적 {total}행")
+            time.sleep(task_logs.BATCH_PAUSE)
+    finally:
+        db.close()
+    verb = "지울" if args.dry_run else "지운"
+    print(f"{verb} 이력 {total}행 ({time.perf_counter() - started:.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
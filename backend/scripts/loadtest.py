@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Collab Todo - 부하 테스트 / 벤치마크
+============================================================
+사용법:
+  cd backend
+  # 1) 합성 데이터 준비 (MySQL 또는 SQLite)
+  python scripts/seed_data.py --synthetic --users 200 --tasks 20000 --database-url sqlite:///bench.db
+
+  # 2-a) 실행 중인 서버 대상 (backend: 8000, api 서버는 --server api)
+  python scripts/loadtest.py --base-url http://localhost:8000 --workload mixed \\
+      --duration 60 --concurrency 20 --out runs/before.json
+  # 2-b) 서버 없이 backend 앱을 프로세스 안에서 실행 (SQLite 등 DB URL 지정)
+  python scripts/loadtest.py --in-process sqlite:///bench.db --workload dashboard_poll
+
+  # 3) 두 실행 결과 비교
+  python scripts/loadtest.py --compare runs/before.json runs/after.json
+
+워크로드: login_storm, dashboard_poll, list_search, bulk_ops, mixed
+결과: 작업별 처리량(req/s), p50/p95/p99, 오류 수, 서버 /metrics 기준 요청당 SQL 수.
+요청당 SQL 수는 실행 전후 /metrics 차이로 계산하므로 METRICS_TOKEN을 쓰면 --metrics-token 지정.
+backend는 사용자·IP별 요청 제한이 있으므로 실제 서버 대상이면 RATE_LIMIT_ENABLED=false 로 띄워 실행할 것
+(--in-process는 자동으로 끈다). 429 응답은 오류로 집계된다.
+api 서버는 합성 데이터 생성기를 제공하지 않으므로 기존 계정(--login-pattern)을 사용한다.
+============================================================
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# seed_data.TITLE_WORDS 와 같은 단어 (합성 업무 제목에 포함됨)
+SEARCH_TERMS = ["안전", "점검", "보고서", "자재", "발주", "도면", "검토", "공정", "회의", "품질", "측량", "정산"]
+
+WORKLOADS = {
+    "login_storm": {"login": 1},
+    "dashboard_poll": {"dashboard": 4, "unread_count": 3, "my_tasks": 3},
+    "list_search": {"list_all": 4, "search": 4, "list_page": 2},
+    "bulk_ops": {"bulk_status": 5, "my_tasks": 5},
+    "mixed": {
+        "dashboard": 20, "unread_count": 20, "my_tasks": 20, "list_all": 10,
+        "search": 10, "list_page": 10, "bulk_status": 5, "login": 5,
+    },
+}
+
+_METRIC_LINE = re.compile(r'^collab_http_request_db_queries_(sum|count)\{method="([^"]+)",route="([^"]+)"\} (\S+)$')
+
+
+class VirtualUser:
+    def __init__(self, login: str, token: str):
+        self.login = login
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.task_ids: list = []
+
+
+class Runner:
+    def __init__(self, client: httpx.AsyncClient, args, accounts: list):
+        self.client = client
+        self.args = args
+        self.accounts = accounts
+
+    async def login(self, login: str) -> httpx.Response:
+        if self.args.server == "api":
+            return await self.client.post("/api/auth/login", json={"username": login, "password": self.args.password})
+        return await self.client.post("/api/auth/login", data={"username": login, "password": self.args.password})
+
+    # ── 작업 ──────────────────────────────────────────────────
+    async def op_login(self, vu, rng):
+        return await self.login(rng.choice(self.accounts))
+
+    async def op_dashboard(self, vu, rng):
+        return await self.client.get("/api/tasks/dashboard", headers=vu.headers)
+
+    async def op_unread_count(self, vu, rng):
+        return await self.client.get("/api/notifications/unread-count", headers=vu.headers)
+
+    async def op_my_tasks(self, vu, rng):
+        resp = await self.client.get(
+            "/api/tasks/?section=assigned_to_me&page_size=20&fields=summary", headers=vu.headers)
+        if resp.status_code == 200:
+            vu.task_ids = [t["id"] for t in resp.json()["items"]]
+        return resp
+
+    async def op_list_all(self, vu, rng):
+        return await self.client.get(
+            "/api/tasks/?section=all&page_size=50&sort_by=due_date&sort_dir=asc", headers=vu.headers)
+
+    async def op_search(self, vu, rng):
+        return await self.client.get(
+            "/api/tasks/", params={"section": "all", "search": rng.choice(SEARCH_TERMS)}, headers=vu.headers)
+
+    async def op_list_page(self, vu, rng):
+        return await self.client.get(
+            f"/api/tasks/?section=all&page={rng.randint(1, 10)}&page_size=20", headers=vu.headers)
+
+    async def op_bulk_status(self, vu, rng):
+        if not vu.task_ids:
+            await self.op_my_tasks(vu, rng)
+        body = {"task_ids": vu.task_ids[:10] or [0], "status": rng.choice(["in_progress", "review"])}
+        return await self.client.post("/api/tasks/bulk-status", json=body, headers=vu.headers)
+
+    # ── 실행 ──────────────────────────────────────────────────
+    async def virtual_user(self, vu, mix: dict, deadline: float, samples: list, seed: int):
+        rng = random.Random(seed)
+        names, weights = zip(*mix.items())
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                status = (await getattr(self, f"op_{name}")(vu, rng)).status_code
+            except httpx.HTTPError:
+                status = 0
+            samples.append((name, time.perf_counter() - start, status))
+            if self.args.think_time:
+                await asyncio.sleep(rng.expovariate(1 / self.args.think_time))
+
+    async def scrape_db_queries(self) -> dict:
+        headers = {"Authorization": f"Bearer {self.args.metrics_token}"} if self.args.metrics_token else {}
+        try:
+            resp = await self.client.get("/metrics", headers=headers)
+        except httpx.HTTPError:
+            return {}
+        if resp.status_code != 200:
+            return {}
+        values = defaultdict(lambda: [0.0, 0.0])
+        for line in resp.text.splitlines():
+            m = _METRIC_LINE.match(line)
+            if m:
+                values[f"{m.group(2)} {m.group(3)}"][0 if m.group(1) == "sum" else 1] = float(m.group(4))
+        return dict(values)
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(samples: list, elapsed: float) -> dict:
+    by_op = defaultdict(list)
+    for name, seconds, status in samples:
+        by_op[name].append((seconds, status))
+    by_op["(전체)"] = [(s, st) for _, s, st in samples]
+
+    ops = {}
+    for name, rows in by_op.items():
+        latencies = sorted(s for s, _ in rows)
+        ops[name] = {
+            "count": len(rows),
+            "errors": sum(1 for _, st in rows if st == 0 or st >= 400),
+            "rate_limited": sum(1 for _, st in rows if st == 429),
+            "rps": round(len(rows) / elapsed, 2) if elapsed else 0.0,
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        }
+    return ops
+
+
+def db_query_delta(before: dict, after: dict) -> dict:
+    result = {}
+    for key, (total, count) in after.items():
+        prev_total, prev_count = before.get(key, (0.0, 0.0))
+        requests = count - prev_count
+        if requests > 0:
+            result[key] = {"requests": int(requests), "queries_per_request": round((total - prev_total) / requests, 2)}
+    return result
+
+
+def print_report(result: dict):
+    meta = result["meta"]
+    print(f"\n워크로드 {meta['workload']} · 동시 사용자 {meta['concurrency']} · {meta['elapsed_s']}초 · 대상 {meta['target']}")
+    print(f"{'작업':<16}{'요청':>8}{'오류':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for name, s in sorted(result["ops"].items(), key=lambda kv: kv[0] == "(전체)"):
+        print(f"{name:<16}{s['count']:>8}{s['errors']:>6}{s['rps']:>9}{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}")
+    if result["ops"].get("(전체)", {}).get("rate_limited"):
+        print("경고: 429(요청 제한) 응답이 있습니다. 서버의 요청 제한을 풀고 다시 측정하세요.")
+    if result["db_queries"]:
+        print(f"\n{'경로':<48}{'요청':>8}{'SQL/요청':>10}")
+        for route, q in sorted(result["db_queries"].items()):
+            print(f"{route:<48}{q['requests']:>8}{q['queries_per_request']:>10}")
+    else:
+        print("\n(/metrics를 읽지 못해 요청당 SQL 수는 생략)")
+
+
+def compare(path_a: str, path_b: str):
+    with open(path_a, encoding="utf-8") as f:
+        a = json.load(f)
+    with open(path_b, encoding="utf-8") as f:
+        b = json.load(f)
+
+    def delta(old, new):
+        return f"{(new - old) / old * 100:+.1f}%" if old else "-"
+
+    print(f"A: {path_a} ({a['meta']['started_at']})\nB: {path_b} ({b['meta']['started_at']})")
+    print(f"{'작업':<16}{'req/s A→B':>20}{'p50 A→B':>22}{'p95 A→B':>22}{'p99 A→B':>22}")
+    for name in sorted(set(a["ops"]) & set(b["ops"]), key=lambda n: n == "(전체)"):
+        sa, sb = a["ops"][name], b["ops"][name]
+        cols = [
+            f"{sa[k]:.0f}→{sb[k]:.0f} {delta(sa[k], sb[k])}" if k == "rps" else f"{sa[k]:.1f}→{sb[k]:.1f} {delta(sa[k], sb[k])}"
+            for k in ("rps", "p50_ms", "p95_ms", "p99_ms")
+        ]
+        print(f"{name:<16}{cols[0]:>20}{cols[1]:>22}{cols[2]:>22}{cols[3]:>22}")
+    routes = sorted(set(a["db_queries"]) & set(b["db_queries"]))
+    if routes:
+        print(f"\n{'경로':<48}{'SQL/요청 A→B':>16}")
+        for route in routes:
+            qa, qb = a["db_queries"][route]["queries_per_request"], b["db_queries"][route]["queries_per_request"]
+            print(f"{route:<48}{f'{qa} → {qb}':>16}")
+
+
+def in_process_app(database_url: str):
+    """backend 앱을 지정 DB로 띄운다 (lifespan·스케줄러·요청 제한 없이)"""
+    os.environ.setdefault("SECRET_KEY", "loadtest")
+    from sqlalchemy import create_engine
+    import app.database as database
+
+    connect_args = {"check_same_thread": False, "timeout": 30} if database_url.startswith("sqlite") else {}
+    database.engine = create_engine(database_url, connect_args=connect_args, pool_size=20, max_overflow=10)
+    database.SessionLocal.configure(bind=database.engine)
+    database.instrument_engine(database.engine)
+    from app.main import app
+    app.state.limiter.enabled = False
+    return app
+
+
+async def run(args) -> dict:
+    if args.in_process:
+        transport = httpx.ASGITransport(app=in_process_app(args.in_process))
+        base_url, target = "http://loadtest", f"in-process {args.in_process}"
+    else:
+        transport, base_url, target = None, args.base_url, f"{args.server} {args.base_url}"
+
+    first, _, last = args.user_ids.partition("-")
+    accounts = [args.login_pattern.format(i=i) for i in range(int(first), int(last or first) + 1)]
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, timeout=60, limits=limits) as client:
+        runner = Runner(client, args, accounts)
+
+        # 가상 사용자별 토큰 발급 (비활성 계정 등 로그인 실패는 건너뜀)
+        rng = random.Random(args.seed)
+        users = []
+        for login in rng.sample(accounts, min(len(accounts), args.concurrency * 3)):
+            resp = await runner.login(login)
+            if resp.status_code == 200:
+                users.append(VirtualUser(login, resp.json()["access_token"]))
+            if len(users) == args.concurrency:
+                break
+        if not users:
+            raise SystemExit("로그인 가능한 계정이 없습니다. --login-pattern / --user-ids / --password 를 확인하세요.")
+        # login 작업은 로그인에 성공한 계정만 사용 (비활성·없는 ID의 401을 오류로 세지 않도록)
+        runner.accounts = [vu.login for vu in users]
+
+        mix = WORKLOADS[args.workload]
+        if args.warmup:
+            await asyncio.gather(*(
+                runner.virtual_user(users[i % len(users)], mix, time.perf_counter() + args.warmup, [], args.seed + i)
+                for i in range(args.concurrency)
+            ))
+
+        before = await runner.scrape_db_queries()
+        samples: list = []
+        started_at = datetime.now().isoformat(timespec="seconds")
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            runner.virtual_user(users[i % len(users)], mix, deadline, samples, args.seed + 1000 + i)
+            for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+        after = await runner.scrape_db_queries()
+
+    return {
+        "meta": {
+            "workload": args.workload, "concurrency": args.concurrency, "duration_s": args.duration,
+            "elapsed_s": round(elapsed, 2), "target": target, "started_at": started_at, "seed": args.seed,
+        },
+        "ops": summarize(samples, elapsed),
+        "db_queries": db_query_delta(before, after),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collab Todo 부하 테스트")
+    parser.add_argument("--compare", nargs=2, metavar=("A.json", "B.json"), help="두 결과 파일 비교만 수행")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--in-process", metavar="DATABASE_URL", help="서버 없이 backend 앱을 이 DB로 실행")
+    parser.add_argument("--server", choices=["backend", "api"], default="backend", help="로그인 형식")
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="mixed")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3, help="측정 전 예열 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 가상 사용자 수")
+    parser.add_argument("--think-time", type=float, default=0, help="요청 사이 평균 대기(초, 지수분포)")
+    parser.add_argument("--login-pattern", default="bench{i}@bench.local", help="로그인 ID 형식 ({i}는 번호)")
+    parser.add_argument("--user-ids", default="1-200", help="로그인 ID 번호 범위")
+    parser.add_argument("--password", default="Bench1234!")
+    parser.add_argument("--metrics-token", default=os.getenv("METRICS_TOKEN", ""))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    result = asyncio.run(run(args))
+    print_report(result)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
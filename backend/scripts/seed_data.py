@@ -6,18 +6,55 @@ Collab Todo - 초기 시드 데이터 삽입 스크립트
   cd backend
   python scripts/seed_data.py
 
+  # 성능 테스트용 합성 데이터 (사용자·업무·태그·댓글·첨부·알림)
+  python scripts/seed_data.py --synthetic --users 200 --tasks 20000 [--seed 42]
+  # MySQL 대신 SQLite 파일에 생성 (테이블도 함께 생성)
+  python scripts/seed_data.py --synthetic --database-url sqlite:///bench.db
+
 .env 파일이 backend/ 또는 부모 디렉토리에 있어야 합니다.
+합성 사용자는 bench{번호}@bench.local / SYNTHETIC_PASSWORD 로 로그인할 수 있습니다.
 ============================================================
 """
+import argparse
+import random
 import sys
 import os
+import uuid
+from datetime import date, datetime, timedelta
 
 # backend 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+os.environ.setdefault("SECRET_KEY", "seed-data")  # 시드 작업은 토큰을 발급하지 않음
+
+from sqlalchemy import create_engine, func, insert, select
+import app.database as database
 from app.database import SessionLocal, engine, Base
-from app.models.user import Department, SystemSettings
-from app.models.task import Category
+from app.models.user import Department, SystemSettings, User, TaskFavorite
+from app.models.task import (
+    Category, Tag, Task, TaskLog, Mention, Attachment, Notification, StatusEnum, PriorityEnum, task_tags,
+)
+from app.utils.auth import hash_password
+
+SYNTHETIC_PASSWORD = "Bench1234!"
+CHUNK_SIZE = 1000
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "은우", "지민", "현우", "수아", "준서", "예린", "태현", "유진"]
+JOB_TITLES = ["사원", "대리", "과장", "차장", "부장", "소장"]
+# scripts/loadtest.py의 검색어(SEARCH_TERMS)와 같은 단어를 제목에 사용
+TITLE_WORDS = ["안전", "점검", "보고서", "자재", "발주", "도면", "검토", "공정", "회의", "품질", "측량", "정산"]
+STATUS_WEIGHTS = {
+    StatusEnum.pending: 25, StatusEnum.in_progress: 35, StatusEnum.review: 10,
+    StatusEnum.approved: 25, StatusEnum.rejected: 5,
+}
+PRIORITY_WEIGHTS = {PriorityEnum.low: 15, PriorityEnum.normal: 55, PriorityEnum.high: 22, PriorityEnum.urgent: 8}
+ATTACHMENT_TYPES = [
+    ("pdf", "application/pdf"),
+    ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    ("jpg", "image/jpeg"),
+    ("hwp", "application/x-hwp"),
+]
 
 
 def seed_departments(db):
@@ -83,7 +120,164 @@ def seed_system_settings(db):
     return added
 
 
+# ── 성능 테스트용 합성 데이터 ─────────────────────────────────
+
+def _zipf_weights(n: int, s: float = 0.9) -> list:
+    """소수 사용자·태그에 몰리는 실제 분포를 흉내 (순위 r의 가중치 1/r^s)"""
+    return [1 / (rank + 1) ** s for rank in range(n)]
+
+
+def _next_id(db, model) -> int:
+    # 대량 INSERT는 PK를 돌려받지 못하므로 id를 직접 지정한다 (시드 도중 다른 쓰기가 없다고 가정)
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def _insert_chunks(db, table, rows: list) -> int:
+    for start in range(0, len(rows), CHUNK_SIZE):
+        db.execute(insert(table), rows[start:start + CHUNK_SIZE])
+    return len(rows)
+
+
+def seed_synthetic(db, n_users: int, n_tasks: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    now = datetime.now().replace(microsecond=0)
+    today = date.today()
+    dept_ids = [d.id for d in db.query(Department).all()]
+    cat_ids = [c.id for c in db.query(Category).all()]
+
+    # 사용자: 앞쪽 10%는 업무를 많이 배정하는 관리자급
+    password_hash = hash_password(SYNTHETIC_PASSWORD)  # bcrypt는 느리므로 한 번만
+    first_user = _next_id(db, User)
+    users = []
+    for i in range(n_users):
+        uid = first_user + i
+        users.append({
+            "id": uid,
+            "email": f"bench{uid}@bench.local",
+            "password_hash": password_hash,
+            "name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES) + str(uid),
+            "department_id": rng.choice(dept_ids) if dept_ids else None,
+            "job_title": JOB_TITLES[-1] if i < max(1, n_users // 10) else rng.choice(JOB_TITLES[:-1]),
+            "is_active": rng.random() > 0.03,
+            "is_admin": i == 0,
+            "is_verified": True,
+        })
+    _insert_chunks(db, User, users)
+    user_ids = [u["id"] for u in users]
+    managers = user_ids[:max(1, n_users // 10)]
+    assignee_weights = _zipf_weights(n_users)
+
+    first_tag = _next_id(db, Tag)
+    tag_ids = list(range(first_tag, first_tag + 40))
+    _insert_chunks(db, Tag, [{"id": tid, "name": f"bench-{tid}"} for tid in tag_ids])
+    tag_weights = _zipf_weights(len(tag_ids), 1.1)
+
+    statuses, status_w = zip(*STATUS_WEIGHTS.items())
+    priorities, priority_w = zip(*PRIORITY_WEIGHTS.items())
+    first_task = _next_id(db, Task)
+    tasks, links, subtasks = [], [], []
+    next_task = first_task + n_tasks  # 하위 업무 id는 상위 업무 뒤에 이어서
+    for i in range(n_tasks):
+        tid = first_task + i
+        status = rng.choices(statuses, status_w)[0]
+        created = now - timedelta(minutes=rng.randint(0, 180 * 24 * 60))
+        due = None if rng.random() < 0.15 else today + timedelta(days=round(rng.gauss(5, 20)))
+        assigner = rng.choice(managers)
+        assignee = rng.choices(user_ids, assignee_weights)[0]
+        words = rng.sample(TITLE_WORDS, 2)
+        tasks.append({
+            "id": tid,
+            "title": f"{words[0]} {words[1]} {tid}",
+            "content": " ".join(rng.choices(TITLE_WORDS, k=max(1, int(rng.lognormvariate(3, 1))))),
+            "assigner_id": assigner,
+            "assignee_id": assignee,
+            "category_id": rng.choice(cat_ids) if cat_ids and rng.random() < 0.7 else None,
+            "priority": rng.choices(priorities, priority_w)[0],
+            "status": status,
+            "progress": 100 if status == StatusEnum.approved else (0 if status == StatusEnum.pending else rng.randint(5, 95)),
+            "estimated_hours": round(rng.uniform(0.5, 16), 1) if rng.random() < 0.4 else None,
+            "due_date": due,
+            "parent_task_id": None,
+            "is_subtask": False,
+            "created_at": created,
+            "updated_at": created + timedelta(minutes=rng.randint(0, 7 * 24 * 60)),
+        })
+        for tag in set(rng.choices(tag_ids, tag_weights, k=rng.choice([0, 0, 1, 1, 2, 3]))):
+            links.append({"task_id": tid, "tag_id": tag})
+        if rng.random() < 0.2:
+            for _ in range(rng.randint(1, 3)):
+                subtasks.append({
+                    **tasks[-1], "id": next_task, "title": f"[자료] {tasks[-1]['title']}",
+                    "assignee_id": rng.choice(user_ids), "parent_task_id": tid, "is_subtask": True,
+                })
+                next_task += 1
+    _insert_chunks(db, Task, tasks)
+    _insert_chunks(db, Task, subtasks)
+    _insert_chunks(db, task_tags, links)
+    all_tasks = tasks + subtasks
+
+    # 업무 로그(생성 + 댓글), 멘션, 첨부, 알림, 즐겨찾기
+    first_log = _next_id(db, TaskLog)
+    logs, mentions, attachments, notifications, favorites = [], [], [], [], set()
+    for t in all_tasks:
+        logs.append({
+            "id": first_log + len(logs), "task_id": t["id"], "user_id": t["assigner_id"],
+            "action": "created", "new_value": "pending", "created_at": t["created_at"],
+        })
+        for _ in range(min(int(rng.expovariate(0.5)), 12)):
+            author = rng.choice((t["assigner_id"], t["assignee_id"]))
+            comment = f"{rng.choice(TITLE_WORDS)} 관련 확인 부탁드립니다."
+            mentioned = rng.choice(user_ids) if rng.random() < 0.15 else None
+            if mentioned:
+                comment = f"@{users[mentioned - first_user]['name']} " + comment
+            log_id = first_log + len(logs)
+            logs.append({
+                "id": log_id, "task_id": t["id"], "user_id": author, "action": "comment",
+                "comment": comment, "created_at": t["created_at"] + timedelta(hours=rng.randint(1, 240)),
+            })
+            if mentioned:
+                mentions.append({"log_id": log_id, "mentioned_user_id": mentioned})
+        for _ in range(rng.choice([0, 0, 0, 1, 1, 2, 3])):
+            ext, mime = rng.choice(ATTACHMENT_TYPES)
+            attachments.append({
+                "task_id": t["id"], "uploader_id": t["assigner_id"], "filename": f"자료_{t['id']}.{ext}",
+                "stored_name": f"{uuid.UUID(int=rng.getrandbits(128)).hex}.{ext}",  # 파일 본문은 만들지 않음
+                "file_size": int(rng.lognormvariate(12, 1.5)), "mime_type": mime,
+            })
+        notifications.append({
+            "user_id": t["assignee_id"], "task_id": t["id"], "type": "assigned",
+            "message": f"새 업무가 배정되었습니다: {t['title']}",
+            "is_read": rng.random() < 0.7, "created_at": t["created_at"],
+        })
+        if rng.random() < 0.05:
+            favorites.add((t["assignee_id"], t["id"]))
+    _insert_chunks(db, TaskLog, logs)
+    _insert_chunks(db, Mention, mentions)
+    _insert_chunks(db, Attachment, attachments)
+    _insert_chunks(db, Notification, notifications)
+    _insert_chunks(db, TaskFavorite, [{"user_id": u, "task_id": t} for u, t in sorted(favorites)])
+
+    return {
+        "사용자": len(users), "업무": len(tasks), "하위 업무": len(subtasks), "태그 연결": len(links),
+        "로그·댓글": len(logs), "멘션": len(mentions), "첨부(메타데이터)": len(attachments),
+        "알림": len(notifications), "즐겨찾기": len(favorites),
+    }
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Collab Todo 시드 데이터")
+    parser.add_argument("--synthetic", action="store_true", help="성능 테스트용 합성 데이터도 생성")
+    parser.add_argument("--users", type=int, default=200, help="합성 사용자 수")
+    parser.add_argument("--tasks", type=int, default=5000, help="합성 업무 수 (하위 업무 제외)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 값이면 같은 데이터)")
+    parser.add_argument("--database-url", help="대상 DB URL (예: sqlite:///bench.db). 지정 시 테이블도 생성")
+    args = parser.parse_args()
+
+    if args.database_url:
+        target = create_engine(args.database_url)
+        database.SessionLocal.configure(bind=target)
+        Base.metadata.create_all(bind=target)
+
     print("=" * 60)
     print("Collab Todo - 시드 데이터 삽입")
     print("=" * 60)
@@ -98,6 +292,13 @@ def main():
         print(f"✓ 부서: {dept_count}개 추가")
         print(f"✓ 카테고리: {cat_count}개 추가")
         print(f"✓ 시스템 설정: {setting_count}개 추가")
+
+        if args.synthetic:
+            counts = seed_synthetic(db, args.users, args.tasks, args.seed)
+            db.commit()
+            for name, n in counts.items():
+                print(f"✓ 합성 {name}: {n}개 추가")
+            print(f"  로그인: bench<id>@bench.local / {SYNTHETIC_PASSWORD}")
         print("\n시드 데이터 삽입 완료!")
     except Exception as e:
         db.rollback()
@@ -178,7 +178,7 @@ export default function DashboardPage() {
     // 비활성 섹션만 초기 로드 (탭 카운트 표시용, 활성 섹션은 아래 useEffect에서 로드)
     SECTIONS.forEach((s) => {
       if (s.key === 'assigned_to_me') return  // 초기 활성 섹션은 별도 useEffect에서 로드
-      api.get(`/api/tasks/?section=${s.key}&page=1&page_size=20`)
+      api.get(`/api/tasks/?section=${s.key}&page=1&page_size=20&fields=summary`)
         .then(({ data }) => setTasks((prev) => ({ ...prev, [s.key]: data })))
         .catch(() => {})
     })
@@ -218,6 +218,7 @@ export default function DashboardPage() {
       if (favoritesOnly) params.append('favorites_only', 'true')
       params.append('sort_by', currentSort.sort_by)
       params.append('sort_dir', currentSort.sort_dir)
+      params.append('fields', 'summary')
       const { data } = await api.get(`/api/tasks/?${params}`)
       setTasks((prev) => ({ ...prev, [section]: data }))
     } catch (e) {
@@ -28,6 +28,7 @@ export default function TaskDetailPage() {
   const { user } = useAuthStore()
   const [task, setTask] = useState(null)
   const [logs, setLogs] = useState([])
+  const [logsNextBeforeId, setLogsNextBeforeId] = useState(null)
   const [statusComment, setStatusComment] = useState('')
   const [newComment, setNewComment] = useState('')
   const [progress, setProgress] = useState(0)
@@ -54,23 +55,45 @@ export default function TaskDetailPage() {
 
   useEffect(() => {
     loadTask()
-    loadLogs()
   }, [taskId])
 
+  function setLogPage(page) {
+    setLogs(page.items)
+    setLogsNextBeforeId(page.next_before_id)
+  }
+
+  // 업무·첨부·하위 업무·최신 이력을 한 번의 요청으로 조회
   async function loadTask() {
     try {
-      const { data } = await api.get(`/api/tasks/${taskId}`)
-      setTask(data)
-      setProgress(data.progress)
+      const { data } = await api.get(`/api/tasks/${taskId}/detail`, {
+        params: { include: 'logs,attachments,subtasks' },
+      })
+      const { logs: logPage, ...rest } = data
+      setTask(rest)
+      setProgress(rest.progress)
+      setLogPage(logPage)
     } catch (err) {
       setLoadError(err.response?.data?.detail || '업무를 불러올 수 없습니다.')
     }
   }
 
+  // 이력만 바뀐 경우 (댓글 등록·수정·삭제) 최신 페이지만 다시 조회
   async function loadLogs() {
     try {
-      const { data } = await api.get(`/api/tasks/${taskId}/logs`)
-      setLogs(data)
+      const { data } = await api.get(`/api/tasks/${taskId}/activity`)
+      setLogPage(data)
+    } catch (err) {
+      console.error('이력 로드 실패', err)
+    }
+  }
+
+  async function loadOlderLogs() {
+    try {
+      const { data } = await api.get(`/api/tasks/${taskId}/activity`, {
+        params: { before_id: logsNextBeforeId },
+      })
+      setLogs((prev) => [...data.items, ...prev])
+      setLogsNextBeforeId(data.next_before_id)
     } catch (err) {
       console.error('이력 로드 실패', err)
     }
@@ -84,7 +107,6 @@ export default function TaskDetailPage() {
     await api.post(`/api/tasks/${taskId}/status`, { status: newStatus, comment: statusComment || null })
     setStatusComment('')
     loadTask()
-    loadLogs()
   }
 
   async function updateProgress() {
@@ -192,7 +214,6 @@ export default function TaskDetailPage() {
       await api.post(`/api/tasks/${taskId}/reassign`, { assignee_id: parseInt(newAssigneeId) })
       setShowReassign(false)
       loadTask()
-      loadLogs()
     } catch (err) {
       alert(err.response?.data?.detail || '담당자 변경에 실패했습니다.')
     }
@@ -605,7 +626,14 @@ export default function TaskDetailPage() {
 
           {/* 이력 */}
           <div className="bg-white dark:bg-gray-800 rounded-2xl shadow-sm border border-gray-100 dark:border-gray-700 p-4">
-            <h3 className="font-semibold text-gray-700 dark:text-gray-300 text-sm mb-3">이력</h3>
+            <div className="flex items-center justify-between mb-3">
+              <h3 className="font-semibold text-gray-700 dark:text-gray-300 text-sm">이력</h3>
+              {logsNextBeforeId && (
+                <button onClick={loadOlderLogs} className="text-xs text-blue-500 hover:text-blue-700">
+                  이전 이력 더 보기
+                </button>
+              )}
+            </div>
             {logs.filter((l) => l.action !== 'comment').length === 0 ? (
               <p className="text-xs text-gray-400">이력이 없습니다.</p>
             ) : (
@@ -628,7 +656,7 @@ export default function TaskDetailPage() {
         <TaskFormModal
           parentTaskId={parseInt(taskId)}
           onClose={() => setShowSubtaskModal(false)}
-          onCreated={() => { loadTask(); loadLogs() }}
+          onCreated={() => loadTask()}
         />
       )}
 
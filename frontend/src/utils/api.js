@@ -39,9 +39,22 @@ export function clearAuthToken() {
   _applyToken(null)
 }
 
+// ── 자기 쓰기 읽기: 쓰기 응답의 만료 시각을 다음 조회에 되돌려 보냄 ──
+// (서버 워커가 여럿이어도 방금 쓴 내용을 복제본이 아닌 primary에서 읽도록)
+const RYW_HEADER = 'X-Read-Your-Writes-Until'
+let _rwUntil = 0
+
+function _rememberWrite(res) {
+  const until = Number(res?.headers?.[RYW_HEADER.toLowerCase()])
+  if (until > _rwUntil) _rwUntil = until
+}
+
 // ── 요청: baseURL 설정 ──────────────────────────────────
 api.interceptors.request.use((config) => {
   config.baseURL = getApiBase()
+  if (_rwUntil > Date.now() / 1000) {
+    config.headers[RYW_HEADER] = String(_rwUntil)
+  }
   return config
 })
 
@@ -49,7 +62,10 @@ api.interceptors.request.use((config) => {
 let _redirecting = false
 
 api.interceptors.response.use(
-  (res) => res,
+  (res) => {
+    _rememberWrite(res)
+    return res
+  },
   (error) => {
     if (error.response?.status === 401 && !_redirecting) {
       const url = error.config?.url || ''
@@ -48,7 +48,9 @@ CREATE TABLE IF NOT EXISTS email_verification_tokens (
     expires_at DATETIME NOT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-    INDEX ix_email_verification_tokens_token (token)
+    INDEX ix_email_verification_tokens_token (token),
+    INDEX ix_email_verification_tokens_user_used (user_id, used),
+    INDEX ix_email_verification_tokens_expires_at (expires_at)
 );
 
 -- ============================================================
@@ -62,7 +64,9 @@ CREATE TABLE IF NOT EXISTS password_reset_tokens (
     expires_at DATETIME NOT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-    INDEX ix_password_reset_tokens_token (token)
+    INDEX ix_password_reset_tokens_token (token),
+    INDEX ix_password_reset_tokens_user_used (user_id, used),
+    INDEX ix_password_reset_tokens_expires_at (expires_at)
 );
 
 -- ============================================================
@@ -77,7 +81,9 @@ CREATE TABLE IF NOT EXISTS refresh_tokens (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     INDEX ix_refresh_tokens_token (token),
-    INDEX ix_refresh_tokens_user_id (user_id)
+    INDEX ix_refresh_tokens_user_id (user_id),
+    INDEX ix_refresh_tokens_user_revoked_created (user_id, revoked, created_at),
+    INDEX ix_refresh_tokens_expires_at (expires_at)
 );
 
 -- ============================================================
@@ -167,6 +173,7 @@ CREATE TABLE IF NOT EXISTS tasks (
     is_subtask      BOOLEAN DEFAULT FALSE,
     created_at      DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    progress_at     DOUBLE,                      -- 진행률을 정한 요청 시각 (epoch, 워커 간 합치기 순서)
     FOREIGN KEY (assigner_id)    REFERENCES users(id),
     FOREIGN KEY (assignee_id)    REFERENCES users(id),
     FOREIGN KEY (category_id)    REFERENCES categories(id) ON DELETE SET NULL,
@@ -269,9 +276,99 @@ CREATE TABLE IF NOT EXISTS notifications (
     FOREIGN KEY (user_id) REFERENCES users(id),
     FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE SET NULL,
     INDEX ix_notifications_user_id (user_id),
-    INDEX ix_notifications_is_read (is_read)
+    INDEX ix_notifications_is_read (is_read),
+    INDEX ix_notifications_user_read_created (user_id, is_read, created_at),
+    INDEX ix_notifications_created_at (created_at)
 );
 
+-- ============================================================
+-- [NEW v3] 보존 기간이 지난 알림 보관 (외래 키 없음, 압축 행 형식)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS notifications_archive (
+    id          INT NOT NULL PRIMARY KEY,
+    user_id     INT NOT NULL,
+    task_id     INT,
+    type        VARCHAR(50) NOT NULL,
+    message     TEXT NOT NULL,
+    is_read     BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at  DATETIME,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_notifications_archive_user_created (user_id, created_at)
+) ROW_FORMAT=COMPRESSED;
+
+-- ============================================================
+-- [NEW v3] 콜드 스토리지로 옮긴 업무 이력의 위치 (TASK_LOG_ARCHIVE_PATH/<month>.jsonl.gz)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS task_log_archives (
+    task_id     INT NOT NULL,
+    month       VARCHAR(7) NOT NULL,
+    log_count   INT NOT NULL DEFAULT 0,
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (task_id, month),
+    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+);
+
+-- ============================================================
+-- [NEW v3] 관리자 일괄 작업 (청크 단위 진행 상황, 재개 지점 기록)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS bulk_jobs (
+    id           INT AUTO_INCREMENT PRIMARY KEY,
+    job_type     VARCHAR(50) NOT NULL,
+    created_by   INT NOT NULL,
+    params       TEXT NOT NULL,
+    status       VARCHAR(20) NOT NULL DEFAULT 'pending',
+    total        INT DEFAULT 0,
+    processed    INT DEFAULT 0,
+    last_task_id INT DEFAULT 0,
+    error        TEXT,
+    created_at   DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at   DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    finished_at  DATETIME,
+    FOREIGN KEY (created_by) REFERENCES users(id),
+    INDEX ix_bulk_jobs_job_type (job_type),
+    INDEX ix_bulk_jobs_status   (status)
+);
+
+-- ============================================================
+-- [NEW v3] 일별 업무 통계 롤업 (관리자 대시보드·추세 조회용)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS task_stats_daily (
+    stat_date     DATE NOT NULL,
+    department_id INT NOT NULL DEFAULT 0,
+    status        ENUM('pending','in_progress','review','approved','rejected') NOT NULL,
+    priority      ENUM('urgent','high','normal','low') NOT NULL,
+    task_count    INT NOT NULL DEFAULT 0,
+    overdue_count INT NOT NULL DEFAULT 0,
+    refreshed_at  DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (stat_date, department_id, status, priority)
+);
+
+-- ============================================================
+-- [NEW v3] 요청 제한 토큰 버킷 (RATE_LIMIT_STORAGE=database 일 때 워커 간 공유)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    bucket_key VARCHAR(191) NOT NULL PRIMARY KEY,
+    tokens     DOUBLE NOT NULL,
+    updated_at DOUBLE NOT NULL,
+    INDEX ix_rate_limit_buckets_updated_at (updated_at)
+);
+
+-- 참조 데이터 응답 캐시 버전 (워커 간 무효화 공유)
+CREATE TABLE IF NOT EXISTS cache_versions (
+    namespace VARCHAR(50) NOT NULL PRIMARY KEY,
+    version   BIGINT NOT NULL DEFAULT 0
+);
+INSERT IGNORE INTO cache_versions (namespace, version) VALUES ('categories', 0), ('departments', 0), ('users', 0);
+
+-- ============================================================
+-- Alembic 리비전 기록 — 이 파일은 최신 마이그레이션과 같은 스키마이므로 head로 표시한다.
+-- 서버는 부팅 시 이 값을 코드의 head와 비교한다 (마이그레이션을 추가하면 함께 올릴 것)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS alembic_version (
+    version_num VARCHAR(32) NOT NULL PRIMARY KEY
+);
+INSERT IGNORE INTO alembic_version (version_num) VALUES ('0009');
+
 -- ============================================================
 -- 기본 시드 데이터
 -- ============================================================
@@ -306,4 +403,9 @@ INSERT IGNORE INTO system_settings (`key`, value, description) VALUES
     ('due_soon_days_warning',       '3',    '마감 임박 경고 일수'),
     ('max_filter_presets',          '10',   '사용자 당 최대 필터 프리셋 수'),
     ('app_name',                    'CollabTodo', '서비스 이름'),
-    ('app_version',                 '2.0.0', '현재 버전');
+    ('app_version',                 '2.0.0', '현재 버전'),
+    ('notification_read_retention_days',    '30',   '읽은 알림을 보관 테이블로 옮기기까지의 일수'),
+    ('notification_retention_days',         '180',  '읽지 않은 알림도 보관 테이블로 옮기기까지의 일수'),
+    ('notification_archive_retention_days', '730',  '보관 테이블의 알림을 삭제하기까지의 일수 (0이면 삭제 안 함)'),
+    ('retention_batch_size',                '1000', '보존 작업의 배치당 행 수 (잠금 시간 제한)'),
+    ('task_log_archive_months',             '12',   '승인 후 이 개월 수가 지난 업무의 이력을 월별 압축 파일로 옮김 (0이면 안 함)');